@@ -1,5 +1,9 @@
 __version__ = "0.2.3"
 
+from hexpex.edge import EdgeMap as EdgeMap
+from hexpex.edge import HexEdge as HexEdge
+from hexpex.edge import HexVertex as HexVertex
+from hexpex.edge import VertexMap as VertexMap
 from hexpex.hex import Axial as Axial
 from hexpex.hex import AxialFlatAdjacentDirection as AxialFlatAdjacentDirection
 from hexpex.hex import AxialFlatDiagonalDirection as AxialFlatDiagonalDirection
@@ -10,3 +14,8 @@ from hexpex.hex import CubeFlatAdjacentDirection as CubeFlatAdjacentDirection
 from hexpex.hex import CubeFlatDiagonalDirection as CubeFlatDiagonalDirection
 from hexpex.hex import CubePointyAdjacentDirection as CubePointyAdjacentDirection
 from hexpex.hex import CubePointyDiagonalDirection as CubePointyDiagonalDirection
+from hexpex.hexmap import HexMap as HexMap
+from hexpex.hexset import HexSet as HexSet
+from hexpex.layout import Layout as Layout
+from hexpex.layout import Orientation as Orientation
+from hexpex.persistent import PersistentHexMap as PersistentHexMap
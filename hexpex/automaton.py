@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Collection, MutableSequence, Sequence
+from operator import itemgetter
+from typing import Any, Callable, Generic, TypeVar
+
+from hexpex.hex import _Hex
+from hexpex.hexmap import HexMap
+
+T = TypeVar("T", bound=_Hex)
+V = TypeVar("V")
+
+Rule = Callable[[V, Sequence[V]], V]
+
+
+def life_rule(birth: Collection[int], survive: Collection[int]) -> Rule[int]:
+    """Returns a life-like rule for cells with the value '0' or '1'.
+
+    Args:
+        birth: Numbers of live neighbors that bring a dead cell to life.
+        survive: Numbers of live neighbors that keep a live cell alive.
+
+    Returns:
+        Rule for an automaton.
+    """
+    return _LifeRule(frozenset(birth), frozenset(survive))
+
+
+class _LifeRule:
+    """Life-like rule, as a class rather than a closure so it can be pickled and sent to worker processes."""
+
+    __slots__ = ("birth", "survive")
+
+    def __init__(self, birth: frozenset[int], survive: frozenset[int]):
+        self.birth = birth
+        self.survive = survive
+
+    def __call__(self, value: int, neighbors: Sequence[int]) -> int:
+        return int(sum(neighbors) in (self.survive if value else self.birth))
+
+
+def _gatherer(indexes: Sequence[int]) -> Callable[[Sequence[Any]], tuple[Any, ...]]:
+    """Returns a function collecting the values at 'indexes' from a sequence into a tuple."""
+    if len(indexes) == 0:
+        return lambda _: ()
+    if len(indexes) == 1:
+        index = indexes[0]
+        return lambda values: (values[index],)
+    return itemgetter(*indexes)
+
+
+def _copy(data: MutableSequence[V]) -> MutableSequence[V]:
+    if isinstance(data, array):
+        return array(data.typecode, data)  # type: ignore
+    return list(data)
+
+
+class Automaton(Generic[T, V]):
+    """A cellular automaton stepping every cell of a map by a rule on its own and its adjacent values.
+
+    Values are kept in two buffers, one read and one written by each step, and the values of adjacent cells are
+    collected through a precomputed table of neighbor indexes. Only cells that changed in the last step, and their
+    neighbors, are evaluated in the next step, so quiet areas of the map cost nothing.
+
+    Note:
+        The rule must only depend on its arguments, as cells whose value and neighbors did not change are skipped.
+        Neighbors outside the map are left out, so cells on the edge of the map pass fewer than six neighbor values
+        to the rule. Change cells through the automaton rather than through 'state', so they are evaluated.
+
+    Args:
+        state: Map of initial cell values. The map is copied and not changed by stepping.
+        rule: Function taking the value of a cell and a tuple of the values of its neighbors, returning the new value
+            of the cell.
+    """
+
+    def __init__(self, state: HexMap[T, V], rule: Rule[V]):
+        self.rule = rule
+        self.generation = 0
+        self._map = state
+        self._front = _copy(state.data)
+        self._back = _copy(state.data)
+
+        table = state.neighbors()
+        self._neighbors: list[tuple[int, ...]] = [
+            tuple(neighbor for neighbor in table[6 * index : 6 * index + 6] if neighbor != -1)
+            for index in range(len(state))
+        ]
+        self._gather = [_gatherer(neighbors) for neighbors in self._neighbors]
+        self._active: set[int] | None = None
+
+    @property
+    def state(self) -> HexMap[T, V]:
+        """Copy of the map of the current cell values, which does not follow later steps."""
+        hexmap = self._map
+        return HexMap(hexmap.corner, hexmap.width, hexmap.height, typecode=hexmap.typecode, data=_copy(self._front))
+
+    @property
+    def active(self) -> int:
+        """Number of cells that will be evaluated by the next step."""
+        return len(self._front) if self._active is None else len(self._active)
+
+    def __getitem__(self, hex: T) -> V:
+        return self._front[self._map.index(hex)]
+
+    def __setitem__(self, hex: T, value: V) -> None:
+        index = self._map.index(hex)
+        self._front[index] = value
+        self._back[index] = value
+        if self._active is not None:
+            self._active.add(index)
+            self._active.update(self._neighbors[index])
+
+    def step(self, steps: int = 1) -> int:
+        """Advances the automaton a number of steps.
+
+        Args:
+            steps: Number of steps to advance.
+
+        Returns:
+            Number of cells changed by the last step.
+        """
+        changed: list[int] = []
+        for _ in range(steps):
+            front, back = self._front, self._back
+            rule, gather = self.rule, self._gather
+            candidates = range(len(front)) if self._active is None else self._active
+
+            changed = []
+            for index in candidates:
+                value = front[index]
+                new_value = rule(value, gather[index](front))
+                if new_value != value:
+                    back[index] = new_value
+                    changed.append(index)
+
+            # The buffers only differ at the changed cells, so syncing those keeps both buffers up to date.
+            self._front, self._back = back, front
+            active = set(changed)
+            for index in changed:
+                front[index] = back[index]
+                active.update(self._neighbors[index])
+            self._active = active
+            self.generation += 1
+        return len(changed)
@@ -0,0 +1,237 @@
+"""Exchange of hex coordinates with columnar data.
+
+Columns are any objects supporting the buffer protocol with one integer per row, such as 'array.array' or NumPy
+arrays, or columns of a dataframe backed by them. They are read through 'memoryview' without copying, and results
+are returned as 'array.array' of 64 bit integers, which can in turn be wrapped by NumPy without copying.
+
+Records are buffers of rows with two or three integer fields, 'q', 'r' and optionally 's', such as a NumPy structured
+array. Their fields are exposed as strided views of the buffer, again without copying.
+"""
+
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from collections.abc import Iterable
+from typing import Any, Optional, Union
+
+from hexpex.hex import AdjacentDirection, Axial, Cube, _Hex
+from hexpex.hexset import HexSet, _pack, _unpack
+
+Column = Any
+IntOrColumn = Union[int, Column]
+
+_INTEGER_FORMATS = frozenset("bBhHiIlLqQnN")
+_NATIVE_ORDERS = "@=<" if sys.byteorder == "little" else "@=>!"
+
+
+def _native(format: str) -> Optional[str]:
+    """Returns the native format for a buffer format of integers in native byte order, or 'None' for other formats."""
+    order, code = (format[0], format[1:]) if format[0] in "@=<>!" else ("@", format)
+    # Sizes are only defined for the 'n' and 'N' formats in native byte order and size.
+    if code not in _INTEGER_FORMATS or order not in _NATIVE_ORDERS or (order != "@" and code in "nN"):
+        return None
+    if order == "@":
+        return code
+    # Integers with a byte order prefix have standard sizes, and 'memoryview' can only read them through the native
+    # format of the same size.
+    size = struct.calcsize(order + code)
+    return next(native for native in ("bhiq" if code.islower() else "BHIQ") if struct.calcsize(native) == size)
+
+
+def column(values: Column) -> memoryview:
+    """Returns a one dimensional view of integer values without copying.
+
+    Note:
+        Integers in the byte order of another machine are not supported.
+
+    Args:
+        values: Object supporting the buffer protocol with one integer per row.
+
+    Raises:
+        ValueError: If 'values' is not a one dimensional buffer of integers in native byte order.
+
+    Returns:
+        View of the values.
+    """
+    view = memoryview(values)
+    native = _native(view.format)
+    if view.ndim != 1 or native is None:
+        raise ValueError(
+            f"column must be a one dimensional buffer of integers in native byte order, not format '{view.format}'"
+        )
+    if native == view.format:
+        return view
+    if not view.c_contiguous:
+        raise ValueError("column with a byte order prefix must be a contiguous buffer")
+    return view.cast("B").cast(native)
+
+
+def from_records(records: Any, fields: int = 2, typecode: str = "q") -> tuple[memoryview, ...]:
+    """Returns views of the fields of a buffer of records.
+
+    Args:
+        records: Buffer of contiguous records of 'fields' integers each.
+        fields: Number of integer fields per record, '2' for 'q' and 'r' or '3' for 'q', 'r' and 's'.
+        typecode: Array typecode of the integer fields.
+
+    Raises:
+        ValueError: If 'records' is not contiguous, its size is not a whole number of records, or its values are not
+            integers of 'typecode'.
+
+    Returns:
+        Tuple of strided views, one per field.
+    """
+    view = memoryview(records)
+    if not view.c_contiguous:
+        raise ValueError("records must be a contiguous buffer")
+    raw = view.cast("B")
+    record_size = fields * array(typecode).itemsize
+    if raw.nbytes % record_size != 0:
+        raise ValueError(f"records must have a size divisible by {record_size} bytes, not {raw.nbytes}")
+    # Buffers of integers must hold integers of the typecode, and buffers of structures must have records of the
+    # size of 'fields' such integers, so values are never silently reinterpreted.
+    native = _native(view.format)
+    if native is not None:
+        if (struct.calcsize(native), native.islower()) != (struct.calcsize(typecode), typecode.islower()):
+            raise ValueError(f"records must hold values of typecode '{typecode}', not format '{view.format}'")
+    elif view.itemsize != record_size:
+        raise ValueError(f"records must have a size of {record_size} bytes each, not {view.itemsize}")
+    values = raw.cast(typecode)
+    return tuple(values[field::fields] for field in range(fields))
+
+
+def to_records(hexes: Iterable[_Hex], fields: int = 2) -> array[int]:
+    """Returns hex positions as an array of interleaved 'q', 'r' and optionally 's' values.
+
+    Args:
+        hexes: Iterable of hex positions.
+        fields: Number of fields per record, '2' for 'q' and 'r' or '3' for 'q', 'r' and 's'.
+
+    Returns:
+        Array of 64 bit integers.
+    """
+    records = array("q")
+    for q, r in _coordinates(hexes):
+        records.extend((q, r, -q - r)[:fields])
+    return records
+
+
+def _coordinates(hexes: Iterable[_Hex]) -> Iterable[tuple[int, int]]:
+    if isinstance(hexes, HexSet):
+        return (_unpack(key) for key in hexes._keys)
+    return ((hex.q, hex.r) for hex in hexes)  # type: ignore
+
+
+def from_columns(q: Column, r: Column, kind: type[_Hex] = Axial) -> HexSet[Any]:
+    """Returns a hex set of the hex positions in a pair of columns.
+
+    Args:
+        q: Column of 'q' coordinates.
+        r: Column of 'r' coordinates.
+        kind: Hex position class held by the set.
+
+    Returns:
+        Hex set of the hex positions.
+    """
+    q, r = column(q), column(r)
+    _check_lengths(q, r)
+    return HexSet._from_keys(kind, {_pack(q_value, r_value) for q_value, r_value in zip(q, r)})
+
+
+def to_columns(hexes: Iterable[_Hex]) -> tuple[array[int], ...]:
+    """Returns the coordinates of hex positions as columns.
+
+    Note:
+        The 's' column is only included if the hex positions are cube positions.
+
+    Args:
+        hexes: Iterable of hex positions.
+
+    Returns:
+        Tuple of arrays of 64 bit integers with the 'q', 'r' and optionally 's' coordinates.
+    """
+    if isinstance(hexes, HexSet):
+        kind: type[_Hex] = hexes.kind
+    else:
+        hexes = list(hexes)
+        kind = type(hexes[0]) if hexes else Axial
+
+    q_column, r_column = array("q"), array("q")
+    for q, r in _coordinates(hexes):
+        q_column.append(q)
+        r_column.append(r)
+    if kind is Cube:
+        return q_column, r_column, to_cube(q_column, r_column)
+    return q_column, r_column
+
+
+def _check_lengths(*columns: memoryview) -> None:
+    lengths = {len(values) for values in columns}
+    if len(lengths) > 1:
+        raise ValueError(f"columns must have the same length, not {', '.join(str(len(values)) for values in columns)}")
+
+
+def _broadcast(values: IntOrColumn, length: int) -> Any:
+    if isinstance(values, int):
+        return (values,) * length
+    return column(values)
+
+
+def to_cube(q: Column, r: Column) -> array[int]:
+    """Returns the 's' column of cube coordinates for columns of axial coordinates.
+
+    Args:
+        q: Column of 'q' coordinates.
+        r: Column of 'r' coordinates.
+
+    Returns:
+        Array of 's' coordinates.
+    """
+    q, r = column(q), column(r)
+    _check_lengths(q, r)
+    return array("q", [-q_value - r_value for q_value, r_value in zip(q, r)])
+
+
+def distance(q1: Column, r1: Column, q2: IntOrColumn, r2: IntOrColumn) -> array[int]:
+    """Returns the distances between hex positions given as columns.
+
+    Note:
+        The second hex positions can also be given as single coordinates, to measure all distances from one position.
+
+    Args:
+        q1: Column of 'q' coordinates of the first hex positions.
+        r1: Column of 'r' coordinates of the first hex positions.
+        q2: Column or value of 'q' coordinates of the second hex positions.
+        r2: Column or value of 'r' coordinates of the second hex positions.
+
+    Returns:
+        Array of distances.
+    """
+    q1, r1 = column(q1), column(r1)
+    q2, r2 = _broadcast(q2, len(q1)), _broadcast(r2, len(q1))
+    _check_lengths(q1, r1, q2, r2)
+    distances = array("q")
+    for q1_value, r1_value, q2_value, r2_value in zip(q1, r1, q2, r2):
+        dq, dr = q1_value - q2_value, r1_value - r2_value
+        distances.append((abs(dq) + abs(dr) + abs(dq + dr)) // 2)
+    return distances
+
+
+def adjacent(q: Column, r: Column, direction: AdjacentDirection | _Hex) -> tuple[array[int], array[int]]:
+    """Returns the hex positions in an adjacent direction from hex positions given as columns.
+
+    Args:
+        q: Column of 'q' coordinates.
+        r: Column of 'r' coordinates.
+        direction: Adjacent direction enum or vector.
+
+    Returns:
+        Tuple of arrays with the 'q' and 'r' coordinates of the adjacent hex positions.
+    """
+    q, r = column(q), column(r)
+    _check_lengths(q, r)
+    vector = direction.value if not isinstance(direction, _Hex) else direction
+    dq, dr = vector.q, vector.r
+    return array("q", [value + dq for value in q]), array("q", [value + dr for value in r])
@@ -0,0 +1,359 @@
+"""Coordinates of the edges and vertices between hex positions, and dense maps of values on them.
+
+Every edge is shared by two hex positions and every vertex by three, so each is given a canonical owner: the edges of
+a hex position towards adjacent directions '0' to '2' and its corners '0' and '1' are its own, while the rest belong to
+its neighbors. An edge or vertex is then a hex position and a slot, and its packed key is the packed key of the owner
+shifted left by two bits plus the slot.
+
+Directions and corners are numbered in the order of the adjacent direction enums, where corner 'i' is shared with the
+hex positions in adjacent directions 'i' and 'i + 1', and the edge towards adjacent direction 'i' runs from corner
+'i - 1' to corner 'i'.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator, Mapping, MutableSequence
+from enum import Enum
+from typing import Any, Generic, TypeVar
+
+from hexpex.hex import AdjacentDirection, _Hex
+from hexpex.hexmap import _ADJACENT_OFFSETS
+from hexpex.hexset import _pack, _unpack
+
+T = TypeVar("T", bound=_Hex)
+F = TypeVar("F", bound="_Feature[Any]")
+V = TypeVar("V")
+
+# Offset from a hex position to the owner of its corner 'i', and the slot of the corner in its owner.
+_CORNER_OWNERS = ((0, 0, 0), (0, 0, 1), (-1, 0, 0), (0, -1, 1), (0, -1, 0), (1, -1, 1))
+
+
+def _shift(hex: T, q: int, r: int) -> T:
+    return type(hex)._from_axial(hex.q + q, hex.r + r)  # type: ignore
+
+
+class _Feature(Generic[T]):
+    """An edge or vertex, identified by the hex position owning it and its slot in the owner."""
+
+    __slots__ = ("hex", "slot")
+
+    hex: T
+    slot: int
+
+    @classmethod
+    def _from_owner(cls: type[F], hex: T, slot: int) -> F:
+        feature = object.__new__(cls)
+        feature.hex = hex
+        feature.slot = slot
+        return feature
+
+    @classmethod
+    def _from_packed(cls: type[F], kind: type[_Hex], packed: int) -> F:
+        return cls._from_owner(kind._from_axial(*_unpack(packed >> 2)), packed & 3)
+
+    @property
+    def packed(self) -> int:
+        """Packed integer key of the edge or vertex."""
+        return _pack(self.hex.q, self.hex.r) << 2 | self.slot  # type: ignore
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is type(self):
+            return self.hex == other.hex and self.slot == other.slot
+        return False
+
+    def __ne__(self, other: Any) -> bool:
+        return not self == other
+
+    def __hash__(self) -> int:
+        return hash((type(self), self.hex, self.slot))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.hex!r}, {self.slot})"
+
+
+class HexEdge(_Feature[T]):
+    """An edge between two adjacent hex positions.
+
+    Args:
+        hex: Hex position on one side of the edge.
+        direction: Adjacent direction enum, vector or index from 'hex' to the hex position on the other side.
+
+    Raises:
+        ValueError: If 'direction' is not an adjacent direction.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, hex: T, direction: AdjacentDirection | _Hex | int):
+        index = _direction_index(direction)
+        if index >= 3:
+            dq, dr = _ADJACENT_OFFSETS[index]
+            hex, index = _shift(hex, dq, dr), index - 3
+        self.hex = hex
+        self.slot = index
+
+    @property
+    def hexes(self) -> tuple[T, T]:
+        """Hex positions on both sides of the edge."""
+        dq, dr = _ADJACENT_OFFSETS[self.slot]
+        return self.hex, _shift(self.hex, dq, dr)
+
+    @property
+    def vertices(self) -> tuple[HexVertex[T], HexVertex[T]]:
+        """Vertices at both ends of the edge."""
+        return HexVertex(self.hex, self.slot - 1), HexVertex(self.hex, self.slot)
+
+    def adjacent(self) -> tuple[HexEdge[T], ...]:
+        """Returns the four edges sharing a vertex with the edge.
+
+        Returns:
+            Tuple of edges.
+        """
+        return tuple(edge for vertex in self.vertices for edge in vertex.edges if edge != self)
+
+
+class HexVertex(_Feature[T]):
+    """A vertex where three hex positions meet.
+
+    Args:
+        hex: Hex position at the vertex.
+        corner: Index of the corner of 'hex' at the vertex, from '0' to '5'.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, hex: T, corner: int):
+        dq, dr, slot = _CORNER_OWNERS[corner % 6]
+        self.hex = _shift(hex, dq, dr)
+        self.slot = slot
+
+    @property
+    def hexes(self) -> tuple[T, T, T]:
+        """Hex positions meeting at the vertex."""
+        (q1, r1), (q2, r2) = _ADJACENT_OFFSETS[self.slot], _ADJACENT_OFFSETS[self.slot + 1]
+        return self.hex, _shift(self.hex, q1, r1), _shift(self.hex, q2, r2)
+
+    @property
+    def edges(self) -> tuple[HexEdge[T], HexEdge[T], HexEdge[T]]:
+        """Edges meeting at the vertex."""
+        dq, dr = _ADJACENT_OFFSETS[self.slot]
+        return (
+            HexEdge._from_owner(self.hex, self.slot),
+            HexEdge._from_owner(self.hex, self.slot + 1),
+            HexEdge(_shift(self.hex, dq, dr), self.slot + 2),
+        )
+
+    def adjacent(self) -> tuple[HexVertex[T], HexVertex[T], HexVertex[T]]:
+        """Returns the three vertices at the other ends of the edges meeting at the vertex.
+
+        Returns:
+            Tuple of vertices.
+        """
+        dq, dr = _ADJACENT_OFFSETS[self.slot]
+        return (
+            HexVertex(self.hex, self.slot - 1),
+            HexVertex(self.hex, self.slot + 1),
+            HexVertex(_shift(self.hex, dq, dr), self.slot + 1),
+        )
+
+
+def _direction_index(direction: AdjacentDirection | _Hex | int) -> int:
+    if isinstance(direction, int):
+        if 0 <= direction < 6:
+            return direction
+    else:
+        vector = direction.value if isinstance(direction, Enum) else direction
+        offset = (vector.q, vector.r)
+        if offset in _ADJACENT_OFFSETS:
+            return _ADJACENT_OFFSETS.index(offset)
+    raise ValueError(f"argument 'direction' must be an adjacent direction, not {direction!r}")
+
+
+def edges(hex: T) -> tuple[HexEdge[T], ...]:
+    """Returns the six edges of a hex position.
+
+    Args:
+        hex: Hex position.
+
+    Returns:
+        Tuple of edges, in the order of the adjacent directions.
+    """
+    return tuple(HexEdge(hex, index) for index in range(6))
+
+
+def vertices(hex: T) -> tuple[HexVertex[T], ...]:
+    """Returns the six vertices of a hex position.
+
+    Args:
+        hex: Hex position.
+
+    Returns:
+        Tuple of vertices, in the order of the corners.
+    """
+    return tuple(HexVertex(hex, corner) for corner in range(6))
+
+
+class _FeatureMap(Mapping[F, V]):
+    """A dense map of values on the edges or vertices owned by a parallelogram of hex positions."""
+
+    _feature: type[F]
+    _slots: int
+
+    def __init__(
+        self,
+        corner: _Hex,
+        width: int,
+        height: int,
+        fill: Any = 0,
+        typecode: str | None = None,
+        data: MutableSequence[V] | None = None,
+    ):
+        if width < 0 or height < 0:
+            raise ValueError(f"arguments 'width' and 'height' must not be negative, not {width} and {height}")
+
+        self.kind: type[_Hex] = type(corner)
+        self.corner = corner
+        self.width = width
+        self.height = height
+        self.typecode = typecode
+        self._q = corner.q  # type: ignore
+        self._r = corner.r  # type: ignore
+
+        size = self._slots * width * height
+        if data is None:
+            data = array(typecode, [fill]) * size if typecode is not None else [fill] * size  # type: ignore
+        elif len(data) != size:
+            raise ValueError(f"argument 'data' must have {size} values, not {len(data)}")
+        self.data: MutableSequence[V] = data  # type: ignore
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.corner!r}, {self.width}, {self.height})"
+
+    def index(self, feature: F, /) -> int:
+        """Returns the index of an edge or vertex in 'data'.
+
+        Args:
+            feature: Edge or vertex to get index for.
+
+        Raises:
+            KeyError: If the edge or vertex is not in the map.
+
+        Returns:
+            Index of the edge or vertex.
+        """
+        if isinstance(feature, self._feature) and isinstance(feature.hex, self.kind):
+            column, row = feature.hex.q - self._q, feature.hex.r - self._r  # type: ignore
+            if 0 <= column < self.width and 0 <= row < self.height:
+                return self._slots * (row * self.width + column) + feature.slot
+        raise KeyError(feature)
+
+    def _at(self, index: int) -> F:
+        cell, slot = divmod(index, self._slots)
+        row, column = divmod(cell, self.width)
+        return self._feature._from_owner(self.kind._from_axial(self._q + column, self._r + row), slot)
+
+    def __getitem__(self, feature: F) -> V:
+        return self.data[self.index(feature)]
+
+    def __setitem__(self, feature: F, value: V) -> None:
+        self.data[self.index(feature)] = value
+
+    def __contains__(self, feature: Any) -> bool:
+        try:
+            self.index(feature)
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[F]:
+        return (self._at(index) for index in range(len(self.data)))
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+
+class EdgeMap(_FeatureMap[HexEdge[Any], V]):
+    """A dense map of values on the edges owned by a parallelogram of hex positions.
+
+    The map covers the edges towards adjacent directions '0' to '2' of every hex position in the parallelogram, which
+    includes every edge between two hex positions in it. Values are stored in a flat sequence, available as 'data',
+    with the edges of the cell at index 'i' of a 'HexMap' over the same parallelogram at '3 * i' up to '3 * i + 3'.
+
+    Note:
+        Edges on the border of the parallelogram towards directions '3' to '5' are owned by hex positions outside it,
+        and are not in the map.
+
+    Args:
+        corner: Hex position with the smallest 'q' and 'r' in the parallelogram.
+        width: Number of hex positions along the 'q' axis.
+        height: Number of hex positions along the 'r' axis.
+        fill: Initial value of every edge.
+        typecode: Array typecode used to store values.
+        data: Existing sequence of values to use as storage instead of creating one.
+
+    Raises:
+        ValueError: If 'width' or 'height' is negative or 'data' does not match the size of the map.
+    """
+
+    _feature = HexEdge
+    _slots = 3
+
+    def edge(self, index: int, /) -> HexEdge[Any]:
+        """Returns the edge at an index in 'data'.
+
+        Args:
+            index: Index to get edge for.
+
+        Raises:
+            IndexError: If the index is out of range.
+
+        Returns:
+            Edge at the index.
+        """
+        if not 0 <= index < len(self.data):
+            raise IndexError(f"index {index} is out of range")
+        return self._at(index)
+
+
+class VertexMap(_FeatureMap[HexVertex[Any], V]):
+    """A dense map of values on the vertices owned by a parallelogram of hex positions.
+
+    The map covers the corners '0' and '1' of every hex position in the parallelogram. Values are stored in a flat
+    sequence, available as 'data', with the vertices of the cell at index 'i' of a 'HexMap' over the same
+    parallelogram at '2 * i' and '2 * i + 1'.
+
+    Note:
+        Vertices on the border of the parallelogram at corners '2' to '5' may be owned by hex positions outside it,
+        and then are not in the map.
+
+    Args:
+        corner: Hex position with the smallest 'q' and 'r' in the parallelogram.
+        width: Number of hex positions along the 'q' axis.
+        height: Number of hex positions along the 'r' axis.
+        fill: Initial value of every vertex.
+        typecode: Array typecode used to store values.
+        data: Existing sequence of values to use as storage instead of creating one.
+
+    Raises:
+        ValueError: If 'width' or 'height' is negative or 'data' does not match the size of the map.
+    """
+
+    _feature = HexVertex
+    _slots = 2
+
+    def vertex(self, index: int, /) -> HexVertex[Any]:
+        """Returns the vertex at an index in 'data'.
+
+        Args:
+            index: Index to get vertex for.
+
+        Raises:
+            IndexError: If the index is out of range.
+
+        Returns:
+            Vertex at the index.
+        """
+        if not 0 <= index < len(self.data):
+            raise IndexError(f"index {index} is out of range")
+        return self._at(index)
@@ -4,7 +4,9 @@ from abc import ABC, abstractmethod, abstractproperty
 from collections import deque
 from collections.abc import Iterable, Iterator
 from enum import Enum
-from typing import Any, TypeVar, Union, cast
+from typing import Any, Literal, TypeVar, Union, cast, overload
+
+from hexpex.hexset import HexSet, _pack, _unpack
 
 T = TypeVar("T", bound="_Hex")
 
@@ -22,6 +24,19 @@ DiagonalDirection = Union[
 ]
 
 
+_ADJACENT_KEYS = (_pack(1, 0), _pack(0, 1), _pack(-1, 1), _pack(-1, 0), _pack(0, -1), _pack(1, -1))
+
+
+def _ring_keys(center: int, distance: int) -> Iterator[int]:
+    """Yields the packed keys of a ring of hex positions around a packed center key."""
+    # Starting at the corner in the fifth adjacent direction, each side of the ring is walked in turn.
+    key = center + _ADJACENT_KEYS[4] * distance
+    for vector in _ADJACENT_KEYS:
+        for _ in range(distance):
+            yield key
+            key += vector
+
+
 class Move(Enum):
     CLOCKWISE = 1
     COUNTERCLOCKWISE = -1
@@ -32,6 +47,11 @@ class _Hex(ABC):
     def _adjacent_vectors(self: T) -> tuple[T, ...]:  # pragma: no cover​
         ...
 
+    @classmethod
+    @abstractmethod
+    def _from_axial(cls: type[T], q: int, r: int) -> T:  # pragma: no cover​
+        ...
+
     @abstractmethod
     def __eq__(self, other: Any) -> bool:  # pragma: no cover​
         ...
@@ -88,7 +108,15 @@ class _Hex(ABC):
         """Returns the distance from self position to another hex position."""
         return abs(self - position) // 2
 
-    def ring(self: T, distance: int, /) -> set[T]:
+    @overload
+    def ring(self: T, distance: int, /, *, packed: Literal[False] = ...) -> set[T]:  # pragma: no cover​
+        ...
+
+    @overload
+    def ring(self: T, distance: int, /, *, packed: Literal[True]) -> HexSet[T]:  # pragma: no cover​
+        ...
+
+    def ring(self: T, distance: int, /, *, packed: bool = False) -> set[T] | HexSet[T]:
         """Returns a ring of hex positions a certain distance from self position.
 
         Note:
@@ -96,28 +124,23 @@ class _Hex(ABC):
 
         Args:
             distance: Distance of ring from self position.
+            packed: Return a 'HexSet' instead of a set.
 
         Returns:
             Set of hex positions in ring.
         """
-        direction_vector = self._adjacent_vectors[0]
-        scaled_vector = direction_vector * distance
-        position = self + scaled_vector
+        keys = set(_ring_keys(_pack(self.q, self.r), distance))  # type: ignore
+        return self._collect(keys, packed)
 
-        adjacent_vectors = deque(self._adjacent_vectors)
-
-        # Rearranges 'adjacent_vectors' to the correct order for moving around the ring.
-        steps = adjacent_vectors.index(direction_vector) + 2
-        adjacent_vectors.rotate(-steps)
+    @overload
+    def range(self: T, distance: int, *, packed: Literal[False] = ...) -> set[T]:  # pragma: no cover​
+        ...
 
-        hexes_in_ring = set()
-        for direction_vector in adjacent_vectors:
-            for _ in range(distance):
-                hexes_in_ring.add(position)
-                position = position.adjacent(direction_vector)
-        return hexes_in_ring
+    @overload
+    def range(self: T, distance: int, *, packed: Literal[True]) -> HexSet[T]:  # pragma: no cover​
+        ...
 
-    def range(self: T, distance: int) -> set[T]:
+    def range(self: T, distance: int, *, packed: bool = False) -> set[T] | HexSet[T]:
         """Returns a range of hex positions up to a certain distance from self position.
 
         Note:
@@ -125,15 +148,23 @@ class _Hex(ABC):
 
         Args:
             distance: Max distance of range from self position.
+            packed: Return a 'HexSet' instead of a set.
 
         Returns:
             Set of hex position in range.
         """
-        hexes_in_range = set()
-        hexes_in_range.add(self)
+        center = _pack(self.q, self.r)  # type: ignore
+        keys = {center}
         for radius in range(1, distance + 1):
-            hexes_in_range.update(self.ring(radius))
-        return hexes_in_range
+            keys.update(_ring_keys(center, radius))
+        return self._collect(keys, packed)
+
+    def _collect(self: T, keys: set[int], packed: bool) -> set[T] | HexSet[T]:
+        """Returns packed keys as a 'HexSet' or as a set of hex positions of the same kind as self."""
+        if packed:
+            return HexSet._from_keys(type(self), keys)
+        make = type(self)._from_axial
+        return {make(*_unpack(key)) for key in keys}
 
     def spiral(self: T, distance: int, direction: AdjacentDirection, move: Move = Move.CLOCKWISE) -> Iterator[T]:
         """Yields a spiral of hex positions out to a passed distance from self position.
@@ -166,15 +197,15 @@ class _Hex(ABC):
                     yield position
                     position = position.adjacent(vector)
 
-    @abstractmethod
-    def _rotate_clockwise(self: T) -> T:  # pragma: no cover​
+    @overload
+    def rotate(self: T, hexes: Iterable[T], angle: int, *, packed: Literal[False] = ...) -> set[T]:  # pragma: no cover​
         ...
 
-    @abstractmethod
-    def _rotate_counterclockwise(self: T) -> T:  # pragma: no cover​
+    @overload
+    def rotate(self: T, hexes: Iterable[T], angle: int, *, packed: Literal[True]) -> HexSet[T]:  # pragma: no cover​
         ...
 
-    def rotate(self: T, hexes: Iterable[T], angle: int) -> set[T]:
+    def rotate(self: T, hexes: Iterable[T], angle: int, *, packed: bool = False) -> set[T] | HexSet[T]:
         """Returns a set of hex positions rotated around the self position.
 
         Note:
@@ -183,6 +214,7 @@ class _Hex(ABC):
         Args:
             hexes: Iterable of hex positions to rotate.
             angle: Degrees to rotate hexes around self position.
+            packed: Return a 'HexSet' instead of a set.
 
         Raises:
             ValueError: If 'angle' is not divisible by 60.
@@ -195,17 +227,17 @@ class _Hex(ABC):
         if angle % 60 != 0:
             raise ValueError("argument of 'angle' must be in 60 degree increments.")
 
-        rotated = set()
-        steps = abs((angle % 360) // 60)
+        # Any rotation can be expressed as a number of clockwise steps of 60 degrees.
+        steps = (angle // 60) % 6
+        center_q, center_r = self.q, self.r  # type: ignore
 
+        rotated = set()
         for hex in hexes:
-            vector = hex - self
-            if angle > 0:
-                *_, vector = (hex._rotate_clockwise() for _ in range(steps))
-            elif angle < 0:
-                *_, vector = (hex._rotate_counterclockwise() for _ in range(steps))
-            rotated.add(self + vector)
-        return rotated
+            q, r = hex.q - center_q, hex.r - center_r  # type: ignore
+            for _ in range(steps):
+                q, r = -r, q + r
+            rotated.add(_pack(center_q + q, center_r + r))
+        return self._collect(rotated, packed)
 
     def to_tuple(self) -> tuple[int, ...]:
         """Convert self to tuple representation."""
@@ -223,6 +255,10 @@ class Axial(_Hex):
         self.q = q
         self.r = r
 
+    @classmethod
+    def _from_axial(cls, q: int, r: int) -> Axial:
+        return cls(q, r)
+
     @property
     def _adjacent_vectors(self):
         return (
@@ -278,12 +314,6 @@ class Axial(_Hex):
     def __repr__(self):
         return f"{type(self).__name__}({self.q}, {self.r})"
 
-    def _rotate_clockwise(self) -> Axial:
-        return Axial(q=-self.r, r=-(-self.q - self.r))
-
-    def _rotate_counterclockwise(self) -> Axial:
-        return Axial(q=-(-self.q - self.r), r=-self.q)
-
     def to_cube(self):
         """Convert self to cube representation."""
         return Cube(self.q, self.r, -self.q - self.r)
@@ -299,6 +329,10 @@ class Cube(_Hex):
 
         self._validate(self.q, self.r, self.s)
 
+    @classmethod
+    def _from_axial(cls, q: int, r: int) -> Cube:
+        return cls(q, r, -q - r)
+
     @property
     def _adjacent_vectors(self):
         return (
@@ -354,12 +388,6 @@ class Cube(_Hex):
     def __repr__(self):
         return f"{type(self).__name__}({self.q}, {self.r}, {self.s})"
 
-    def _rotate_clockwise(self) -> Cube:
-        return Cube(q=-self.r, r=-self.s, s=-self.q)
-
-    def _rotate_counterclockwise(self) -> Cube:
-        return Cube(q=-self.s, r=-self.q, s=-self.r)
-
     def to_axial(self) -> Axial:
         """Convert self to axial representation."""
         return Axial(self.q, self.r)
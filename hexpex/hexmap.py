@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator, Mapping, MutableSequence
+from typing import Any, TypeVar
+
+from hexpex.hex import Axial, _Hex
+from hexpex.hexset import HexSet, _pack, _unpack
+
+T = TypeVar("T", bound=_Hex)
+V = TypeVar("V")
+
+_ADJACENT_OFFSETS = ((1, 0), (0, 1), (-1, 1), (-1, 0), (0, -1), (1, -1))
+
+
+class HexMap(Mapping[T, V]):
+    """A dense map of values over a parallelogram of hex positions.
+
+    The map covers every hex position with 'q' from 'corner.q' up to 'corner.q + width' and 'r' from 'corner.r' up
+    to 'corner.r + height'. Values are stored row by row in a flat sequence, available as 'data', where the value of
+    a hex position is found at its 'index()'.
+
+    Note:
+        If 'typecode' is given values are stored in an 'array.array' of that type, otherwise in a list.
+        Cells can be read and assigned, but not deleted.
+
+    Args:
+        corner: Hex position with the smallest 'q' and 'r' in the map.
+        width: Number of hex positions along the 'q' axis.
+        height: Number of hex positions along the 'r' axis.
+        fill: Initial value of every cell.
+        typecode: Array typecode used to store values.
+        data: Existing sequence of values to use as storage instead of creating one.
+
+    Raises:
+        ValueError: If 'width' or 'height' is negative or 'data' does not match the size of the map.
+    """
+
+    def __init__(
+        self,
+        corner: T,
+        width: int,
+        height: int,
+        fill: Any = 0,
+        typecode: str | None = None,
+        data: MutableSequence[V] | None = None,
+    ):
+        if width < 0 or height < 0:
+            raise ValueError(f"arguments 'width' and 'height' must not be negative, not {width} and {height}")
+
+        self.kind: type[T] = type(corner)
+        self.corner = corner
+        self.width = width
+        self.height = height
+        self.typecode = typecode
+        self._q = corner.q  # type: ignore
+        self._r = corner.r  # type: ignore
+        self._neighbors: array[int] | None = None
+
+        size = width * height
+        if data is None:
+            data = array(typecode, [fill]) * size if typecode is not None else [fill] * size  # type: ignore
+        elif len(data) != size:
+            raise ValueError(f"argument 'data' must have {size} values, not {len(data)}")
+        self.data: MutableSequence[V] = data  # type: ignore
+
+    @classmethod
+    def bounding(cls, hexes: Iterable[T], fill: Any = 0, typecode: str | None = None) -> HexMap[T, Any]:
+        """Returns the smallest map covering all given hex positions.
+
+        Args:
+            hexes: Iterable of hex positions to cover.
+            fill: Initial value of every cell.
+            typecode: Array typecode used to store values.
+
+        Raises:
+            ValueError: If 'hexes' is empty.
+
+        Returns:
+            Map covering the hex positions.
+        """
+        hexes = HexSet(hexes)
+        if not hexes:
+            raise ValueError("argument 'hexes' must not be empty")
+        coordinates = [_unpack(key) for key in hexes._keys]
+        q_min = min(q for q, _ in coordinates)
+        r_min = min(r for _, r in coordinates)
+        width = max(q for q, _ in coordinates) - q_min + 1
+        height = max(r for _, r in coordinates) - r_min + 1
+        return cls(hexes.kind._from_axial(q_min, r_min), width, height, fill, typecode)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.corner!r}, {self.width}, {self.height})"
+
+    def _key_index(self, key: int) -> int:
+        """Returns the index of a packed key, or '-1' if it is outside the map."""
+        q, r = _unpack(key)
+        column, row = q - self._q, r - self._r
+        if 0 <= column < self.width and 0 <= row < self.height:
+            return row * self.width + column
+        return -1
+
+    def _index_key(self, index: int) -> int:
+        """Returns the packed key of an index."""
+        row, column = divmod(index, self.width)
+        return _pack(self._q + column, self._r + row)
+
+    def index(self, hex: T, /) -> int:
+        """Returns the index of a hex position in 'data'.
+
+        Args:
+            hex: Hex position to get index for.
+
+        Raises:
+            KeyError: If hex position is not in the map.
+
+        Returns:
+            Index of hex position.
+        """
+        if isinstance(hex, self.kind):
+            column, row = hex.q - self._q, hex.r - self._r  # type: ignore
+            if 0 <= column < self.width and 0 <= row < self.height:
+                return row * self.width + column
+        raise KeyError(hex)
+
+    def hex(self, index: int, /) -> T:
+        """Returns the hex position at an index in 'data'.
+
+        Args:
+            index: Index to get hex position for.
+
+        Raises:
+            IndexError: If index is outside the map.
+
+        Returns:
+            Hex position at index.
+        """
+        if not 0 <= index < len(self.data):
+            raise IndexError(f"index {index} is outside the map")
+        row, column = divmod(index, self.width)
+        return self.kind._from_axial(self._q + column, self._r + row)
+
+    def neighbors(self) -> array[int]:
+        """Returns a table of the indexes of adjacent cells for every cell in the map.
+
+        Note:
+            The six neighbors of the cell at index 'i' are found at '6 * i' up to '6 * i + 6', in the order of the
+            adjacent direction enums. Neighbors outside the map have the index '-1'. The table is computed once and
+            cached.
+
+        Returns:
+            Array of neighbor indexes.
+        """
+        if self._neighbors is None:
+            width, height = self.width, self.height
+            table = array("q", [-1]) * (6 * width * height)
+            position = 0
+            for row in range(height):
+                for column in range(width):
+                    for dq, dr in _ADJACENT_OFFSETS:
+                        if 0 <= column + dq < width and 0 <= row + dr < height:
+                            table[position] = (row + dr) * width + column + dq
+                        position += 1
+            self._neighbors = table
+        return self._neighbors
+
+    def __getitem__(self, hex: T) -> V:
+        return self.data[self.index(hex)]
+
+    def __setitem__(self, hex: T, value: V) -> None:
+        self.data[self.index(hex)] = value
+
+    def __contains__(self, hex: Any) -> bool:
+        try:
+            self.index(hex)
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[T]:
+        make = self.kind._from_axial
+        for row in range(self._r, self._r + self.height):
+            for column in range(self._q, self._q + self.width):
+                yield make(column, row)
+
+    def __len__(self) -> int:
+        return self.width * self.height
+
+
+def _region_keys(region: Iterable[Any]) -> tuple[type[_Hex], set[int]]:
+    """Returns the hex position class and the packed keys of a region, the cells with a truthy value of a map."""
+    if isinstance(region, HexSet):
+        return region.kind, region._keys
+    if isinstance(region, HexMap):
+        return region.kind, {region._index_key(index) for index, value in enumerate(region.data) if value}
+    hexes = list(region)
+    return type(hexes[0]) if hexes else Axial, {_pack(hex.q, hex.r) for hex in hexes}
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, MutableSet
+from itertools import chain
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:  # pragma: no cover​
+    from hexpex.hex import _Hex
+
+T = TypeVar("T", bound="_Hex")
+
+_SHIFT = 32
+_HALF = 1 << (_SHIFT - 1)
+_MASK = (1 << _SHIFT) - 1
+
+
+def _pack(q: int, r: int) -> int:
+    """Packs axial coordinates into a single integer.
+
+    Note:
+        The packing is linear, so adding two packed keys gives the packed key of the summed coordinates.
+        Coordinate 'r' must lie in the range [-2**31, 2**31).
+
+    Args:
+        q: Axial 'q' coordinate.
+        r: Axial 'r' coordinate.
+
+    Returns:
+        Packed integer key.
+    """
+    return (q << _SHIFT) + r
+
+
+def _unpack(key: int) -> tuple[int, int]:
+    """Unpacks an integer key created by '_pack' into axial coordinates.
+
+    Args:
+        key: Packed integer key.
+
+    Returns:
+        Tuple of axial 'q' and 'r' coordinates.
+    """
+    r = ((key + _HALF) & _MASK) - _HALF
+    return (key - r) >> _SHIFT, r
+
+
+def _make(kind: type[T], key: int) -> T:
+    """Creates a hex position of a given kind from a packed integer key."""
+    return kind._from_axial(*_unpack(key))
+
+
+class HexSet(MutableSet[T]):
+    """A set of hex positions stored as packed integer keys.
+
+    Set algebra between two hex sets of the same kind runs directly on the packed keys, without creating or hashing
+    hex position objects. Hex positions are only created when iterating over the set.
+
+    Note:
+        A hex set only holds positions of a single kind, either 'Axial' or 'Cube'. If 'kind' is not given it is
+        taken from the first hex position in 'hexes', or defaults to 'Axial' if 'hexes' is empty.
+
+    Args:
+        hexes: Iterable of hex positions to add to the set.
+        kind: Hex position class held by the set.
+    """
+
+    __slots__ = ("_kind", "_keys")
+
+    def __init__(self, hexes: Iterable[T] = (), kind: type[T] | None = None):
+        if kind is None:
+            iterator = iter(hexes)
+            first = next(iterator, None)
+            if first is None:
+                from hexpex.hex import Axial
+
+                kind = Axial  # type: ignore
+            else:
+                kind = type(first)
+                hexes = chain((first,), iterator)
+
+        self._kind: type[T] = kind  # type: ignore
+        self._keys: set[int] = set()
+        for hex in hexes:
+            self._keys.add(self._key(hex))
+
+    @classmethod
+    def _from_keys(cls, kind: type[T], keys: set[int]) -> HexSet[T]:
+        hexset = cls.__new__(cls)
+        hexset._kind = kind
+        hexset._keys = keys
+        return hexset
+
+    @property
+    def kind(self) -> type[T]:
+        """Hex position class held by the set."""
+        return self._kind
+
+    def _key(self, hex: T) -> int:
+        if not isinstance(hex, self._kind):
+            raise TypeError(f"hex set of kind '{self._kind.__name__}' can not hold '{type(hex).__name__}'")
+        return _pack(hex.q, hex.r)  # type: ignore
+
+    def _same_kind(self, other: Any) -> bool:
+        return isinstance(other, HexSet) and other._kind is self._kind
+
+    def __contains__(self, hex: Any) -> bool:
+        if not isinstance(hex, self._kind):
+            return False
+        return _pack(hex.q, hex.r) in self._keys  # type: ignore
+
+    def __iter__(self) -> Iterator[T]:
+        kind = self._kind
+        for key in self._keys:
+            yield _make(kind, key)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        if not self._keys:
+            return f"{type(self).__name__}(kind={self._kind.__name__})"
+        return f"{type(self).__name__}({{{', '.join(repr(hex) for hex in self)}}})"
+
+    def __eq__(self, other: Any) -> bool:
+        if self._same_kind(other):
+            return self._keys == other._keys
+        return super().__eq__(other)
+
+    def __le__(self, other: Any) -> bool:
+        if self._same_kind(other):
+            return self._keys <= other._keys
+        return super().__le__(other)
+
+    def __ge__(self, other: Any) -> bool:
+        if self._same_kind(other):
+            return self._keys >= other._keys
+        return super().__ge__(other)
+
+    def __or__(self, other: Any) -> Any:
+        if self._same_kind(other):
+            return self._from_keys(self._kind, self._keys | other._keys)
+        return super().__or__(other)
+
+    def __and__(self, other: Any) -> Any:
+        if self._same_kind(other):
+            return self._from_keys(self._kind, self._keys & other._keys)
+        return super().__and__(other)
+
+    def __sub__(self, other: Any) -> Any:
+        if self._same_kind(other):
+            return self._from_keys(self._kind, self._keys - other._keys)
+        return super().__sub__(other)
+
+    def __xor__(self, other: Any) -> Any:
+        if self._same_kind(other):
+            return self._from_keys(self._kind, self._keys ^ other._keys)
+        return super().__xor__(other)
+
+    def __ior__(self, other: Any) -> Any:
+        if self._same_kind(other):
+            self._keys |= other._keys
+            return self
+        return super().__ior__(other)
+
+    def __iand__(self, other: Any) -> Any:
+        if self._same_kind(other):
+            self._keys &= other._keys
+            return self
+        return super().__iand__(other)
+
+    def __isub__(self, other: Any) -> Any:
+        if self._same_kind(other):
+            self._keys -= other._keys
+            return self
+        return super().__isub__(other)
+
+    def __ixor__(self, other: Any) -> Any:
+        if self._same_kind(other):
+            self._keys ^= other._keys
+            return self
+        return super().__ixor__(other)
+
+    def isdisjoint(self, other: Iterable[Any]) -> bool:
+        """Returns 'True' if self has no hex positions in common with another iterable."""
+        if self._same_kind(other):
+            return self._keys.isdisjoint(other._keys)  # type: ignore
+        return super().isdisjoint(other)
+
+    def add(self, hex: T) -> None:
+        """Adds a hex position to self."""
+        self._keys.add(self._key(hex))
+
+    def discard(self, hex: T) -> None:
+        """Removes a hex position from self if it is present."""
+        if isinstance(hex, self._kind):
+            self._keys.discard(_pack(hex.q, hex.r))  # type: ignore
+
+    def clear(self) -> None:
+        """Removes all hex positions from self."""
+        self._keys.clear()
+
+    def copy(self) -> HexSet[T]:
+        """Returns a shallow copy of self."""
+        return self._from_keys(self._kind, set(self._keys))
@@ -0,0 +1,194 @@
+"""Hierarchy of super-hexes grouping hex positions for level of detail.
+
+A super-hex of a given radius is the range of hex positions within that radius of its center, and super-hexes of the
+same radius tile the grid. Their centers form a lattice, and numbering the lattice points gives every super-hex an id
+that is itself a hex position, with adjacent super-hexes having adjacent ids. Super-hexes can therefore be grouped
+into super-hexes again, for as many levels as needed.
+"""
+
+from __future__ import annotations
+
+from itertools import chain
+from typing import Any, TypeVar
+
+from hexpex.hex import _Hex, _ring_keys
+from hexpex.hexmap import HexMap
+from hexpex.hexset import HexSet, _pack, _unpack
+
+T = TypeVar("T", bound=_Hex)
+
+AGGREGATES = ("sum", "min", "max", "mean")
+
+
+def _parent(q: int, r: int, radius: int) -> tuple[int, int]:
+    # The lattice of centers is spanned by '(2 * radius + 1, -radius)' and '(radius, radius + 1)', and the inverse
+    # of that basis gives the lattice cell holding the position. The center of its super-hex is one of the corners.
+    area = 3 * radius * radius + 3 * radius + 1
+    i = ((radius + 1) * q - radius * r) // area
+    j = (radius * q + (2 * radius + 1) * r) // area
+    for candidate_i in (i, i + 1):
+        for candidate_j in (j, j + 1):
+            center_q, center_r = _center(candidate_i, candidate_j, radius)
+            dq, dr = q - center_q, r - center_r
+            if abs(dq) + abs(dr) + abs(dq + dr) <= 2 * radius:
+                return candidate_i, candidate_j
+    raise AssertionError("unreachable")  # pragma: no cover​
+
+
+def _center(i: int, j: int, radius: int) -> tuple[int, int]:
+    return i * (2 * radius + 1) + j * radius, -i * radius + j * (radius + 1)
+
+
+def _validate(radius: int, levels: int) -> None:
+    if radius < 1:
+        raise ValueError(f"argument 'radius' must be at least 1, not {radius}")
+    if levels < 0:
+        raise ValueError(f"argument 'levels' must not be negative, not {levels}")
+
+
+def parent(hex: T, radius: int = 1, levels: int = 1) -> T:
+    """Returns the id of the super-hex holding a hex position a number of levels up.
+
+    Args:
+        hex: Hex position, or id of a super-hex.
+        radius: Radius of the super-hexes at every level.
+        levels: Number of levels to go up.
+
+    Returns:
+        Id of the super-hex.
+    """
+    _validate(radius, levels)
+    q, r = hex.q, hex.r  # type: ignore
+    for _ in range(levels):
+        q, r = _parent(q, r, radius)
+    return type(hex)._from_axial(q, r)
+
+
+def center(hex: T, radius: int = 1, levels: int = 1) -> T:
+    """Returns the hex position at the center of a super-hex a number of levels up.
+
+    Args:
+        hex: Id of a super-hex.
+        radius: Radius of the super-hexes at every level.
+        levels: Number of levels the super-hex is above the hex positions.
+
+    Returns:
+        Hex position at the center.
+    """
+    _validate(radius, levels)
+    q, r = hex.q, hex.r  # type: ignore
+    for _ in range(levels):
+        q, r = _center(q, r, radius)
+    return type(hex)._from_axial(q, r)
+
+
+def children(hex: T, radius: int = 1) -> HexSet[T]:
+    """Returns the ids of the super-hexes, or hex positions, one level down from a super-hex.
+
+    Args:
+        hex: Id of a super-hex.
+        radius: Radius of the super-hexes at every level.
+
+    Returns:
+        Hex set of the children of the super-hex.
+    """
+    return center(hex, radius).range(radius, packed=True)
+
+
+class Pyramid:
+    """Aggregated values of a map over several levels of super-hexes.
+
+    Level '0' is the map itself, and every level above holds one value per super-hex, aggregated from the values of
+    its children. Changing a cell through the pyramid updates the aggregates above it, touching a single super-hex per
+    level.
+
+    Note:
+        The 'sum' and 'mean' aggregates are updated by the change in value, while 'min' and 'max' are recomputed from
+        the children of each super-hex above the cell. Cells outside the map do not count towards any aggregate.
+
+    Args:
+        hexmap: Map of values to aggregate.
+        radius: Radius of the super-hexes at every level.
+        levels: Number of levels above the map.
+        aggregate: Aggregate to compute, one of 'sum', 'min', 'max' or 'mean'.
+
+    Raises:
+        ValueError: If 'aggregate' is not supported, 'radius' is smaller than '1' or 'levels' is negative.
+    """
+
+    def __init__(self, hexmap: HexMap[T, Any], radius: int = 1, levels: int = 1, aggregate: str = "sum"):
+        _validate(radius, levels)
+        if aggregate not in AGGREGATES:
+            raise ValueError(f"argument 'aggregate' must be one of {', '.join(AGGREGATES)}, not '{aggregate}'")
+
+        self.hexmap = hexmap
+        self.radius = radius
+        self.levels = levels
+        self.aggregate = aggregate
+
+        # Sums are kept for the mean, together with the number of cells below each super-hex.
+        self._totals: list[dict[int, Any]] = []
+        self._counts: list[dict[int, int]] = []
+        combine = {"min": min, "max": max}.get(aggregate)
+
+        below = {hexmap._index_key(index): value for index, value in enumerate(hexmap.data)}
+        below_counts = dict.fromkeys(below, 1)
+        for _ in range(levels):
+            totals: dict[int, Any] = {}
+            counts: dict[int, int] = {}
+            for key, value in below.items():
+                parent_key = _pack(*_parent(*_unpack(key), radius))
+                if parent_key in totals:
+                    totals[parent_key] = combine(totals[parent_key], value) if combine else totals[parent_key] + value
+                    counts[parent_key] += below_counts[key]
+                else:
+                    totals[parent_key] = value
+                    counts[parent_key] = below_counts[key]
+            self._totals.append(totals)
+            self._counts.append(counts)
+            below, below_counts = totals, counts
+
+    def value(self, hex: T, level: int) -> Any:
+        """Returns the aggregated value of a super-hex.
+
+        Args:
+            hex: Id of a super-hex, or a hex position at level '0'.
+            level: Level of the super-hex.
+
+        Raises:
+            KeyError: If there is no super-hex with the id at the level.
+
+        Returns:
+            Aggregated value.
+        """
+        if level == 0:
+            return self.hexmap[hex]
+        key = _pack(hex.q, hex.r)  # type: ignore
+        totals = self._totals[level - 1]
+        if key not in totals:
+            raise KeyError(hex)
+        if self.aggregate == "mean":
+            return totals[key] / self._counts[level - 1][key]
+        return totals[key]
+
+    def __setitem__(self, hex: T, value: Any) -> None:
+        previous = self.hexmap[hex]
+        self.hexmap[hex] = value
+
+        key = _pack(hex.q, hex.r)  # type: ignore
+        below = self._cell
+        combine = min if self.aggregate == "min" else max
+        for totals in self._totals:
+            key = _pack(*_parent(*_unpack(key), self.radius))
+            if self.aggregate in ("sum", "mean"):
+                totals[key] += value - previous
+                continue
+
+            center_key = _pack(*_center(*_unpack(key), self.radius))
+            child_keys = chain((center_key,), *(_ring_keys(center_key, ring) for ring in range(1, self.radius + 1)))
+            totals[key] = combine(child for child in map(below, child_keys) if child is not None)
+            below = totals.get
+
+    def _cell(self, key: int) -> Any:
+        index = self.hexmap._key_index(key)
+        return None if index == -1 else self.hexmap.data[index]
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from enum import Enum
+from math import sqrt
+
+from hexpex.hex import _Hex
+
+Point = tuple[float, float]
+
+
+class Orientation(Enum):
+    """Enumerate hex orientations as the matrix converting axial coordinates to pixel coordinates."""
+
+    POINTY = (sqrt(3), sqrt(3) / 2, 0.0, 3 / 2)
+    FLAT = (3 / 2, 0.0, sqrt(3) / 2, sqrt(3))
+
+
+class Layout:
+    """A conversion between hex positions and pixel coordinates.
+
+    Note:
+        Pixel coordinates have the y-axis pointing down, matching the direction enums, where for example 'S' is
+        towards positive y.
+
+    Args:
+        orientation: Orientation of the hexes, either pointy or flat topped.
+        size: Distance from the center to a corner of a hex, either one value or separate x and y values.
+        origin: Pixel coordinates of the center of the hex at the origin.
+    """
+
+    def __init__(self, orientation: Orientation, size: float | Point = 1.0, origin: Point = (0.0, 0.0)):
+        self.orientation = orientation
+        self.size = (size, size) if isinstance(size, (int, float)) else size
+        self.origin = origin
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.orientation}, {self.size}, {self.origin})"
+
+    def _point(self, q: float, r: float) -> Point:
+        f0, f1, f2, f3 = self.orientation.value
+        return (
+            (f0 * q + f1 * r) * self.size[0] + self.origin[0],
+            (f2 * q + f3 * r) * self.size[1] + self.origin[1],
+        )
+
+    def to_pixel(self, hex: _Hex, /) -> Point:
+        """Returns the pixel coordinates of the center of a hex position."""
+        return self._point(hex.q, hex.r)  # type: ignore
+
+    def corners(self, hex: _Hex, /) -> list[Point]:
+        """Returns the pixel coordinates of the six corners of a hex position.
+
+        Note:
+            Corners are ordered clockwise on screen, starting with the corner between the first and second adjacent
+            directions.
+
+        Args:
+            hex: Hex position to get corners for.
+
+        Returns:
+            List of corner pixel coordinates.
+        """
+        q, r = hex.q, hex.r  # type: ignore
+        return [self._point(q + dq / 3, r + dr / 3) for dq, dr in _CORNER_OFFSETS]
+
+
+# Offsets from the center of a hex to its corners in thirds of a hex, where corner 'i' is shared with the hexes in
+# adjacent directions 'i' and 'i + 1'.
+_CORNER_OFFSETS = ((1, 1), (-1, 2), (-2, 1), (-1, -1), (1, -2), (2, -1))
@@ -0,0 +1,188 @@
+"""Binary file format for dense hex maps that can be memory-mapped without copying.
+
+A map file consists of a fixed 64 byte header followed by the raw cell values of the map, in the same row by row
+order as 'HexMap.data'. All header fields are little-endian:
+
+    offset  size  field
+         0     8  magic bytes b"HEXPEXMP"
+         8     2  format version, currently 1
+        10     1  coordinate system, b"A" for axial or b"C" for cube
+        11     1  array typecode of the values, for example b"d" for 64 bit floats
+        12     2  size in bytes of a single value
+        14     1  byte order of the values, b"<" for little-endian or b">" for big-endian
+        15     1  reserved, zero
+        16     8  signed 'q' coordinate of the corner of the map
+        24     8  signed 'r' coordinate of the corner of the map
+        32     8  width of the map
+        40     8  height of the map
+        48     8  offset in bytes of the first value from the start of the file
+        56     8  reserved, zero
+
+Loading a map maps the file into memory and exposes the values as a 'memoryview', so no values are read until they
+are accessed and pages are loaded by the operating system on demand. The view supports the buffer protocol, so for
+example 'numpy.asarray(hexmap.data)' gives an array of the values without copying. The loaded map keeps the file
+mapped until it is closed, either by calling 'close()' or by using it as a context manager.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Any, TypeVar, Union
+
+from hexpex.hex import Axial, Cube, _Hex
+from hexpex.hexmap import HexMap
+
+T = TypeVar("T", bound=_Hex)
+V = TypeVar("V")
+
+MAGIC = b"HEXPEXMP"
+VERSION = 1
+HEADER = struct.Struct("<8sHccHcxqqqqQ8x")
+
+_KINDS = {b"A": Axial, b"C": Cube}
+_BYTEORDER = b"<" if sys.byteorder == "little" else b">"
+_MODES = {"r": mmap.ACCESS_READ, "r+": mmap.ACCESS_WRITE, "c": mmap.ACCESS_COPY}
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+class MappedHexMap(HexMap[T, V]):
+    """A map of the values in a map file, as returned by 'load()'.
+
+    Note:
+        Closing the map releases its values and unmaps the file, after which the values can not be accessed. Views of
+        the values made elsewhere, for example NumPy arrays, must be released before.
+
+    Args:
+        corner: Hex position with the smallest 'q' and 'r' in the map.
+        width: Number of hex positions along the 'q' axis.
+        height: Number of hex positions along the 'r' axis.
+        typecode: Array typecode of the values.
+        data: Values of the map.
+        buffer: Memory-mapped file holding the values, or 'None' if they were copied out of it.
+    """
+
+    def __init__(self, corner: T, width: int, height: int, typecode: str, data: Any, buffer: mmap.mmap | None = None):
+        super().__init__(corner, width, height, typecode=typecode, data=data)
+        self._buffer = buffer
+
+    def flush(self) -> None:
+        """Writes changes to the values through to the file, for a map opened with mode 'r+'."""
+        if self._buffer is not None:
+            self._buffer.flush()
+
+    def close(self) -> None:
+        """Releases the values and unmaps the file."""
+        if isinstance(self.data, memoryview):
+            self.data.release()
+        if self._buffer is not None:
+            self._buffer.close()
+
+    def __enter__(self) -> MappedHexMap[T, V]:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+def save(hexmap: HexMap[Any, Any], path: PathLike) -> None:
+    """Writes a map to a map file.
+
+    Args:
+        hexmap: Map to write, storing its values in an array or other buffer with a typecode.
+        path: Path of the file to write.
+
+    Raises:
+        ValueError: If the map does not have a typecode.
+    """
+    if hexmap.typecode is None:
+        raise ValueError("map must have a typecode to be saved")
+
+    values = memoryview(hexmap.data).cast("B")  # type: ignore
+    kind = b"A" if hexmap.kind is Axial else b"C"
+    itemsize = array(hexmap.typecode).itemsize
+    header = HEADER.pack(
+        MAGIC,
+        VERSION,
+        kind,
+        hexmap.typecode.encode("ascii"),
+        itemsize,
+        _BYTEORDER,
+        hexmap.corner.q,
+        hexmap.corner.r,
+        hexmap.width,
+        hexmap.height,
+        HEADER.size,
+    )
+    with open(path, "wb") as file:
+        file.write(header)
+        file.write(values)
+
+
+def load(path: PathLike, mode: str = "r") -> MappedHexMap[Any, Any]:
+    """Opens a map file as a map backed by the memory-mapped file.
+
+    Note:
+        With mode 'r' the map is read-only, with 'r+' changes to the map are written to the file and with 'c' changes
+        are only kept in memory. If the file was written on a machine with a different byte order the values are
+        copied and swapped instead of mapped, so such a file can not be opened with mode 'r+'.
+
+    Args:
+        path: Path of the file to open.
+        mode: Access mode, one of 'r', 'r+' or 'c'.
+
+    Raises:
+        ValueError: If 'mode' is invalid, the file is not a valid map file, or 'mode' is 'r+' and the values of the
+            file are in the other byte order.
+
+    Returns:
+        Map of the values in the file, to be closed when no longer used.
+    """
+    if mode not in _MODES:
+        raise ValueError(f"argument 'mode' must be one of 'r', 'r+' or 'c', not '{mode}'")
+
+    with open(path, "r+b" if mode == "r+" else "rb") as file:
+        buffer = mmap.mmap(file.fileno(), 0, access=_MODES[mode])
+    try:
+        return _map(buffer, mode)
+    except ValueError:
+        buffer.close()
+        raise
+
+
+def _map(buffer: mmap.mmap, mode: str) -> MappedHexMap[Any, Any]:
+    """Returns a map of the values in a memory-mapped map file, checking its header."""
+    if len(buffer) < HEADER.size:
+        raise ValueError("file is too small to be a map file")
+    magic, version, kind, typecode, itemsize, byteorder, q, r, width, height, offset = HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError("file is not a map file")
+    if version != VERSION:
+        raise ValueError(f"map file version {version} is not supported")
+    if kind not in _KINDS:
+        raise ValueError(f"map file coordinate system {kind!r} is not supported")
+
+    typecode = typecode.decode("ascii")
+    if array(typecode).itemsize != itemsize:
+        raise ValueError(f"map file values of typecode '{typecode}' have a size of {itemsize}, not supported here")
+    end = offset + width * height * itemsize
+    if len(buffer) < end:
+        raise ValueError("map file is truncated")
+
+    corner = _KINDS[kind]._from_axial(q, r)
+    if byteorder == _BYTEORDER:
+        data = memoryview(buffer)[offset:end].cast(typecode)
+        return MappedHexMap(corner, width, height, typecode, data, buffer)
+
+    # Changes to swapped copies of the values would not reach the file.
+    if mode == "r+":
+        raise ValueError("map file values in the other byte order can not be opened with mode 'r+'")
+    swapped = array(typecode)
+    swapped.frombytes(buffer[offset:end])
+    swapped.byteswap()
+    buffer.close()
+    return MappedHexMap(corner, width, height, typecode, swapped)
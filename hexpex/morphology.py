@@ -0,0 +1,124 @@
+"""Morphological operations on regions of hex positions.
+
+Every operation takes a structure, either a radius or a structuring element. A radius stands for the range of hex
+positions within that distance of the origin, and is handled as a distance transform: the region is grown or shrunk one
+ring of adjacent positions at a time, touching only the positions added or removed, so the cost does not grow with the
+area of the range. A structuring element is any iterable of hex vectors, and is handled as a sum of packed keys over
+every position in the region and vector in the element.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any, Union
+
+from hexpex.hex import _ADJACENT_KEYS
+from hexpex.hexmap import HexMap, _region_keys
+from hexpex.hexset import HexSet, _pack
+
+Region = Union[HexMap[Any, Any], Iterable[Any]]
+Structure = Union[int, Iterable[Any]]
+
+
+def _offsets(structure: Structure) -> int | list[int]:
+    """Returns a radius as is, or the packed keys of a structuring element."""
+    if isinstance(structure, int):
+        if structure < 0:
+            raise ValueError(f"argument 'structure' must not be negative, not {structure}")
+        return structure
+    offsets = [_pack(hex.q, hex.r) for hex in structure]  # type: ignore
+    if not offsets:
+        raise ValueError("argument 'structure' must not be empty")
+    return offsets
+
+
+def _dilate(keys: set[int], structure: int | list[int]) -> set[int]:
+    if not isinstance(structure, int):
+        return {key + offset for key in keys for offset in structure}
+    grown = set(keys)
+    frontier = keys
+    for _ in range(structure):
+        frontier = {key + adjacent for key in frontier for adjacent in _ADJACENT_KEYS} - grown
+        grown |= frontier
+    return grown
+
+
+def _erode(keys: set[int], structure: int | list[int]) -> set[int]:
+    if not isinstance(structure, int):
+        first, *rest = structure
+        return {key - first for key in keys if all(key - first + offset in keys for offset in rest)}
+    shrunk = set(keys)
+    # The first ring removed is the border of the region, the positions with an adjacent position outside it.
+    frontier = {key for key in keys if any(key + adjacent not in keys for adjacent in _ADJACENT_KEYS)}
+    for _ in range(structure):
+        if not frontier:
+            break
+        shrunk -= frontier
+        frontier = {key + adjacent for key in frontier for adjacent in _ADJACENT_KEYS} & shrunk
+    return shrunk
+
+
+def dilate(region: Region, structure: Structure = 1) -> HexSet[Any]:
+    """Returns a region grown by a radius or structuring element.
+
+    Note:
+        If 'region' is a map, the cells with a truthy value make up the region. The result is not limited to the map.
+
+    Args:
+        region: Hex set, map or iterable of hex positions.
+        structure: Radius to grow by, or iterable of hex vectors to add to every hex position in the region.
+
+    Returns:
+        Hex set of the grown region.
+    """
+    kind, keys = _region_keys(region)
+    return HexSet._from_keys(kind, _dilate(keys, _offsets(structure)))
+
+
+def erode(region: Region, structure: Structure = 1) -> HexSet[Any]:
+    """Returns a region shrunk by a radius or structuring element.
+
+    Note:
+        If 'region' is a map, the cells with a truthy value make up the region, and cells outside the map are outside
+        the region.
+
+    Args:
+        region: Hex set, map or iterable of hex positions.
+        structure: Radius to shrink by, or iterable of hex vectors that must all lead from a hex position to the
+            region for the position to be kept.
+
+    Returns:
+        Hex set of the shrunk region.
+    """
+    kind, keys = _region_keys(region)
+    return HexSet._from_keys(kind, _erode(keys, _offsets(structure)))
+
+
+def opening(region: Region, structure: Structure = 1) -> HexSet[Any]:
+    """Returns a region eroded and then dilated, removing parts too narrow to hold the structure.
+
+    Args:
+        region: Hex set, map or iterable of hex positions.
+        structure: Radius or iterable of hex vectors of the structuring element.
+
+    Returns:
+        Hex set of the opened region.
+    """
+    kind, keys = _region_keys(region)
+    offsets = _offsets(structure)
+    return HexSet._from_keys(kind, _dilate(_erode(keys, offsets), offsets))
+
+
+def closing(region: Region, structure: Structure = 1) -> HexSet[Any]:
+    """Returns a region dilated and then eroded, filling gaps too narrow to hold the structure.
+
+    Args:
+        region: Hex set, map or iterable of hex positions.
+        structure: Radius or iterable of hex vectors of the structuring element.
+
+    Returns:
+        Hex set of the closed region.
+    """
+    kind, keys = _region_keys(region)
+    offsets = _offsets(structure)
+    return HexSet._from_keys(kind, _erode(_dilate(keys, offsets), offsets))
@@ -0,0 +1,110 @@
+"""Extraction of region outlines as closed polygons.
+
+Outlines are traced on the corners of hexes, identified by integer keys in a grid three times finer than the hex grid,
+so no floating point comparisons are needed to join edges. Every boundary corner has exactly one outgoing boundary
+edge, which makes joining the edges into closed polygons a single linear pass.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable, Mapping
+from typing import NamedTuple, TypeVar
+
+from hexpex.hex import _ADJACENT_KEYS, _Hex
+from hexpex.hexmap import _region_keys
+from hexpex.hexset import _pack, _unpack
+from hexpex.layout import _CORNER_OFFSETS, Layout, Point
+
+T = TypeVar("T", bound=_Hex)
+L = TypeVar("L", bound=Hashable)
+
+_CORNER_KEYS = tuple(_pack(dq, dr) for dq, dr in _CORNER_OFFSETS)
+
+# The boundary edge towards adjacent direction 'i' runs from corner 'i - 1' to corner 'i'.
+_EDGES = tuple((_ADJACENT_KEYS[i], _CORNER_KEYS[i - 1], _CORNER_KEYS[i]) for i in range(6))
+
+_MISSING = object()
+
+
+class Boundary(NamedTuple):
+    """A closed boundary polygon of a region.
+
+    Note:
+        Outer boundaries run clockwise on screen and holes run counterclockwise, so the region is always to the right
+        of the boundary. The first point is not repeated at the end.
+    """
+
+    points: list[Point]
+    hole: bool
+
+
+def _trace(edges: dict[int, int], layout: Layout) -> list[Boundary]:
+    """Joins directed boundary edges between corner keys into closed boundaries."""
+    boundaries = []
+    while edges:
+        start, key = edges.popitem()
+        corners = [start]
+        while key != start:
+            corners.append(key)
+            key = edges.pop(key)
+
+        coordinates = [_unpack(corner) for corner in corners]
+
+        # Twice the signed area of the polygon, positive for outer boundaries as edges run around each hex in the
+        # order of the adjacent directions.
+        area = 0
+        for (q1, r1), (q2, r2) in zip(coordinates, coordinates[1:] + coordinates[:1]):
+            area += q1 * r2 - q2 * r1
+
+        points = [layout._point(q / 3, r / 3) for q, r in coordinates]
+        boundaries.append(Boundary(points, area < 0))
+    return boundaries
+
+
+def outline(region: Iterable[T], layout: Layout) -> list[Boundary]:
+    """Returns the closed boundary polygons of a region of hex positions.
+
+    Note:
+        If 'region' is a map, the cells with a truthy value make up the region.
+
+    Args:
+        region: Map or iterable of hex positions in the region.
+        layout: Layout used to convert corners to pixel coordinates.
+
+    Returns:
+        List of outer boundaries and holes of the region.
+    """
+    _, keys = _region_keys(region)
+    edges = {}
+    for key in keys:
+        corner_key = key * 3
+        for vector, start, end in _EDGES:
+            if key + vector not in keys:
+                edges[corner_key + start] = corner_key + end
+    return _trace(edges, layout)
+
+
+def outlines(labels: Mapping[T, L], layout: Layout) -> dict[L, list[Boundary]]:
+    """Returns the closed boundary polygons of many regions at once.
+
+    Note:
+        Each hex position belongs to the region of its label. Edges between two regions are traced for both of them.
+
+    Args:
+        labels: Mapping of hex positions to the label of the region they belong to.
+        layout: Layout used to convert corners to pixel coordinates.
+
+    Returns:
+        Dict of labels to the outer boundaries and holes of their region.
+    """
+    keyed = {_pack(hex.q, hex.r): label for hex, label in labels.items()}  # type: ignore
+    edges: dict[L, dict[int, int]] = {}
+    for key, label in keyed.items():
+        corner_key = key * 3
+        label_edges = edges.get(label)
+        if label_edges is None:
+            label_edges = edges[label] = {}
+        for vector, start, end in _EDGES:
+            if keyed.get(key + vector, _MISSING) != label:
+                label_edges[corner_key + start] = corner_key + end
+    return {label: _trace(label_edges, layout) for label, label_edges in edges.items()}
@@ -0,0 +1,298 @@
+"""Shortest paths over dense hex maps of movement costs.
+
+A cost map holds the cost of entering each cell, with 'math.inf' for cells that can not be entered. The cost of a path
+is the sum of the costs of the cells entered after the start. Paths are searched with A*, using the distance to the
+goal times the smallest cost in the map as the estimate of the remaining cost.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable, Mapping, Sequence
+from typing import Any, Generic, TypeVar
+
+from hexpex.edge import EdgeMap
+from hexpex.hex import _Hex
+from hexpex.hexmap import HexMap
+
+T = TypeVar("T", bound=_Hex)
+
+
+def _walls(cost: HexMap[Any, Any], walls: EdgeMap[Any] | None) -> Sequence[Any] | None:
+    """Returns the values of a map of walls laid out like a cost map, so the walls of a cell are at '3 * index'."""
+    if walls is None:
+        return None
+    if (walls.corner, walls.width, walls.height) != (cost.corner, cost.width, cost.height):
+        raise ValueError(f"argument 'walls' must cover the same hex positions as the cost map, not {walls!r}")
+    return walls.data
+
+
+def _search(
+    cost: HexMap[Any, Any], start: int, goal: int, min_cost: Any, walls: Sequence[Any] | None = None
+) -> tuple[int, ...] | None:
+    """Returns the indexes of a cheapest path between two indexes of a cost map, or 'None' if there is none."""
+    data, neighbors, width = cost.data, cost.neighbors(), cost.width
+    goal_row, goal_column = divmod(goal, width)
+
+    def estimate(index: int) -> Any:
+        row, column = divmod(index, width)
+        dq, dr = column - goal_column, row - goal_row
+        return (abs(dq) + abs(dr) + abs(dq + dr)) // 2 * min_cost
+
+    best = {start: 0}
+    previous: dict[int, int] = {}
+    queue = [(estimate(start), 0, start)]
+    while queue:
+        _, spent, index = heapq.heappop(queue)
+        if index == goal:
+            path = [index]
+            while index != start:
+                index = previous[index]
+                path.append(index)
+            return tuple(reversed(path))
+        if spent > best[index]:
+            continue
+        for direction, neighbor in enumerate(neighbors[6 * index : 6 * index + 6]):
+            if neighbor == -1:
+                continue
+            # The edge towards direction 'i' is owned by the cell if 'i' is below '3', and by the neighbor otherwise.
+            if walls is not None and walls[3 * (index if direction < 3 else neighbor) + direction % 3]:
+                continue
+            total = spent + data[neighbor]
+            if total < best.get(neighbor, math.inf):
+                best[neighbor] = total
+                previous[neighbor] = index
+                heapq.heappush(queue, (total + estimate(neighbor), total, neighbor))
+    return None
+
+
+def find_path(
+    start: T, goal: T, cost: HexMap[T, Any], walls: EdgeMap[Any] | None = None, min_cost: Any = None
+) -> list[T] | None:
+    """Returns a cheapest path between two hex positions on a cost map.
+
+    Note:
+        The search is guided by the smallest cost of the map, which takes a scan of the map unless it is passed. For
+        many queries on the same map, pass it as 'min_cost' or use a 'PathCache'.
+
+    Args:
+        start: Hex position to start from.
+        goal: Hex position to reach.
+        cost: Map of the non-negative cost of entering each cell, 'math.inf' for cells that can not be entered.
+        walls: Map of the edges between cells, over the same hex positions as 'cost', where edges with a truthy
+            value can not be crossed.
+        min_cost: Smallest cost of the map, or any non-negative cost below it. Found from the map if 'None'.
+
+    Returns:
+        List of hex positions from 'start' to 'goal', both included, or 'None' if 'goal' can not be reached.
+    """
+    start_index, goal_index = cost.index(start), cost.index(goal)
+    if min_cost is None:
+        min_cost = min(cost.data)
+    path = _search(cost, start_index, goal_index, min_cost, _walls(cost, walls))
+    return None if path is None else [cost.hex(index) for index in path]
+
+
+def _reverse_search(
+    cost: HexMap[Any, Any], starts: set[int], goal: int, walls: Sequence[Any] | None = None
+) -> dict[int, tuple[int, ...] | None]:
+    """Returns the indexes of cheapest paths from several start indexes to a goal index of a cost map."""
+    data, neighbors = cost.data, cost.neighbors()
+    best = {goal: 0}
+    following: dict[int, int] = {}
+    remaining = set(starts)
+    remaining.discard(goal)
+    queue = [(0, goal)]
+    while queue and remaining:
+        spent, index = heapq.heappop(queue)
+        if spent > best[index]:
+            continue
+        remaining.discard(index)
+        # Stepping from a neighbor into this cell costs the cost of this cell, the same as on the way forward.
+        total = spent + data[index]
+        for direction, neighbor in enumerate(neighbors[6 * index : 6 * index + 6]):
+            if neighbor == -1:
+                continue
+            if walls is not None and walls[3 * (index if direction < 3 else neighbor) + direction % 3]:
+                continue
+            if total < best.get(neighbor, math.inf):
+                best[neighbor] = total
+                following[neighbor] = index
+                heapq.heappush(queue, (total, neighbor))
+
+    paths: dict[int, tuple[int, ...] | None] = {}
+    for start in starts:
+        if start != goal and start not in following:
+            paths[start] = None
+            continue
+        path = [start]
+        while path[-1] != goal:
+            path.append(following[path[-1]])
+        paths[start] = tuple(path)
+    return paths
+
+
+def find_paths(
+    starts: Iterable[T], goal: T, cost: HexMap[T, Any], walls: EdgeMap[Any] | None = None
+) -> dict[T, list[T] | None]:
+    """Returns cheapest paths from several hex positions to a common goal on a cost map.
+
+    Note:
+        The paths are found by a single search outwards from the goal, which stops once every start is reached.
+
+    Args:
+        starts: Hex positions to start from.
+        goal: Hex position to reach.
+        cost: Map of the non-negative cost of entering each cell, 'math.inf' for cells that can not be entered.
+        walls: Map of the edges between cells, over the same hex positions as 'cost', where edges with a truthy
+            value can not be crossed.
+
+    Returns:
+        Dictionary of start positions to lists of hex positions from the start to 'goal', both included, or 'None'
+        if 'goal' can not be reached from the start.
+    """
+    indexes = {cost.index(start): start for start in starts}
+    paths = _reverse_search(cost, set(indexes), cost.index(goal), _walls(cost, walls))
+    return {
+        start: None if paths[index] is None else [cost.hex(step) for step in paths[index]]  # type: ignore
+        for index, start in indexes.items()
+    }
+
+
+class PathCache(Generic[T]):
+    """A cache of cheapest paths over cost maps, dropping only the paths affected by a change in cost.
+
+    Paths are cached by start, goal and cost profile, the name of one of several cost maps such as one per kind of
+    unit, and the least recently used path is evicted when the cache is full. Every cached path is indexed by the cells
+    it crosses, so a change in the cost of a cell drops the paths crossing the cell or one of its neighbors, together
+    with the cached failures to find a path on the same profile, and leaves the rest.
+
+    Note:
+        Change costs through 'set_cost()', or call 'invalidate()' after changing a cost map directly. A path is only
+        checked against changes at or next to it, so a cell far from a cached path becoming cheaper does not drop
+        the path, even if a cheaper path through the cell now exists.
+
+    Args:
+        costs: Mapping of cost profiles to cost maps.
+        maxsize: Max number of cached paths.
+
+    Raises:
+        ValueError: If 'maxsize' is smaller than '1'.
+    """
+
+    def __init__(self, costs: Mapping[Hashable, HexMap[T, Any]], maxsize: int = 1024):
+        if maxsize < 1:
+            raise ValueError(f"argument 'maxsize' must be at least 1, not {maxsize}")
+        self.costs = costs
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._paths: OrderedDict[tuple[int, int, Hashable], tuple[int, ...] | None] = OrderedDict()
+        self._crossing: dict[Hashable, dict[int, set[tuple[int, int, Hashable]]]] = {}
+        self._failures: dict[Hashable, set[tuple[int, int, Hashable]]] = {}
+        self._min_costs: dict[Hashable, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups answered from the cache, '0.0' before the first lookup."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def find(self, start: T, goal: T, profile: Hashable) -> list[T] | None:
+        """Returns a cheapest path between two hex positions, from the cache if possible.
+
+        Args:
+            start: Hex position to start from.
+            goal: Hex position to reach.
+            profile: Cost profile to find the path on.
+
+        Returns:
+            List of hex positions from 'start' to 'goal', both included, or 'None' if 'goal' can not be reached.
+        """
+        cost = self.costs[profile]
+        key = (cost.index(start), cost.index(goal), profile)
+        if key in self._paths:
+            self.hits += 1
+            self._paths.move_to_end(key)
+            path = self._paths[key]
+        else:
+            self.misses += 1
+            if profile not in self._min_costs:
+                self._min_costs[profile] = min(cost.data)
+            path = _search(cost, key[0], key[1], self._min_costs[profile])
+            self._store(key, path)
+        return None if path is None else [cost.hex(index) for index in path]
+
+    def _store(self, key: tuple[int, int, Hashable], path: tuple[int, ...] | None) -> None:
+        if len(self._paths) >= self.maxsize:
+            self._drop(next(iter(self._paths)))
+        self._paths[key] = path
+        if path is None:
+            self._failures.setdefault(key[2], set()).add(key)
+            return
+        crossing = self._crossing.setdefault(key[2], {})
+        for index in path:
+            crossing.setdefault(index, set()).add(key)
+
+    def _drop(self, key: tuple[int, int, Hashable]) -> None:
+        path = self._paths.pop(key)
+        if path is None:
+            self._failures[key[2]].discard(key)
+            return
+        crossing = self._crossing[key[2]]
+        for index in path:
+            keys = crossing[index]
+            keys.discard(key)
+            if not keys:
+                del crossing[index]
+
+    def set_cost(self, hex: T, value: Any, profile: Hashable) -> int:
+        """Changes the cost of a cell and drops the cached paths affected by it.
+
+        Args:
+            hex: Hex position of the cell.
+            value: New cost of entering the cell.
+            profile: Cost profile to change.
+
+        Returns:
+            Number of cached paths dropped.
+        """
+        self.costs[profile][hex] = value
+        return self.invalidate(hex, profile)
+
+    def invalidate(self, hex: T, profile: Hashable) -> int:
+        """Drops the cached paths affected by a change in the cost of a cell.
+
+        Args:
+            hex: Hex position of the changed cell.
+            profile: Cost profile that changed.
+
+        Returns:
+            Number of cached paths dropped.
+        """
+        cost = self.costs[profile]
+        index = cost.index(hex)
+        if profile in self._min_costs:
+            self._min_costs[profile] = min(self._min_costs[profile], cost.data[index])
+
+        crossing = self._crossing.get(profile, {})
+        keys = set(self._failures.get(profile, ()))
+        for cell in (index, *cost.neighbors()[6 * index : 6 * index + 6]):
+            keys.update(crossing.get(cell, ()))
+        for key in keys:
+            self._drop(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drops every cached path and resets the statistics."""
+        self._paths.clear()
+        self._crossing.clear()
+        self._failures.clear()
+        self._min_costs.clear()
+        self.hits = 0
+        self.misses = 0
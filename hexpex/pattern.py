@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any, Generic, NamedTuple, TypeVar
+
+from hexpex.hex import _Hex
+from hexpex.hexmap import HexMap, _region_keys
+from hexpex.hexset import HexSet, _pack, _unpack
+
+T = TypeVar("T", bound=_Hex)
+
+
+class Match(NamedTuple):
+    """A placement of a pattern found in a region."""
+
+    hexes: HexSet
+    orientation: int
+
+
+def _normalize(coordinates: Iterable[tuple[int, int]]) -> tuple[int, ...]:
+    """Returns packed keys of coordinates translated so the smallest key is '0', sorted in ascending order."""
+    keys = sorted({_pack(q, r) for q, r in coordinates})
+    return tuple(key - keys[0] for key in keys)
+
+
+class Pattern(Generic[T]):
+    """A shape of hex positions to search for in any orientation.
+
+    The distinct orientations of the shape, up to six rotations and their reflections, are computed once as packed
+    offsets. As packed keys add like coordinates, testing a placement is a set lookup of the integer sum of an anchor
+    key and each offset.
+
+    Args:
+        hexes: Iterable of hex positions making up the pattern.
+        reflect: Also search for reflections of the pattern.
+
+    Raises:
+        ValueError: If 'hexes' is empty.
+    """
+
+    def __init__(self, hexes: Iterable[T], reflect: bool = True):
+        shape = HexSet(hexes)
+        if not shape:
+            raise ValueError("argument 'hexes' must not be empty")
+        self.kind: type[T] = shape.kind
+
+        coordinates = [_unpack(key) for key in shape._keys]
+        variants = [coordinates]
+        if reflect:
+            variants.append([(q, -q - r) for q, r in coordinates])
+
+        orientations: list[tuple[int, ...]] = []
+        for variant in variants:
+            for _ in range(6):
+                offsets = _normalize(variant)
+                if offsets not in orientations:
+                    orientations.append(offsets)
+                variant = [(-r, q + r) for q, r in variant]
+        self.orientations = orientations
+
+    def __len__(self) -> int:
+        return len(self.orientations[0])
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} hexes, {len(self.orientations)} orientations)"
+
+    def find(self, region: HexMap[Any, Any] | Iterable[T]) -> list[Match]:
+        """Returns every placement of the pattern that lies fully within a region.
+
+        Note:
+            If 'region' is a map, the cells with a truthy value make up the region.
+
+        Args:
+            region: Map or iterable of hex positions to search.
+
+        Returns:
+            List of matches with the hex positions covered and the index of the orientation of the pattern.
+        """
+        _, keys = _region_keys(region)
+        matches = []
+        for orientation, offsets in enumerate(self.orientations):
+            rest = offsets[1:]
+            for anchor in keys:
+                for offset in rest:
+                    if anchor + offset not in keys:
+                        break
+                else:
+                    placed = {anchor + offset for offset in offsets}
+                    matches.append(Match(HexSet._from_keys(self.kind, placed), orientation))
+        return matches
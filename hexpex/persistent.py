@@ -0,0 +1,368 @@
+"""Persistent maps of hex positions, sharing structure between versions.
+
+Values are kept in a hash array mapped trie keyed by 64 bit hashes of the packed keys of hex positions. Every node of
+the trie covers five more bits of the hash, holding up to 32 entries in a list indexed by a bitmap, so only the entries
+present take space. Setting or deleting a value copies the nodes on the path to its entry, at most 13 nodes for the 64
+bits of a hash, and every other node is shared with the previous version. Keeping old versions is therefore free, and
+creating a new version takes time proportional to the depth of the trie.
+
+A transient map makes a batch of changes without copying a node more than once: nodes created by a transient are
+marked as owned by it, and are changed in place by later changes through the same transient.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping
+from itertools import chain
+from typing import Any, TypeVar
+
+from hexpex.hex import Axial, _Hex
+from hexpex.hexset import _make, _pack
+
+T = TypeVar("T", bound=_Hex)
+V = TypeVar("V")
+
+_BITS = 5
+_WIDTH = 1 << _BITS
+_HASH_MASK = (1 << 64) - 1
+# Odd, so multiplying by it maps distinct 64 bit keys to distinct hashes.
+_MULTIPLIER = 0x9E3779B97F4A7C15
+
+# Marker for missing entries, as values may be 'None'.
+_MISSING: Any = object()
+
+
+class _Node:
+    """A node of the trie, holding entries in a list indexed by a bitmap of the five bits of the key at its level."""
+
+    __slots__ = ("bitmap", "entries", "owner")
+
+    def __init__(self, bitmap: int, entries: list[Any], owner: object | None):
+        self.bitmap = bitmap
+        self.entries = entries
+        self.owner = owner
+
+
+class _Collision:
+    """A bucket of entries whose keys have the same 64 bit hash, below the last level of the trie."""
+
+    __slots__ = ("hash", "entries")
+
+    def __init__(self, hash: int, entries: tuple[tuple[int, Any], ...]):
+        self.hash = hash
+        self.entries = entries
+
+
+def _popcount(value: int) -> int:
+    return bin(value).count("1")
+
+
+def _hash(key: int) -> int:
+    """Returns the 64 bit hash of a packed key, with the bits of both coordinates spread over the whole hash."""
+    # Multiplying carries every bit of the key into the bits above it, and folding the high half back in carries the
+    # bits of 'q', packed above bit 32, into the levels near the root.
+    hash = (key * _MULTIPLIER) & _HASH_MASK
+    return hash ^ (hash >> 32)
+
+
+def _editable(node: _Node, owner: object | None) -> _Node:
+    """Returns the node itself if it is owned by a transient, otherwise a copy owned by the transient if any."""
+    if owner is not None and node.owner is owner:
+        return node
+    return _Node(node.bitmap, list(node.entries), owner)
+
+
+def _pair(shift: int, first: tuple[int, Any], second: tuple[int, Any], owner: object | None) -> Any:
+    """Returns a subtrie holding two entries with different keys."""
+    first_hash, second_hash = _hash(first[0]), _hash(second[0])
+    if first_hash == second_hash:
+        return _Collision(first_hash, (first, second))
+    if shift >= 64:
+        raise AssertionError("unreachable")  # pragma: no cover​
+    first_bit = 1 << ((first_hash >> shift) & (_WIDTH - 1))
+    second_bit = 1 << ((second_hash >> shift) & (_WIDTH - 1))
+    if first_bit == second_bit:
+        return _Node(first_bit, [_pair(shift + _BITS, first, second, owner)], owner)
+    entries = [first, second] if first_bit < second_bit else [second, first]
+    return _Node(first_bit | second_bit, entries, owner)
+
+
+def _get(node: _Node, key: int) -> Any:
+    hash = _hash(key)
+    shift = 0
+    while True:
+        bit = 1 << ((hash >> shift) & (_WIDTH - 1))
+        if not node.bitmap & bit:
+            return _MISSING
+        entry = node.entries[_popcount(node.bitmap & (bit - 1))]
+        if isinstance(entry, _Node):
+            node = entry
+            shift += _BITS
+        elif isinstance(entry, _Collision):
+            return next((value for other, value in entry.entries if other == key), _MISSING)
+        else:
+            return entry[1] if entry[0] == key else _MISSING
+
+
+def _set(node: _Node, shift: int, key: int, value: Any, owner: object | None) -> tuple[_Node, bool]:
+    """Returns the node with a key set to a value, and whether the key was added."""
+    hash = _hash(key)
+    bit = 1 << ((hash >> shift) & (_WIDTH - 1))
+    index = _popcount(node.bitmap & (bit - 1))
+    if not node.bitmap & bit:
+        node = _editable(node, owner)
+        node.bitmap |= bit
+        node.entries.insert(index, (key, value))
+        return node, True
+
+    entry = node.entries[index]
+    added = False
+    if isinstance(entry, _Node):
+        replacement, added = _set(entry, shift + _BITS, key, value, owner)
+        if replacement is entry:
+            return node, added
+    elif isinstance(entry, _Collision):
+        if entry.hash != hash:
+            replacement = _pair_with_collision(shift + _BITS, entry, (key, value), owner)
+            added = True
+        else:
+            kept = tuple(item for item in entry.entries if item[0] != key)
+            added = len(kept) == len(entry.entries)
+            replacement = _Collision(hash, kept + ((key, value),))
+    elif entry[0] == key:
+        if entry[1] is value:
+            return node, False
+        replacement = (key, value)
+    else:
+        replacement = _pair(shift + _BITS, entry, (key, value), owner)
+        added = True
+
+    node = _editable(node, owner)
+    node.entries[index] = replacement
+    return node, added
+
+
+def _pair_with_collision(shift: int, collision: _Collision, entry: tuple[int, Any], owner: object | None) -> _Node:
+    """Returns a subtrie holding a collision bucket and an entry with a different hash."""
+    collision_bit = 1 << ((collision.hash >> shift) & (_WIDTH - 1))
+    entry_bit = 1 << ((_hash(entry[0]) >> shift) & (_WIDTH - 1))
+    if collision_bit == entry_bit:
+        return _Node(collision_bit, [_pair_with_collision(shift + _BITS, collision, entry, owner)], owner)
+    entries: list[Any] = [collision, entry] if collision_bit < entry_bit else [entry, collision]
+    return _Node(collision_bit | entry_bit, entries, owner)
+
+
+def _delete(node: _Node, shift: int, key: int, owner: object | None) -> Any | None:
+    """Returns the node with a key it holds deleted, the single entry left in it, or 'None' if it is left empty."""
+    hash = _hash(key)
+    bit = 1 << ((hash >> shift) & (_WIDTH - 1))
+    index = _popcount(node.bitmap & (bit - 1))
+    entry = node.entries[index]
+
+    replacement: Any | None
+    if isinstance(entry, _Node):
+        replacement = _delete(entry, shift + _BITS, key, owner)
+    elif isinstance(entry, _Collision):
+        kept = tuple(item for item in entry.entries if item[0] != key)
+        replacement = kept[0] if len(kept) == 1 else _Collision(hash, kept)
+    else:
+        replacement = None
+
+    if replacement is None and len(node.entries) == 1:
+        return None
+    # A node left with a single entry that is not a node is replaced by the entry, keeping the trie as shallow as
+    # possible, except at the root which is always a node.
+    if shift > 0:
+        if replacement is None and len(node.entries) == 2 and not isinstance(node.entries[1 - index], _Node):
+            return node.entries[1 - index]
+        if replacement is not None and len(node.entries) == 1 and not isinstance(replacement, _Node):
+            return replacement
+
+    node = _editable(node, owner)
+    if replacement is None:
+        node.bitmap &= ~bit
+        del node.entries[index]
+    else:
+        node.entries[index] = replacement
+    return node
+
+
+def _entries(node: _Node) -> Iterator[tuple[int, Any]]:
+    for entry in node.entries:
+        if isinstance(entry, _Node):
+            yield from _entries(entry)
+        elif isinstance(entry, _Collision):
+            yield from entry.entries
+        else:
+            yield entry
+
+
+class _Base(Mapping[T, V]):
+    """Lookups shared by persistent and transient maps."""
+
+    __slots__ = ()
+
+    _kind: type[T]
+    _root: _Node
+    _size: int
+
+    @property
+    def kind(self) -> type[T]:
+        """Hex position class held by the map."""
+        return self._kind
+
+    def _key(self, hex: T) -> int:
+        if not isinstance(hex, self._kind):
+            raise TypeError(f"map of kind '{self._kind.__name__}' can not hold '{type(hex).__name__}'")
+        return _pack(hex.q, hex.r)  # type: ignore
+
+    def __getitem__(self, hex: T) -> V:
+        if isinstance(hex, self._kind):
+            value = _get(self._root, _pack(hex.q, hex.r))  # type: ignore
+            if value is not _MISSING:
+                return value  # type: ignore
+        raise KeyError(hex)
+
+    def __contains__(self, hex: Any) -> bool:
+        return isinstance(hex, self._kind) and _get(self._root, _pack(hex.q, hex.r)) is not _MISSING  # type: ignore
+
+    def __iter__(self) -> Iterator[T]:
+        kind = self._kind
+        for key, _ in _entries(self._root):
+            yield _make(kind, key)
+
+    def _items(self) -> Iterator[tuple[T, V]]:
+        kind = self._kind
+        for key, value in _entries(self._root):
+            yield _make(kind, key), value
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self._items())!r})"
+
+
+class PersistentHexMap(_Base[T, V]):
+    """An immutable map of hex positions to values, where changes return new versions sharing structure.
+
+    Note:
+        A map only holds positions of a single kind, either 'Axial' or 'Cube'. If 'kind' is not given it is taken
+        from the first hex position in 'items', or defaults to 'Axial' if 'items' is empty.
+
+    Args:
+        items: Mapping or iterable of pairs of hex positions and values.
+        kind: Hex position class held by the map.
+
+    Raises:
+        TypeError: If 'items' holds a hex position of another kind.
+    """
+
+    __slots__ = ("_kind", "_root", "_size")
+
+    def __init__(self, items: Mapping[T, V] | Iterable[tuple[T, V]] = (), kind: type[T] | None = None):
+        pairs: Iterable[tuple[T, V]] = items.items() if isinstance(items, Mapping) else items
+        if kind is None:
+            iterator = iter(pairs)
+            first = next(iterator, None)
+            kind = type(first[0]) if first is not None else Axial  # type: ignore
+            pairs = chain((first,), iterator) if first is not None else ()  # type: ignore
+
+        self._kind: type[T] = kind  # type: ignore
+        self._root = _Node(0, [], None)
+        self._size = 0
+        transient = self.transient()
+        for hex, value in pairs:
+            transient[hex] = value
+        self._root, self._size = transient._root, transient._size
+
+    @classmethod
+    def _from_root(cls, kind: type[T], root: _Node, size: int) -> PersistentHexMap[T, V]:
+        hexmap = cls.__new__(cls)
+        hexmap._kind = kind
+        hexmap._root = root
+        hexmap._size = size
+        return hexmap
+
+    def set(self, hex: T, value: V) -> PersistentHexMap[T, V]:
+        """Returns a new version of the map with a hex position set to a value.
+
+        Args:
+            hex: Hex position to set.
+            value: Value to set.
+
+        Returns:
+            New version of the map, or the map itself if the hex position already has the value.
+        """
+        root, added = _set(self._root, 0, self._key(hex), value, None)
+        if root is self._root:
+            return self
+        return self._from_root(self._kind, root, self._size + added)
+
+    def delete(self, hex: T) -> PersistentHexMap[T, V]:
+        """Returns a new version of the map without a hex position.
+
+        Args:
+            hex: Hex position to delete.
+
+        Raises:
+            KeyError: If 'hex' is not in the map.
+
+        Returns:
+            New version of the map.
+        """
+        if hex not in self:
+            raise KeyError(hex)
+        root = _delete(self._root, 0, _pack(hex.q, hex.r), None)  # type: ignore
+        return self._from_root(self._kind, root if root is not None else _Node(0, [], None), self._size - 1)
+
+    def transient(self) -> TransientHexMap[T, V]:
+        """Returns a transient map for making a batch of changes to a copy of the map.
+
+        Returns:
+            Transient map starting from the map.
+        """
+        return TransientHexMap(self)
+
+
+class TransientHexMap(_Base[T, V], MutableMapping[T, V]):  # type: ignore
+    """A mutable map starting from a persistent map, changing in place the nodes it has already copied.
+
+    Changes to a transient map never affect the persistent map it was created from, nor maps returned by
+    'persistent()', so a transient map can keep being used after creating a persistent map from it.
+
+    Args:
+        hexmap: Persistent map to start from.
+    """
+
+    __slots__ = ("_kind", "_root", "_size", "_owner")
+
+    def __init__(self, hexmap: PersistentHexMap[T, V]):
+        self._kind = hexmap._kind
+        self._root = hexmap._root
+        self._size = hexmap._size
+        self._owner = object()
+
+    def __setitem__(self, hex: T, value: V) -> None:
+        self._root, added = _set(self._root, 0, self._key(hex), value, self._owner)
+        self._size += added
+
+    def __delitem__(self, hex: T) -> None:
+        if hex not in self:
+            raise KeyError(hex)
+        root = _delete(self._root, 0, _pack(hex.q, hex.r), self._owner)  # type: ignore
+        self._root = root if root is not None else _Node(0, [], self._owner)
+        self._size -= 1
+
+    def persistent(self) -> PersistentHexMap[T, V]:
+        """Returns a persistent map of the current contents.
+
+        Note:
+            The nodes copied so far are handed over to the persistent map, so later changes through the transient
+            map copy them again.
+
+        Returns:
+            Persistent map.
+        """
+        self._owner = object()
+        return PersistentHexMap._from_root(self._kind, self._root, self._size)
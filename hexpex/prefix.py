@@ -0,0 +1,250 @@
+"""Prefix sums over dense hex maps for constant time sums over ranges and parallelograms.
+
+In the axial coordinates of a map, relative to its corner, a range around a center is the rectangle of 'q' and 'r'
+values within the distance, cut by two bounds on 's'. Sums over any such region follow by inclusion and exclusion from
+sums over the cells with 'q', 'r' and 'q + r' below given bounds, which in turn follow from four tables of prefix sums:
+over 'q' and 'r', over 'q' and 'q + r', over 'r' and 'q + r', and over 'q + r' alone.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Any, Generic, TypeVar
+
+from hexpex.hex import _Hex
+from hexpex.hexmap import HexMap
+
+T = TypeVar("T", bound=_Hex)
+
+
+class _Sums(ABC, Generic[T]):
+    """Queries shared by prefix sums stored as tables or as trees."""
+
+    hexmap: HexMap[T, Any]
+
+    @abstractmethod
+    def _qr(self, q: int, r: int) -> Any:  # pragma: no cover​
+        ...
+
+    @abstractmethod
+    def _qs(self, q: int, s: int) -> Any:  # pragma: no cover​
+        ...
+
+    @abstractmethod
+    def _rs(self, r: int, s: int) -> Any:  # pragma: no cover​
+        ...
+
+    @abstractmethod
+    def _s(self, s: int) -> Any:  # pragma: no cover​
+        ...
+
+    def _below(self, q: int, r: int, s: int) -> Any:
+        """Returns the sum over the cells with local 'q', 'r' and 'q + r' at most the passed bounds."""
+        q, r, s = min(q, self.hexmap.width - 1), min(r, self.hexmap.height - 1), min(s, self._diagonals - 1)
+        if q < 0 or r < 0 or s < 0:
+            return 0
+        if s >= q + r:
+            return self._qr(q, r)
+        # Cells above both 'q' and 'r' would have 'q + r' above 's', so only the two strips outside them are removed.
+        return self._qs(q, s) + self._rs(r, s) - self._s(s)
+
+    @property
+    def _diagonals(self) -> int:
+        return self.hexmap.width + self.hexmap.height - 1
+
+    def _box(self, q0: int, q1: int, r0: int, r1: int, s: int) -> Any:
+        """Returns the sum over the cells with local 'q' and 'r' within bounds and 'q + r' at most 's'."""
+        below = self._below
+        return below(q1, r1, s) - below(q0 - 1, r1, s) - below(q1, r0 - 1, s) + below(q0 - 1, r0 - 1, s)
+
+    def range_sum(self, center: T, distance: int) -> Any:
+        """Returns the sum of the values within a distance of a center.
+
+        Note:
+            Hex positions outside the map do not count towards the sum.
+
+        Args:
+            center: Center of the range.
+            distance: Max distance of the range from the center.
+
+        Returns:
+            Sum of the values in range.
+        """
+        if distance < 0:
+            return 0
+        q = center.q - self.hexmap.corner.q  # type: ignore
+        r = center.r - self.hexmap.corner.r  # type: ignore
+        q0, q1, r0, r1 = q - distance, q + distance, r - distance, r + distance
+        return self._box(q0, q1, r0, r1, q + r + distance) - self._box(q0, q1, r0, r1, q + r - distance - 1)
+
+    def parallelogram_sum(self, corner: T, width: int, height: int) -> Any:
+        """Returns the sum of the values in a parallelogram of hex positions.
+
+        Note:
+            The parallelogram is laid out like a map, with 'width' positions along 'q' and 'height' along 'r'. Hex
+            positions outside the map do not count towards the sum.
+
+        Args:
+            corner: Hex position with the smallest 'q' and 'r' coordinates in the parallelogram.
+            width: Number of hex positions along 'q'.
+            height: Number of hex positions along 'r'.
+
+        Returns:
+            Sum of the values in the parallelogram.
+        """
+        if width <= 0 or height <= 0:
+            return 0
+        q = corner.q - self.hexmap.corner.q  # type: ignore
+        r = corner.r - self.hexmap.corner.r  # type: ignore
+        return self._box(q, q + width - 1, r, r + height - 1, self._diagonals)
+
+
+class PrefixSum(_Sums[T]):
+    """Prefix sums of a map, answering sums over ranges and parallelograms in constant time.
+
+    Note:
+        The sums are computed once from the values of the map, and do not follow later changes to it. Use
+        'FenwickSum' for a map that changes.
+
+    Args:
+        hexmap: Map of values to sum.
+    """
+
+    def __init__(self, hexmap: HexMap[T, Any]):
+        self.hexmap = hexmap
+        width, height, data = hexmap.width, hexmap.height, hexmap.data
+        diagonals = width + height - 1
+
+        # Each table has a leading row and column of zeros, so a bound of '-1' needs no check.
+        stride = width + 1
+        qr = [0] * (stride * (height + 1))
+        rows = []
+        for r in range(height):
+            row = [0]
+            for q in range(width):
+                row.append(row[-1] + data[r * width + q])
+                qr[(r + 1) * stride + q + 1] = qr[r * stride + q + 1] + row[-1]
+            rows.append(row)
+
+        columns = []
+        for q in range(width):
+            column = [0]
+            for r in range(height):
+                column.append(column[-1] + data[r * width + q])
+            columns.append(column)
+
+        # Cells of column 'q' with 'q + r' at most 's' are the first 's - q + 1' of the column, and likewise for rows.
+        qs = [0] * (stride * (diagonals + 1))
+        rs = [0] * ((height + 1) * (diagonals + 1))
+        for s in range(diagonals):
+            for q in range(width):
+                strip = columns[q][max(0, min(s - q + 1, height))]
+                qs[(s + 1) * stride + q + 1] = qs[(s + 1) * stride + q] + strip
+            for r in range(height):
+                strip = rows[r][max(0, min(s - r + 1, width))]
+                rs[(s + 1) * (height + 1) + r + 1] = rs[(s + 1) * (height + 1) + r] + strip
+
+        self._stride = stride
+        self._tables = qr, qs, rs
+
+    def _qr(self, q: int, r: int) -> Any:
+        return self._tables[0][(r + 1) * self._stride + q + 1]
+
+    def _qs(self, q: int, s: int) -> Any:
+        return self._tables[1][(s + 1) * self._stride + q + 1]
+
+    def _rs(self, r: int, s: int) -> Any:
+        return self._tables[2][(s + 1) * (self.hexmap.height + 1) + r + 1]
+
+    def _s(self, s: int) -> Any:
+        return self._qs(self.hexmap.width - 1, s)
+
+
+class _Tree:
+    """Two dimensional Fenwick tree of sums with prefix queries by inclusive zero-based bounds."""
+
+    __slots__ = ("rows", "columns", "nodes")
+
+    def __init__(self, rows: int, columns: int):
+        self.rows = rows
+        self.columns = columns
+        self.nodes: list[Any] = [0] * ((rows + 1) * (columns + 1))
+
+    def add(self, row: int, column: int, delta: Any) -> None:
+        nodes, stride = self.nodes, self.columns + 1
+        i = row + 1
+        while i <= self.rows:
+            j = column + 1
+            while j <= self.columns:
+                nodes[i * stride + j] += delta
+                j += j & -j
+            i += i & -i
+
+    def prefix(self, row: int, column: int) -> Any:
+        nodes, stride = self.nodes, self.columns + 1
+        total = 0
+        i = row + 1
+        while i > 0:
+            j = column + 1
+            while j > 0:
+                total += nodes[i * stride + j]
+                j -= j & -j
+            i -= i & -i
+        return total
+
+
+class FenwickSum(_Sums[T]):
+    """Prefix sums of a map stored as Fenwick trees, supporting changes to the map.
+
+    Queries and changes both take time proportional to the product of the logarithms of the sides of the map.
+
+    Note:
+        Changes must be made through the prefix sums to be reflected in them, and are written through to the map.
+
+    Args:
+        hexmap: Map of values to sum.
+    """
+
+    def __init__(self, hexmap: HexMap[T, Any]):
+        self.hexmap = hexmap
+        width, height = hexmap.width, hexmap.height
+        diagonals = self._diagonals
+        self._trees = _Tree(height, width), _Tree(diagonals, width), _Tree(diagonals, height), _Tree(1, diagonals)
+        for index, value in enumerate(hexmap.data):
+            if value:
+                r, q = divmod(index, width)
+                self._add(q, r, value)
+
+    def _add(self, q: int, r: int, delta: Any) -> None:
+        qr, qs, rs, s = self._trees
+        qr.add(r, q, delta)
+        qs.add(q + r, q, delta)
+        rs.add(q + r, r, delta)
+        s.add(0, q + r, delta)
+
+    def add(self, hex: T, delta: Any) -> None:
+        """Adds to the value of a cell.
+
+        Args:
+            hex: Hex position of the cell.
+            delta: Value to add.
+        """
+        index = self.hexmap.index(hex)
+        self.hexmap.data[index] += delta
+        r, q = divmod(index, self.hexmap.width)
+        self._add(q, r, delta)
+
+    def __setitem__(self, hex: T, value: Any) -> None:
+        self.add(hex, value - self.hexmap[hex])
+
+    def _qr(self, q: int, r: int) -> Any:
+        return self._trees[0].prefix(r, q)
+
+    def _qs(self, q: int, s: int) -> Any:
+        return self._trees[1].prefix(s, q)
+
+    def _rs(self, r: int, s: int) -> Any:
+        return self._trees[2].prefix(s, r)
+
+    def _s(self, s: int) -> Any:
+        return self._trees[3].prefix(0, s)
@@ -0,0 +1,225 @@
+"""Opt-in instrumentation of hexpex hot paths.
+
+Instrumentation works by temporarily wrapping the public methods of the hex classes, so it has no cost at all while
+it is disabled. Use the 'profile' context manager to collect statistics for a block of code:
+
+    with profile() as stats:
+        Axial(0, 0).range(10)
+    print(stats.summary())
+
+Note:
+    Instrumentation patches the hex classes globally, so calls made from other threads while it is enabled are
+    collected as well. Every thread keeps its own call stack, so self times are attributed per thread.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from time import perf_counter_ns
+from typing import Any, Callable
+
+from hexpex.hex import Axial, Cube, _Hex
+from hexpex.hexset import HexSet
+
+_CLASSES = (_Hex, Axial, Cube, HexSet)
+
+_active: Profile | None = None
+_originals: list[tuple[type, str, Any]] = []
+
+
+class CallStats:
+    """Statistics collected for a single instrumented method."""
+
+    __slots__ = ("calls", "total_ns", "self_ns")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total_ns = 0
+        self.self_ns = 0
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(calls={self.calls}, total_ns={self.total_ns}, self_ns={self.self_ns})"
+
+
+class Profile:
+    """Call counts, cumulative times and instance counts collected while instrumentation is enabled."""
+
+    def __init__(self) -> None:
+        self.stats: dict[str, CallStats] = {}
+        self.instances: dict[str, int] = {}
+        self.stacks: dict[tuple[str, ...], int] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _frames(self) -> tuple[list[str], list[int]]:
+        """Returns the call stack and the time spent in children of each frame, of the current thread."""
+        local = self._local
+        if not hasattr(local, "stack"):
+            local.stack, local.child_ns = [], []
+        return local.stack, local.child_ns
+
+    def _enter(self, name: str) -> None:
+        stack, child_ns = self._frames()
+        stack.append(name)
+        child_ns.append(0)
+
+    def _exit(self, elapsed: int, call: bool = True) -> None:
+        stack, child_ns = self._frames()
+        frames = tuple(stack)
+        stack.pop()
+        own_child_ns = child_ns.pop()
+        if child_ns:
+            child_ns[-1] += elapsed
+
+        with self._lock:
+            stats = self.stats.get(frames[-1])
+            if stats is None:
+                stats = self.stats[frames[-1]] = CallStats()
+            stats.calls += call
+            stats.total_ns += elapsed
+            stats.self_ns += elapsed - own_child_ns
+            self.stacks[frames] = self.stacks.get(frames, 0) + elapsed - own_child_ns
+
+    def summary(self) -> str:
+        """Returns a table of collected statistics, sorted by cumulative time.
+
+        Returns:
+            Formatted summary of method statistics and created instances.
+        """
+        lines = [f"{'method':<24}{'calls':>10}{'total ms':>12}{'self ms':>12}"]
+        for name, stats in sorted(self.stats.items(), key=lambda item: item[1].total_ns, reverse=True):
+            lines.append(f"{name:<24}{stats.calls:>10}{stats.total_ns / 1e6:>12.3f}{stats.self_ns / 1e6:>12.3f}")
+        for kind, count in sorted(self.instances.items()):
+            lines.append(f"{kind + ' instances':<24}{count:>10}")
+        return "\n".join(lines)
+
+    def folded(self) -> str:
+        """Returns the collected self times in the folded stack format used by flame graph tools.
+
+        Returns:
+            One line per call stack, with frames separated by ';' followed by the self time in microseconds.
+        """
+        return "\n".join(f"{';'.join(stack)} {elapsed // 1000}" for stack, elapsed in sorted(self.stacks.items()))
+
+
+def _instrument_method(name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(method)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        profile = _active
+        if profile is None:
+            return method(self, *args, **kwargs)
+        profile._enter(f"{type(self).__name__}.{name}")
+        start = perf_counter_ns()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            profile._exit(perf_counter_ns() - start)
+
+    return wrapper
+
+
+def _instrument_generator(name: str, method: Callable[..., Iterator[Any]]) -> Callable[..., Iterator[Any]]:
+    @functools.wraps(method)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Iterator[Any]:
+        iterator = method(self, *args, **kwargs)
+        qualified_name = f"{type(self).__name__}.{name}"
+        call = True
+        while True:
+            profile = _active
+            if profile is None:
+                yield from iterator
+                return
+            # Only time spent producing items is counted, not time spent by the consumer between items, and the
+            # call is only counted once no matter how many items are produced.
+            profile._enter(qualified_name)
+            start = perf_counter_ns()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                profile._exit(perf_counter_ns() - start, call)
+            call = False
+            yield item
+
+    return wrapper
+
+
+def _instrument_init(kind: str, method: Callable[..., None]) -> Callable[..., None]:
+    @functools.wraps(method)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> None:
+        profile = _active
+        if profile is not None:
+            with profile._lock:
+                profile.instances[kind] = profile.instances.get(kind, 0) + 1
+        method(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _patch() -> None:
+    for cls in _CLASSES:
+        for name, attribute in list(vars(cls).items()):
+            if name == "__init__" and cls is not HexSet:
+                wrapper = _instrument_init(cls.__name__, attribute)
+            elif name.startswith("_") or not inspect.isfunction(attribute):
+                continue
+            elif inspect.isgeneratorfunction(attribute):
+                wrapper = _instrument_generator(name, attribute)
+            else:
+                wrapper = _instrument_method(name, attribute)
+            _originals.append((cls, name, attribute))
+            setattr(cls, name, wrapper)
+
+
+def _unpatch() -> None:
+    while _originals:
+        cls, name, attribute = _originals.pop()
+        setattr(cls, name, attribute)
+
+
+def enable() -> Profile:
+    """Enables instrumentation of hexpex methods.
+
+    Raises:
+        RuntimeError: If instrumentation is already enabled.
+
+    Returns:
+        Profile collecting statistics until instrumentation is disabled.
+    """
+    global _active
+    if _active is not None:
+        raise RuntimeError("instrumentation is already enabled")
+    _active = Profile()
+    _patch()
+    return _active
+
+
+def disable() -> Profile | None:
+    """Disables instrumentation of hexpex methods and restores the original methods.
+
+    Returns:
+        Profile collected since instrumentation was enabled, or 'None' if it was not enabled.
+    """
+    global _active
+    profile, _active = _active, None
+    _unpatch()
+    return profile
+
+
+@contextmanager
+def profile() -> Iterator[Profile]:
+    """Enables instrumentation of hexpex methods for the duration of a with block.
+
+    Yields:
+        Profile collecting statistics for the with block.
+    """
+    collected = enable()
+    try:
+        yield collected
+    finally:
+        disable()
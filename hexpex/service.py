@@ -0,0 +1,118 @@
+"""Asynchronous pathfinding for event loop based servers.
+
+Requests made through a 'PathService' are queued until the event loop gets to run the service, then grouped by
+goal, and every group is answered by a single search outwards from its goal, run in an executor so the event loop is
+never blocked by a search.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor
+from time import perf_counter_ns
+from typing import Any, Generic, TypeVar
+
+from hexpex.hex import _Hex
+from hexpex.hexmap import HexMap
+from hexpex.path import find_paths
+
+T = TypeVar("T", bound=_Hex)
+
+
+class ServiceStats:
+    """Statistics collected by a path service."""
+
+    __slots__ = ("requests", "searches", "total_ns", "max_ns")
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.searches = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    @property
+    def mean_ns(self) -> float:
+        """Mean time from request to answer, '0.0' before the first answer."""
+        return self.total_ns / self.requests if self.requests else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(requests={self.requests}, searches={self.searches}, total_ns={self.total_ns}, "
+            f"max_ns={self.max_ns})"
+        )
+
+
+class PathService(Generic[T]):
+    """A service answering path requests on a cost map without blocking the event loop.
+
+    Requests are collected for 'delay' seconds, or until the event loop next runs the service if 'delay' is '0', and
+    requests sharing a goal are answered together by a single search.
+
+    Note:
+        Searches run in 'executor', or the default executor of the event loop if it is 'None'. A process pool can be
+        used if the cost map can be pickled, at the cost of sending the map with every search. The cost map must not
+        change while searches run in threads.
+
+    Args:
+        cost: Map of the non-negative cost of entering each cell, 'math.inf' for cells that can not be entered.
+        executor: Executor to run searches in.
+        delay: Seconds to collect requests before searching.
+    """
+
+    def __init__(self, cost: HexMap[T, Any], executor: Executor | None = None, delay: float = 0.0):
+        self.cost = cost
+        self.executor = executor
+        self.delay = delay
+        self.stats = ServiceStats()
+        self._pending: dict[T, list[tuple[T, asyncio.Future[list[T] | None], int]]] = {}
+        self._flush: asyncio.Task[None] | None = None
+
+    async def find(self, start: T, goal: T) -> list[T] | None:
+        """Returns a cheapest path between two hex positions once the search for its goal is done.
+
+        Args:
+            start: Hex position to start from.
+            goal: Hex position to reach.
+
+        Raises:
+            KeyError: If 'start' or 'goal' is not in the cost map.
+
+        Returns:
+            List of hex positions from 'start' to 'goal', both included, or 'None' if 'goal' can not be reached.
+        """
+        # Hex positions are checked before queuing, so a bad request fails alone instead of failing its group.
+        for hex in (start, goal):
+            if hex not in self.cost:
+                raise KeyError(hex)
+        future: asyncio.Future[list[T] | None] = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(goal, []).append((start, future, perf_counter_ns()))
+        if self._flush is None:
+            self._flush = asyncio.create_task(self._run())
+        return await future
+
+    async def _run(self) -> None:
+        await asyncio.sleep(self.delay)
+        pending, self._pending, self._flush = self._pending, {}, None
+        await asyncio.gather(*(self._search(goal, requests) for goal, requests in pending.items()))
+
+    async def _search(self, goal: T, requests: list[tuple[T, asyncio.Future[list[T] | None], int]]) -> None:
+        loop = asyncio.get_running_loop()
+        starts = {start for start, _, _ in requests}
+        try:
+            paths = await loop.run_in_executor(self.executor, find_paths, starts, goal, self.cost)
+        except Exception as error:
+            for _, future, _ in requests:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        self.stats.searches += 1
+        for start, future, requested in requests:
+            path = paths[start]
+            if not future.done():
+                # Requests sharing a start get their own copy of the path.
+                future.set_result(None if path is None else list(path))
+            elapsed = perf_counter_ns() - requested
+            self.stats.requests += 1
+            self.stats.total_ns += elapsed
+            self.stats.max_ns = max(self.stats.max_ns, elapsed)
@@ -0,0 +1,317 @@
+"""Partitioning of dense hex maps into shards for cellular automata stepped in parallel.
+
+A map is cut into shards, either stripes of whole rows or groups of super-hexes, and every shard is stepped by a
+worker on its own buffer in shared memory. A buffer holds the cells owned by the shard followed by its halo, the cells
+of other shards adjacent to it, so a worker reads only its own buffer. Between steps the halos are exchanged, copying
+the new values of every halo cell from the buffer of the shard owning it.
+
+Each shard is kept in a single shared memory block laid out as:
+
+    neighbors  6 signed 64 bit local indexes per owned cell, '-1' for no neighbor
+    buffer 0   values of the owned cells followed by the halo cells
+    buffer 1   same as buffer 0, written by odd steps
+"""
+
+from __future__ import annotations
+
+import os
+from array import array
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Generic, TypeVar
+
+from hexpex.automaton import Rule, _gatherer
+from hexpex.hex import _Hex
+from hexpex.hexmap import HexMap
+from hexpex.hexset import HexSet, _unpack
+from hexpex.hierarchy import _parent
+from hexpex.morphology import _dilate
+
+T = TypeVar("T", bound=_Hex)
+V = TypeVar("V")
+
+TILINGS = ("stripes", "superhexes")
+
+# Gatherers of the shards last stepped in this process, by block name. Block names are unique while the block exists,
+# so an entry holds until its automaton closes, and entries of closed automatons fall out as others are stepped.
+_GATHERERS_SIZE = 64
+_gatherers: OrderedDict[str, list[Any]] = OrderedDict()
+
+
+def partition(hexmap: HexMap[T, Any], shards: int, tiling: str = "stripes", radius: int = 4) -> list[HexSet[T]]:
+    """Returns a map cut into shards of about the same number of cells.
+
+    Note:
+        With 'stripes' every shard is a band of whole rows. With 'superhexes' the map is tiled by super-hexes of a
+        radius, as in 'hexpex.hierarchy', and every shard is a run of whole super-hexes, which gives shards with
+        shorter borders for large maps. Shards without cells are left out.
+
+    Args:
+        hexmap: Map to cut.
+        shards: Number of shards to cut the map into.
+        tiling: Tiling to cut along, one of 'stripes' or 'superhexes'.
+        radius: Radius of the super-hexes for the 'superhexes' tiling.
+
+    Raises:
+        ValueError: If 'shards' is smaller than '1' or 'tiling' is not supported.
+
+    Returns:
+        List of hex sets of the cells of each shard.
+    """
+    if shards < 1:
+        raise ValueError(f"argument 'shards' must be at least 1, not {shards}")
+    if tiling not in TILINGS:
+        raise ValueError(f"argument 'tiling' must be one of {', '.join(TILINGS)}, not '{tiling}'")
+
+    if tiling == "stripes":
+        bounds = [hexmap.height * shard // shards * hexmap.width for shard in range(shards + 1)]
+        groups = [range(start, stop) for start, stop in zip(bounds, bounds[1:])]
+    else:
+        tiles: dict[tuple[int, int], list[int]] = {}
+        for index in range(len(hexmap)):
+            q, r = _unpack(hexmap._index_key(index))
+            tiles.setdefault(_parent(q, r, radius)[::-1], []).append(index)
+        groups, group, total = [], [], 0
+        for _, indexes in sorted(tiles.items()):
+            group.extend(indexes)
+            total += len(indexes)
+            if total * shards >= len(hexmap) * (len(groups) + 1):
+                groups.append(group)
+                group = []
+        groups.append(group)
+
+    return [HexSet._from_keys(hexmap.kind, {hexmap._index_key(index) for index in group}) for group in groups if group]
+
+
+def halo(region: HexSet[T], hexmap: HexMap[T, Any]) -> HexSet[T]:
+    """Returns the cells of a map adjacent to a region but not in it.
+
+    Args:
+        region: Hex set of cells in the map.
+        hexmap: Map holding the region.
+
+    Returns:
+        Hex set of the cells in the halo.
+    """
+    ring = _dilate(region._keys, 1) - region._keys
+    return HexSet._from_keys(hexmap.kind, {key for key in ring if hexmap._key_index(key) != -1})
+
+
+def _views(block: SharedMemory, owned: int, size: int, typecode: str) -> tuple[memoryview, memoryview]:
+    """Returns views of the two value buffers of a shard."""
+    start, length = 48 * owned, size * array(typecode).itemsize
+    return (
+        block.buf[start : start + length].cast(typecode),
+        block.buf[start + length : start + 2 * length].cast(typecode),
+    )
+
+
+def _release(*views: memoryview) -> None:
+    for view in views:
+        view.release()
+
+
+def _shard_gatherers(name: str, neighbors: memoryview, owned: int) -> list[Any]:
+    """Returns the gatherers of the owned cells of a shard, built from its neighbor table on the first step only."""
+    gatherers = _gatherers.get(name)
+    if gatherers is None:
+        gatherers = [
+            _gatherer([neighbor for neighbor in neighbors[6 * index : 6 * index + 6] if neighbor != -1])
+            for index in range(owned)
+        ]
+        if len(_gatherers) >= _GATHERERS_SIZE:
+            _gatherers.popitem(last=False)
+        _gatherers[name] = gatherers
+    else:
+        _gatherers.move_to_end(name)
+    return gatherers
+
+
+def _step(name: str, owned: int, size: int, typecode: str, parity: int, rule: Rule[Any]) -> int:
+    """Steps the owned cells of a shard from one buffer into the other, returning the number of changed cells."""
+    # The block is attached for a single step, so workers of an executor shared by several automatons do not keep
+    # the blocks of closed automatons mapped.
+    block = SharedMemory(name=name)
+    neighbors = block.buf[: 48 * owned].cast("q")
+    buffers = _views(block, owned, size, typecode)
+    try:
+        gatherers = _shard_gatherers(name, neighbors, owned)
+        front, back = buffers[parity], buffers[1 - parity]
+        changed = 0
+        for index in range(owned):
+            value = front[index]
+            new_value = rule(value, gatherers[index](front))
+            back[index] = new_value
+            changed += new_value != value
+    finally:
+        _release(neighbors, *buffers)
+        block.close()
+    return changed
+
+
+class ShardedAutomaton(Generic[T, V]):
+    """A cellular automaton stepped in parallel over shards of a map.
+
+    Gives the same results as 'Automaton', with every step split into one task per shard, run by an executor. Each
+    shard is stepped on its own buffer in shared memory, so tasks only send the name of the buffer, and the halos of
+    the shards are exchanged after every step.
+
+    Note:
+        The map must store its values in an array, and with the default process pool the rule must be picklable,
+        such as a function defined at module level or a rule from 'life_rule'. Close the automaton, or use it as a
+        context manager, to shut down the executor and free the shared memory. A closed automaton raises 'ValueError'
+        when stepped or read.
+
+    Args:
+        state: Map of initial cell values. The map is copied and not changed by stepping.
+        rule: Function taking the value of a cell and a tuple of the values of its neighbors, returning the new value
+            of the cell.
+        shards: Number of shards, defaults to the number of CPUs.
+        tiling: Tiling to cut the map along, one of 'stripes' or 'superhexes'.
+        radius: Radius of the super-hexes for the 'superhexes' tiling.
+        executor: Executor to run the tasks in, defaults to a process pool with one process per shard.
+
+    Raises:
+        ValueError: If the map has no typecode, 'shards' is smaller than '1' or 'tiling' is not supported.
+    """
+
+    def __init__(
+        self,
+        state: HexMap[T, V],
+        rule: Rule[V],
+        shards: int | None = None,
+        tiling: str = "stripes",
+        radius: int = 4,
+        executor: Executor | None = None,
+    ):
+        if state.typecode is None:
+            raise ValueError("map must have a typecode to be sharded")
+        self.rule = rule
+        self.generation = 0
+        self.shards = partition(state, shards if shards is not None else os.cpu_count() or 1, tiling, radius)
+        self.halos = [halo(shard, state) for shard in self.shards]
+        self._map = state
+        self._typecode = state.typecode
+        self._executor = executor if executor is not None else ProcessPoolExecutor(max(1, len(self.shards)))
+        self._owns_executor = executor is None
+        self._closed = False
+
+        # Local index of every cell in each shard, owned cells first, and the shard and local index owning each cell.
+        self._cells: list[list[int]] = []
+        owner: dict[int, tuple[int, int]] = {}
+        for number, (shard, shard_halo) in enumerate(zip(self.shards, self.halos)):
+            owned = sorted(state._key_index(key) for key in shard._keys)
+            cells = owned + sorted(state._key_index(key) for key in shard_halo._keys)
+            self._cells.append(cells)
+            owner.update((index, (number, local)) for local, index in enumerate(owned))
+        self._owner = owner
+
+        self._blocks: list[SharedMemory] = []
+        self._buffers: list[tuple[memoryview, memoryview]] = []
+        self._exchange: list[list[tuple[int, int, int]]] = []
+        self._copies: dict[int, list[tuple[int, int]]] = {}
+        table, itemsize = state.neighbors(), array(state.typecode).itemsize
+        for number, cells in enumerate(self._cells):
+            owned = len(self.shards[number])
+            local = {index: position for position, index in enumerate(cells)}
+            block = SharedMemory(create=True, size=max(1, 48 * owned + 2 * len(cells) * itemsize))
+            self._blocks.append(block)
+
+            neighbors = block.buf[: 48 * owned].cast("q")
+            for position, index in enumerate(cells[:owned]):
+                for direction, neighbor in enumerate(table[6 * index : 6 * index + 6]):
+                    neighbors[6 * position + direction] = local[neighbor] if neighbor != -1 else -1
+            neighbors.release()
+
+            buffers = _views(block, owned, len(cells), state.typecode)
+            for position, index in enumerate(cells):
+                buffers[0][position] = state.data[index]
+            self._buffers.append(buffers)
+
+            exchange = []
+            for position in range(owned, len(cells)):
+                source, source_position = owner[cells[position]]
+                exchange.append((position, source, source_position))
+                self._copies.setdefault(cells[position], []).append((number, position))
+            self._exchange.append(exchange)
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise ValueError("automaton is closed")
+
+    @property
+    def state(self) -> HexMap[T, V]:
+        """Map of the current cell values, copied from the shards."""
+        self._check_open()
+        hexmap = self._map
+        state: HexMap[T, V] = HexMap(hexmap.corner, hexmap.width, hexmap.height, typecode=hexmap.typecode)
+        parity = self.generation % 2
+        for cells, buffers, shard in zip(self._cells, self._buffers, self.shards):
+            front = buffers[parity]
+            for position in range(len(shard)):
+                state.data[cells[position]] = front[position]
+        return state
+
+    def __getitem__(self, hex: T) -> V:
+        self._check_open()
+        number, position = self._owner[self._map.index(hex)]
+        return self._buffers[number][self.generation % 2][position]  # type: ignore
+
+    def __setitem__(self, hex: T, value: V) -> None:
+        self._check_open()
+        index = self._map.index(hex)
+        parity = self.generation % 2
+        for number, position in (self._owner[index], *self._copies.get(index, ())):
+            self._buffers[number][parity][position] = value  # type: ignore
+
+    def step(self, steps: int = 1) -> int:
+        """Advances the automaton a number of steps.
+
+        Args:
+            steps: Number of steps to advance.
+
+        Returns:
+            Number of cells changed by the last step.
+        """
+        self._check_open()
+        changed = 0
+        for _ in range(steps):
+            parity = self.generation % 2
+            futures = [
+                self._executor.submit(
+                    _step, block.name, len(shard), len(cells), self._typecode, parity, self.rule  # type: ignore
+                )
+                for block, shard, cells in zip(self._blocks, self.shards, self._cells)
+            ]
+            changed = sum(future.result() for future in futures)
+
+            # Every shard has written its owned cells into the back buffers, so the halos can be filled from them.
+            for buffers, exchange in zip(self._buffers, self._exchange):
+                back = buffers[1 - parity]
+                for position, source, source_position in exchange:
+                    back[position] = self._buffers[source][1 - parity][source_position]
+            self.generation += 1
+        return changed
+
+    def close(self) -> None:
+        """Shuts down the executor if it was created by the automaton and frees the shared memory."""
+        self._closed = True
+        if self._owns_executor:
+            self._executor.shutdown()
+        for buffers in self._buffers:
+            _release(*buffers)
+        self._buffers = []
+        for block in self._blocks:
+            # Workers in this process, like those of a thread pool, drop the gatherers now. Other processes drop
+            # theirs as the names fall out of their caches.
+            _gatherers.pop(block.name, None)
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+    def __enter__(self) -> ShardedAutomaton[T, V]:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
@@ -0,0 +1,174 @@
+"""Closed form conversion between hex positions and their index in a spiral.
+
+The spiral is the same as the one yielded by '_Hex.spiral()': index '0' is the center, and each ring 'n' starts at
+index '3 * n * (n - 1) + 1' with the hex position in 'direction' from the center, followed by the rest of the ring in
+the order given by 'move'. Both conversions take constant time, so a hexagonal map can be stored as a flat sequence in
+spiral order, and uniform random hex positions within a range can be drawn without creating the range.
+"""
+
+from __future__ import annotations
+
+import random
+from array import array
+from math import isqrt
+from typing import Any, TypeVar
+
+from hexpex.columns import Column, _check_lengths, column
+from hexpex.hex import AdjacentDirection, AxialPointyAdjacentDirection, Move, _Hex
+
+T = TypeVar("T", bound=_Hex)
+
+_ADJACENT_OFFSETS = ((1, 0), (0, 1), (-1, 1), (-1, 0), (0, -1), (1, -1))
+
+
+def _sides(direction: AdjacentDirection, move: Move) -> tuple[tuple[int, int, int, int], ...]:
+    """Returns the unit corner and the vector walked from it for each of the six sides of a ring."""
+    vector = direction.value
+    offsets = list(_ADJACENT_OFFSETS)
+    if move is Move.COUNTERCLOCKWISE:
+        offsets.reverse()
+    start = (offsets.index((vector.q, vector.r)) + 2) % 6
+    walk = offsets[start:] + offsets[:start]
+
+    sides = []
+    corner_q, corner_r = vector.q, vector.r
+    for dq, dr in walk:
+        sides.append((corner_q, corner_r, dq, dr))
+        corner_q, corner_r = corner_q + dq, corner_r + dr
+    return tuple(sides)
+
+
+def size(distance: int) -> int:
+    """Returns the number of hex positions within a distance of a center."""
+    return 3 * distance * (distance + 1) + 1
+
+
+def _ring(index: int) -> int:
+    """Returns the ring of a positive spiral index."""
+    # The largest ring starting at or before 'index', solving '3 * ring * (ring - 1) + 1 <= index' for 'ring'.
+    return (3 + isqrt(12 * index - 3)) // 6
+
+
+def _index(sides: tuple[tuple[int, int, int, int], ...], q: int, r: int) -> int:
+    ring = (abs(q) + abs(r) + abs(q + r)) // 2
+    if ring == 0:
+        return 0
+    for side, (corner_q, corner_r, dq, dr) in enumerate(sides):
+        offset_q, offset_r = q - ring * corner_q, r - ring * corner_r
+        step = offset_q * dq if dq != 0 else offset_r * dr
+        if 0 <= step < ring and offset_q == step * dq and offset_r == step * dr:
+            return 3 * ring * (ring - 1) + 1 + side * ring + step
+    raise AssertionError("unreachable")  # pragma: no cover​
+
+
+def _position(sides: tuple[tuple[int, int, int, int], ...], index: int) -> tuple[int, int]:
+    if index < 0:
+        raise ValueError(f"argument 'index' must not be negative, not {index}")
+    if index == 0:
+        return 0, 0
+    ring = _ring(index)
+    side, step = divmod(index - 3 * ring * (ring - 1) - 1, ring)
+    corner_q, corner_r, dq, dr = sides[side]
+    return ring * corner_q + step * dq, ring * corner_r + step * dr
+
+
+def spiral_index(center: T, hex: T, direction: AdjacentDirection, move: Move = Move.CLOCKWISE) -> int:
+    """Returns the index of a hex position in a spiral around a center.
+
+    Args:
+        center: Center of the spiral.
+        hex: Hex position to get the index of.
+        direction: Direction from the center to the first position of each ring in the spiral.
+        move: Direction to move around the spiral.
+
+    Returns:
+        Index of the hex position.
+    """
+    return _index(_sides(direction, move), hex.q - center.q, hex.r - center.r)  # type: ignore
+
+
+def spiral_at(center: T, index: int, direction: AdjacentDirection, move: Move = Move.CLOCKWISE) -> T:
+    """Returns the hex position at an index in a spiral around a center.
+
+    Args:
+        center: Center of the spiral.
+        index: Index in the spiral.
+        direction: Direction from the center to the first position of each ring in the spiral.
+        move: Direction to move around the spiral.
+
+    Returns:
+        Hex position at the index.
+    """
+    q, r = _position(_sides(direction, move), index)
+    return type(center)._from_axial(center.q + q, center.r + r)  # type: ignore
+
+
+def spiral_indices(
+    center: _Hex, q: Column, r: Column, direction: AdjacentDirection, move: Move = Move.CLOCKWISE
+) -> array[int]:
+    """Returns the spiral indexes of hex positions given as columns.
+
+    Args:
+        center: Center of the spiral.
+        q: Column of 'q' coordinates.
+        r: Column of 'r' coordinates.
+        direction: Direction from the center to the first position of each ring in the spiral.
+        move: Direction to move around the spiral.
+
+    Returns:
+        Array of indexes.
+    """
+    q, r = column(q), column(r)
+    _check_lengths(q, r)
+    sides = _sides(direction, move)
+    center_q, center_r = center.q, center.r  # type: ignore
+    return array("q", [_index(sides, q_value - center_q, r_value - center_r) for q_value, r_value in zip(q, r)])
+
+
+def spiral_positions(
+    center: _Hex, indices: Column, direction: AdjacentDirection, move: Move = Move.CLOCKWISE
+) -> tuple[array[int], array[int]]:
+    """Returns the hex positions at spiral indexes given as a column.
+
+    Args:
+        center: Center of the spiral.
+        indices: Column of indexes.
+        direction: Direction from the center to the first position of each ring in the spiral.
+        move: Direction to move around the spiral.
+
+    Returns:
+        Tuple of arrays with the 'q' and 'r' coordinates of the hex positions.
+    """
+    sides = _sides(direction, move)
+    center_q, center_r = center.q, center.r  # type: ignore
+    q_column, r_column = array("q"), array("q")
+    for index in column(indices):
+        q, r = _position(sides, index)
+        q_column.append(center_q + q)
+        r_column.append(center_r + r)
+    return q_column, r_column
+
+
+def sample(center: T, distance: int, k: int = 1, rng: random.Random | None = None) -> list[T]:
+    """Returns distinct hex positions drawn uniformly at random from the range around a center.
+
+    Note:
+        Drawing takes time proportional to 'k', not to the size of the range.
+
+    Args:
+        center: Center of the range.
+        distance: Max distance of the range from the center.
+        k: Number of hex positions to draw.
+        rng: Random number generator to draw with, defaults to the generator of the 'random' module.
+
+    Returns:
+        List of hex positions.
+    """
+    generator: Any = rng if rng is not None else random
+    sides = _sides(AxialPointyAdjacentDirection.E, Move.CLOCKWISE)
+    make = type(center)._from_axial
+    hexes = []
+    for index in generator.sample(range(size(distance)), k):
+        q, r = _position(sides, index)
+        hexes.append(make(center.q + q, center.r + r))  # type: ignore
+    return hexes
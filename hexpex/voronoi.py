@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Sequence
+from typing import Any, TypeVar
+
+from hexpex.hex import _Hex
+from hexpex.hexmap import HexMap, _region_keys
+from hexpex.hexset import HexSet
+
+T = TypeVar("T", bound=_Hex)
+
+UNASSIGNED = -1
+
+
+def _region_map(region: HexMap[T, Any] | Iterable[T], seeds: Sequence[T]) -> HexMap[T, Any]:
+    if isinstance(region, HexMap):
+        return region
+    kind, keys = _region_keys(region)
+    if not keys:
+        # An empty region gives an empty map, of the hex position class of the seeds if there are any.
+        kind = type(seeds[0]) if seeds else kind
+        return HexMap(kind._from_axial(0, 0), 0, 0, fill=0, typecode="b")  # type: ignore
+    region_map = HexMap.bounding(HexSet._from_keys(kind, keys), fill=0, typecode="b")
+    for key in keys:
+        region_map.data[region_map._key_index(key)] = 1
+    return region_map
+
+
+def voronoi(
+    seeds: Sequence[T],
+    region: HexMap[T, Any] | Iterable[T],
+    weights: Sequence[int] | None = None,
+) -> tuple[HexMap[T, int], list[int]]:
+    """Partitions a region into the cells closest to each seed.
+
+    Distances are measured in steps through the region, so cells are assigned by a wavefront expanding from all seeds
+    at once, visiting every cell of the region a single time. A cell equally close to several seeds is assigned to the
+    seed that comes first in 'seeds'.
+
+    Note:
+        If 'region' is a map, the cells with a truthy value make up the region. Seeds outside the region, and cells
+        that can not be reached from any seed, are left unassigned. An empty region gives an empty map.
+
+    Args:
+        seeds: Sequence of hex positions to partition the region between.
+        region: Map or iterable of hex positions to partition.
+        weights: Non-negative number of steps added to the distance from each seed.
+
+    Raises:
+        ValueError: If 'weights' does not have one weight per seed or has a negative weight.
+
+    Returns:
+        Map of the index of the closest seed for every cell, or '-1' if unassigned, and the number of cells assigned to
+        each seed.
+    """
+    if weights is None:
+        weights = [0] * len(seeds)
+    elif len(weights) != len(seeds):
+        raise ValueError(f"argument 'weights' must have {len(seeds)} values, not {len(weights)}")
+    elif any(weight < 0 for weight in weights):
+        raise ValueError("argument 'weights' must not have negative values")
+
+    region_map = _region_map(region, seeds)
+    size = len(region_map)
+    inside = region_map.data
+    neighbors = region_map.neighbors()
+
+    labels = array("q", [UNASSIGNED]) * size
+    distances = [-1] * size
+
+    # Bucket queue of cell indexes by distance, which with integer weights keeps the wavefront in distance order
+    # without a heap.
+    buckets: list[list[int]] = [[] for _ in range(max(weights, default=0) + 1)]
+    for label, (seed, weight) in enumerate(zip(seeds, weights)):
+        if seed not in region_map:
+            continue
+        index = region_map.index(seed)
+        if not inside[index]:
+            continue
+        # Seeds are visited in order, so a seed only replaces an earlier seed on the same cell if it is closer.
+        if distances[index] == -1 or weight < distances[index]:
+            distances[index] = weight
+            labels[index] = label
+            buckets[weight].append(index)
+
+    distance = 0
+    while distance < len(buckets):
+        for index in buckets[distance]:
+            if distances[index] != distance:
+                continue
+            label = labels[index]
+            next_distance = distance + 1
+            offset = 6 * index
+            for neighbor in neighbors[offset : offset + 6]:
+                if neighbor == -1 or not inside[neighbor]:
+                    continue
+                neighbor_distance = distances[neighbor]
+                if neighbor_distance == -1 or next_distance < neighbor_distance:
+                    if next_distance == len(buckets):
+                        buckets.append([])
+                    distances[neighbor] = next_distance
+                    labels[neighbor] = label
+                    buckets[next_distance].append(neighbor)
+                elif next_distance == neighbor_distance and label < labels[neighbor]:
+                    # The neighbor is not expanded before all cells at the current distance are, so its label can
+                    # still be lowered to the first of the equally close seeds.
+                    labels[neighbor] = label
+        buckets[distance] = []
+        distance += 1
+
+    counts = [0] * len(seeds)
+    for label in labels:
+        if label != UNASSIGNED:
+            counts[label] += 1
+
+    corner, width, height = region_map.corner, region_map.width, region_map.height
+    return HexMap(corner, width, height, typecode="q", data=labels), counts
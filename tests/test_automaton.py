@@ -0,0 +1,100 @@
+import random
+
+from hexpex.automaton import Automaton, life_rule
+from hexpex.hex import Axial, Cube
+from hexpex.hexmap import HexMap
+
+
+def naive_step(values, rule):
+    stepped = {}
+    for hex, value in values.items():
+        neighbors = [values[hex + vector] for vector in hex._adjacent_vectors if hex + vector in values]
+        stepped[hex] = rule(value, neighbors)
+    return stepped
+
+
+def fire(value, neighbors):
+    # Fuel '0' catches fire next to a burning cell '1', which burns out to '2'.
+    if value == 1:
+        return 2
+    if value == 0 and 1 in neighbors:
+        return 1
+    return value
+
+
+class TestLifeRule:
+    def test_birth(self):
+        rule = life_rule(birth={2}, survive={3, 4})
+        assert rule(0, (1, 1, 0)) == 1
+        assert rule(0, (1, 0, 0)) == 0
+
+    def test_survive(self):
+        rule = life_rule(birth={2}, survive={3, 4})
+        assert rule(1, (1, 1, 1, 0, 0, 0)) == 1
+        assert rule(1, (1, 1, 0, 0, 0, 0)) == 0
+
+
+class TestAutomaton:
+    def test_matches_naive(self):
+        rng = random.Random(7)
+        state = HexMap(Axial(0, 0), 12, 10, typecode="b")
+        for index in range(len(state.data)):
+            state.data[index] = rng.random() < 0.4
+        rule = life_rule(birth={2}, survive={3, 4})
+        automaton = Automaton(state, rule)
+        expected = dict(state)
+        for _ in range(8):
+            automaton.step()
+            expected = naive_step(expected, rule)
+            assert dict(automaton.state) == expected
+        assert automaton.generation == 8
+
+    def test_state_not_changed(self):
+        state = HexMap(Cube(0, 0, 0), 3, 3, typecode="b")
+        state[Cube(1, 1, -2)] = 1
+        automaton = Automaton(state, fire)
+        automaton.step()
+        assert state[Cube(1, 1, -2)] == 1
+        assert automaton[Cube(1, 1, -2)] == 2
+
+    def test_state_is_copy(self):
+        state = HexMap(Cube(0, 0, 0), 3, 3, typecode="b")
+        state[Cube(1, 1, -2)] = 1
+        automaton = Automaton(state, fire)
+        before = automaton.state
+        automaton.step()
+        assert before[Cube(1, 1, -2)] == 1
+        assert automaton.state[Cube(1, 1, -2)] == 2
+
+    def test_active_region(self):
+        state = HexMap(Axial(0, 0), 20, 20)
+        automaton = Automaton(state, fire)
+        assert automaton.step() == 0
+        assert automaton.active == 0
+        automaton[Axial(10, 10)] = 1
+        assert automaton.active == 7
+        changed = automaton.step()
+        assert changed == 7
+        assert automaton[Axial(11, 10)] == 1
+        assert automaton[Axial(12, 10)] == 0
+
+    def test_multiple_steps(self):
+        state = HexMap(Axial(0, 0), 5, 1, fill=None)
+        state.data[:] = [1, 0, 0, 0, 0]
+        automaton = Automaton(state, fire)
+        automaton[Axial(4, 0)] = 0
+        changed = automaton.step(3)
+        assert list(automaton.state.data) == [2, 2, 2, 1, 0]
+        assert changed == 2
+
+    def test_single_cell(self):
+        state = HexMap(Axial(0, 0), 1, 1, typecode="b")
+        automaton = Automaton(state, life_rule(birth={0}, survive=set()))
+        automaton.step()
+        assert automaton[Axial(0, 0)] == 1
+
+    def test_single_neighbor(self):
+        state = HexMap(Axial(0, 0), 2, 1, typecode="b")
+        automaton = Automaton(state, lambda value, neighbors: len(neighbors))
+        automaton.step()
+        assert list(automaton.state.data) == [1, 1]
@@ -0,0 +1,147 @@
+import ctypes
+import sys
+from array import array
+
+import pytest
+
+from hexpex import columns
+from hexpex.hex import Axial
+from hexpex.hex import AxialPointyAdjacentDirection as AxialAdjacentDirection
+from hexpex.hex import Cube
+from hexpex.hexset import HexSet
+
+# 64 bit integers in the byte order of other machines.
+SwappedInt64 = ctypes.c_int64.__ctype_be__ if sys.byteorder == "little" else ctypes.c_int64.__ctype_le__
+
+
+class Record(ctypes.Structure):
+    _fields_ = [("q", ctypes.c_int64), ("r", ctypes.c_int64)]
+
+
+class TestColumn:
+    def test_no_copy(self):
+        values = array("q", [1, 2, 3])
+        view = columns.column(values)
+        values[0] = 10
+        assert view[0] == 10
+
+    def test_byte_order_prefix(self):
+        # Arrays of ctypes integers have formats with an explicit byte order, such as '<q'.
+        values = (ctypes.c_int64 * 3)(1, -2, 3)
+        assert list(columns.to_cube(values, values)) == [-2, 4, -6]
+        assert list(columns.column((ctypes.c_uint16 * 2)(1, 2))) == [1, 2]
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            array("d", [1.0]),
+            memoryview(bytes(8)).cast("q", (1, 1)),
+            (SwappedInt64 * 2)(),
+        ],
+    )
+    def test_raises(self, values):
+        with pytest.raises(ValueError, match="column must be a one dimensional buffer of integers"):
+            columns.column(values)
+
+    def test_raises_not_contiguous(self):
+        values = memoryview((ctypes.c_int64 * 4)(1, 2, 3, 4))[::2]
+        with pytest.raises(ValueError, match="column with a byte order prefix must be a contiguous buffer"):
+            columns.column(values)
+
+
+class TestRecords:
+    def test_from_records_interleaved(self):
+        records = array("q", [1, 0, 2, -1, 3, -2])
+        q, r = columns.from_records(records)
+        records[0] = 5
+        assert list(q) == [5, 2, 3]
+        assert list(r) == [0, -1, -2]
+
+    def test_from_records_structured(self):
+        records = (Record * 2)(Record(1, 2), Record(3, 4))
+        q, r = columns.from_records(records)
+        records[1].q = 9
+        assert list(q) == [1, 9]
+        assert list(r) == [2, 4]
+
+    def test_from_records_structured_read_only(self):
+        records = (Record * 2)(Record(1, 2), Record(3, 4))
+        q, r = columns.from_records(memoryview(records).toreadonly())
+        assert list(q) == [1, 3]
+        assert list(r) == [2, 4]
+
+    def test_from_records_three_fields(self):
+        records = columns.to_records([Cube(1, 0, -1), Cube(0, 2, -2)], fields=3)
+        q, r, s = columns.from_records(records, fields=3)
+        assert list(s) == [-1, -2]
+
+    def test_from_records_raises(self):
+        with pytest.raises(ValueError, match="records must have a size divisible by 16 bytes, not 24"):
+            columns.from_records(array("q", [1, 2, 3]))
+
+    def test_from_records_raises_typecode(self):
+        with pytest.raises(ValueError, match="records must hold values of typecode 'q', not format 'i'"):
+            columns.from_records(array("i", [1, 2, 3, 4]))
+
+    def test_from_records_raises_record_size(self):
+        class SmallRecord(ctypes.Structure):
+            _fields_ = [("q", ctypes.c_int32), ("r", ctypes.c_int32)]
+
+        records = (SmallRecord * 2)(SmallRecord(1, 2), SmallRecord(3, 4))
+        with pytest.raises(ValueError, match="records must have a size of 16 bytes each, not 8"):
+            columns.from_records(records)
+        q, r = columns.from_records(records, typecode="i")
+        assert list(q) == [1, 3]
+
+    def test_from_records_raises_not_contiguous(self):
+        records = memoryview(array("q", [1, 0, 9, 9, 2, -1]))[::2]
+        with pytest.raises(ValueError, match="records must be a contiguous buffer"):
+            columns.from_records(records)
+
+    def test_to_records(self):
+        records = columns.to_records(HexSet([Axial(1, -1)]))
+        assert records == array("q", [1, -1])
+
+
+class TestColumns:
+    def test_roundtrip(self):
+        hexes = [Axial(0, 0), Axial(1, -1), Axial(-3, 2)]
+        q, r = columns.to_columns(hexes)
+        assert list(q) == [0, 1, -3]
+        assert columns.from_columns(q, r) == set(hexes)
+
+    def test_to_columns_cube(self):
+        q, r, s = columns.to_columns(HexSet([Cube(1, 0, -1)]))
+        assert (list(q), list(r), list(s)) == ([1], [0], [-1])
+        assert len(columns.to_columns([Cube(1, 0, -1)])) == 3
+
+    def test_to_columns_empty(self):
+        assert columns.to_columns([]) == (array("q"), array("q"))
+
+    def test_from_columns_kind(self):
+        hexset = columns.from_columns(array("i", [1]), array("i", [0]), kind=Cube)
+        assert hexset == {Cube(1, 0, -1)}
+
+    def test_length_raises(self):
+        with pytest.raises(ValueError, match="columns must have the same length, not 2, 1"):
+            columns.from_columns(array("q", [1, 2]), array("q", [1]))
+
+
+class TestColumnOperations:
+    def test_to_cube(self):
+        assert columns.to_cube(array("q", [1, -2]), array("q", [0, 5])) == array("q", [-1, -3])
+
+    def test_distance(self):
+        q1, r1 = array("q", [0, 2, -1]), array("q", [0, -1, 3])
+        q2, r2 = array("q", [1, 0, -1]), array("q", [0, 0, 0])
+        expected = [Axial(*a).distance(Axial(*b)) for a, b in zip(zip(q1, r1), zip(q2, r2))]
+        assert list(columns.distance(q1, r1, q2, r2)) == expected
+
+    def test_distance_broadcast(self):
+        q, r = array("q", [0, 3]), array("q", [0, -1])
+        assert list(columns.distance(q, r, 0, 0)) == [0, 3]
+
+    @pytest.mark.parametrize("direction", [AxialAdjacentDirection.SE, Axial(0, 1)])
+    def test_adjacent(self, direction):
+        q, r = columns.adjacent(array("q", [0, 5]), array("q", [0, 5]), direction)
+        assert (list(q), list(r)) == ([0, 5], [1, 6])
@@ -0,0 +1,146 @@
+import pytest
+
+from hexpex.edge import EdgeMap, HexEdge, HexVertex, VertexMap, edges, vertices
+from hexpex.hex import (
+    Axial,
+    AxialPointyAdjacentDirection,
+    Cube,
+    CubeFlatAdjacentDirection,
+)
+from hexpex.layout import _CORNER_OFFSETS
+
+
+def corner_point(vertex):
+    """Returns a vertex as coordinates in thirds of a hex, independent of its owner."""
+    dq, dr = _CORNER_OFFSETS[vertex.slot]
+    return 3 * vertex.hex.q + dq, 3 * vertex.hex.r + dr
+
+
+class TestHexEdge:
+    def test_canonical(self):
+        hex = Axial(2, -1)
+        for direction in AxialPointyAdjacentDirection:
+            neighbor = hex + direction.value
+            opposite = Axial(-direction.value.q, -direction.value.r)
+            assert HexEdge(hex, direction) == HexEdge(neighbor, opposite)
+            assert set(HexEdge(hex, direction).hexes) == {hex, neighbor}
+            assert 0 <= HexEdge(hex, direction).slot < 3
+
+    def test_directions(self):
+        hex = Cube(0, 0, 0)
+        assert HexEdge(hex, CubeFlatAdjacentDirection.N) == HexEdge(hex, Cube(0, -1, 1)) == HexEdge(hex, 4)
+        assert HexEdge(hex, 4) == HexEdge._from_owner(Cube(0, -1, 1), 1)
+
+    def test_edges_unique(self):
+        shared = [edge for hex in Axial(0, 0).range(3) for edge in edges(hex)]
+        # Every edge between two hex positions in the range is counted twice, the 42 edges on its border once.
+        assert len(shared) == 6 * 37
+        assert len(set(shared)) == (6 * 37 + 42) // 2
+
+    def test_vertices(self):
+        for hex in Axial(0, 0).range(2):
+            for index, edge in enumerate(edges(hex)):
+                start, end = edge.vertices
+                assert {start, end} == {vertices(hex)[index - 1], vertices(hex)[index]}
+
+    def test_adjacent(self):
+        edge = HexEdge(Axial(0, 0), 0)
+        adjacent = edge.adjacent()
+        assert len(set(adjacent)) == 4
+        assert all(set(edge.vertices) & set(other.vertices) for other in adjacent)
+
+    def test_packed(self):
+        for hex in Axial(0, 0).range(2):
+            for edge in edges(hex):
+                assert HexEdge._from_packed(Axial, edge.packed) == edge
+
+    def test_repr(self):
+        assert repr(HexEdge(Axial(1, 0), 3)) == "HexEdge(Axial(0, 0), 0)"
+        assert HexEdge(Axial(0, 0), 0) != Axial(0, 0)
+
+    @pytest.mark.parametrize("direction", [6, Axial(2, 0)])
+    def test_raises(self, direction):
+        with pytest.raises(ValueError, match="argument 'direction' must be an adjacent direction"):
+            HexEdge(Axial(0, 0), direction)
+
+
+class TestHexVertex:
+    def test_canonical(self):
+        for hex in Axial(0, 0).range(2):
+            for corner in range(6):
+                vertex = HexVertex(hex, corner)
+                dq, dr = _CORNER_OFFSETS[corner]
+                assert corner_point(vertex) == (3 * hex.q + dq, 3 * hex.r + dr)
+                assert hex in vertex.hexes
+
+    def test_hexes(self):
+        vertex = HexVertex(Axial(0, 0), 3)
+        assert len(set(vertex.hexes)) == 3
+        for hex in vertex.hexes:
+            assert vertex in vertices(hex)
+
+    def test_edges(self):
+        for corner in range(6):
+            vertex = HexVertex(Cube(1, -1, 0), corner)
+            assert len(set(vertex.edges)) == 3
+            assert all(vertex in edge.vertices for edge in vertex.edges)
+
+    def test_adjacent(self):
+        vertex = HexVertex(Axial(0, 0), 0)
+        x, y = corner_point(vertex)
+        for other in vertex.adjacent():
+            ox, oy = corner_point(other)
+            # Adjacent corners are one third of a hex apart in cube coordinates.
+            assert (abs(ox - x) + abs(oy - y) + abs(ox - x + oy - y)) // 2 == 2
+            assert any(vertex in edge.vertices and other in edge.vertices for edge in vertex.edges)
+
+    def test_packed(self):
+        vertex = HexVertex(Axial(-3, 5), 5)
+        assert HexVertex._from_packed(Axial, vertex.packed) == vertex
+        assert vertex != HexEdge._from_owner(vertex.hex, vertex.slot)
+
+
+class TestEdgeMap:
+    def test_storage(self):
+        walls = EdgeMap(Axial(0, 0), 3, 2, typecode="b")
+        walls[HexEdge(Axial(1, 1), 3)] = 1
+        assert walls.data[3 * 3 + 0] == 1
+        assert walls.edge(9) == HexEdge(Axial(0, 1), 0)
+        assert len(walls) == 18
+        assert list(walls)[9] == walls.edge(9)
+
+    def test_missing(self):
+        walls = EdgeMap(Axial(0, 0), 3, 2)
+        assert HexEdge(Axial(0, 0), 3) not in walls
+        assert HexEdge(Cube(0, 0, 0), 0) not in walls
+        assert HexEdge(Axial(0, 0), 0) in walls
+        with pytest.raises(KeyError):
+            _ = walls[HexEdge(Axial(0, 0), 3)]
+
+    def test_every_inner_edge(self):
+        walls = EdgeMap(Axial(0, 0), 4, 4)
+        cells = {Axial(q, r) for q in range(4) for r in range(4)}
+        inner = {edge for hex in cells for edge in edges(hex) if set(edge.hexes) <= cells}
+        assert inner <= set(walls)
+
+    def test_repr(self):
+        assert repr(EdgeMap(Axial(0, 0), 3, 2)) == "EdgeMap(Axial(0, 0), 3, 2)"
+
+    def test_raises(self):
+        with pytest.raises(ValueError, match="argument 'data' must have 18 values, not 2"):
+            EdgeMap(Axial(0, 0), 3, 2, data=[0, 0])
+        with pytest.raises(ValueError, match="arguments 'width' and 'height' must not be negative"):
+            EdgeMap(Axial(0, 0), -1, 2)
+        with pytest.raises(IndexError, match="index 18 is out of range"):
+            EdgeMap(Axial(0, 0), 3, 2).edge(18)
+        with pytest.raises(IndexError, match="index -1 is out of range"):
+            VertexMap(Axial(0, 0), 3, 2).vertex(-1)
+
+
+class TestVertexMap:
+    def test_storage(self):
+        heights = VertexMap(Cube(0, 0, 0), 2, 2, fill=0.5, typecode="d")
+        heights[HexVertex(Cube(1, 0, -1), 2)] = 2.0
+        assert heights.data[0] == 2.0
+        assert heights.vertex(3) == HexVertex(Cube(1, 0, -1), 1)
+        assert len(heights) == 8
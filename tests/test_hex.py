@@ -10,6 +10,7 @@ from hexpex.hex import Cube
 from hexpex.hex import CubeFlatAdjacentDirection as CubeAdjacentDirection
 from hexpex.hex import CubeFlatDiagonalDirection as CubeDiagonalDirection
 from hexpex.hex import Move
+from hexpex.hexset import HexSet
 
 T = TypeVar("T")
 
@@ -420,6 +421,20 @@ class TestHexRing:
         expected = set(axial_ring_1)
         assert ring == expected
 
+    def test_cube_ring_packed(self, cube_ring_2):
+        center = Cube(0, 0, 0)
+        radius = 2
+        ring = center.ring(radius, packed=True)
+        expected = set(cube_ring_2)
+        assert isinstance(ring, HexSet)
+        assert ring == expected
+
+    def test_axial_ring_empty(self):
+        center = Axial(0, 0)
+        radius = 0
+        ring = center.ring(radius)
+        assert ring == set()
+
 
 class TestHexRotate:
     def test_hex_rotate(self):
@@ -470,6 +485,38 @@ class TestHexRotate:
         expected = {Axial(2, -2), Axial(-2, 2)}
         assert rotated == expected
 
+    @pytest.mark.parametrize(
+        ("angle", "expected"),
+        [
+            (120, {Cube(-2, 2, 0), Cube(-1, -1, 2)}),
+            (-120, {Cube(0, -2, 2), Cube(2, -1, -1)}),
+            (180, {Cube(-2, 0, 2), Cube(1, -2, 1)}),
+            (360, {Cube(2, 0, -2), Cube(-1, 2, -1)}),
+        ],
+    )
+    def test_cube_rotate_multiple_steps(self, angle, expected):
+        center = Cube(0, 0, 0)
+        hexes = {Cube(2, 0, -2), Cube(-1, 2, -1)}
+        rotated = center.rotate(hexes, angle=angle)
+        assert rotated == expected
+
+    def test_axial_rotate_off_center(self):
+        center = Axial(1, 1)
+        angle = 60
+        hexes = {Axial(2, 1)}
+        rotated = center.rotate(hexes, angle=angle)
+        expected = {Axial(1, 2)}
+        assert rotated == expected
+
+    def test_axial_rotate_packed(self):
+        center = Axial(0, 0)
+        angle = 60
+        hexes = HexSet([Axial(2, 0), Axial(-2, 0)])
+        rotated = center.rotate(hexes, angle=angle, packed=True)
+        expected = {Axial(0, 2), Axial(0, -2)}
+        assert isinstance(rotated, HexSet)
+        assert rotated == expected
+
     def test_cube_rotate_raises_angle(self):
         center = Cube(0, 0, 0)
         angle = 30
@@ -591,3 +638,11 @@ class TestHexRange:
         hexes = center.range(range)
         expected = set(axial_ring_1) | {center}
         assert hexes == expected
+
+    def test_axial_range_packed(self, axial_spiral):
+        center = Axial(0, 0)
+        range = 2
+        hexes = center.range(range, packed=True)
+        expected = set(axial_spiral)
+        assert isinstance(hexes, HexSet)
+        assert hexes == expected
@@ -0,0 +1,86 @@
+from array import array
+
+import pytest
+
+from hexpex.hex import Axial, Cube
+from hexpex.hexmap import HexMap
+
+
+class TestHexMap:
+    def test_list_storage(self):
+        hexmap = HexMap(Axial(0, 0), 2, 3, fill=None)
+        assert hexmap.data == [None] * 6
+        assert len(hexmap) == 6
+
+    def test_array_storage(self):
+        hexmap = HexMap(Cube(-1, -1, 2), 3, 3, fill=1.5, typecode="d")
+        assert isinstance(hexmap.data, array)
+        assert hexmap[Cube(0, 0, 0)] == 1.5
+
+    def test_existing_data(self):
+        data = array("i", range(6))
+        hexmap = HexMap(Axial(0, 0), 3, 2, data=data)
+        hexmap[Axial(2, 1)] = 10
+        assert data[5] == 10
+        assert hexmap[Axial(1, 1)] == 4
+
+    def test_existing_data_raises(self):
+        with pytest.raises(ValueError, match="argument 'data' must have 6 values, not 2"):
+            _ = HexMap(Axial(0, 0), 3, 2, data=[0, 0])
+
+    def test_negative_size_raises(self):
+        with pytest.raises(ValueError, match="must not be negative"):
+            _ = HexMap(Axial(0, 0), -1, 2)
+
+    def test_index_hex(self):
+        hexmap = HexMap(Axial(-2, 1), 4, 3)
+        for index, hex in enumerate(hexmap):
+            assert hexmap.index(hex) == index
+            assert hexmap.hex(index) == hex
+
+    @pytest.mark.parametrize("hex", [Axial(2, 0), Axial(0, -1), Cube(0, 0, 0)])
+    def test_index_raises(self, hex):
+        hexmap = HexMap(Axial(0, 0), 2, 2)
+        with pytest.raises(KeyError):
+            hexmap.index(hex)
+        assert hex not in hexmap
+
+    def test_hex_raises(self):
+        hexmap = HexMap(Axial(0, 0), 2, 2)
+        with pytest.raises(IndexError):
+            hexmap.hex(4)
+
+    def test_contains(self):
+        hexmap = HexMap(Axial(0, 0), 2, 2)
+        assert Axial(1, 1) in hexmap
+
+    def test_bounding(self):
+        hexes = [Cube(0, 0, 0), Cube(2, -3, 1), Cube(-1, 1, 0)]
+        hexmap = HexMap.bounding(hexes, typecode="b")
+        assert hexmap.corner == Cube(-1, -3, 4)
+        assert (hexmap.width, hexmap.height) == (4, 5)
+        assert all(hex in hexmap for hex in hexes)
+
+    def test_bounding_raises(self):
+        with pytest.raises(ValueError, match="argument 'hexes' must not be empty"):
+            HexMap.bounding([])
+
+    def test_neighbors(self):
+        hexmap = HexMap(Axial(0, 0), 3, 3)
+        neighbors = hexmap.neighbors()
+        center = hexmap.index(Axial(1, 1))
+        expected = [hexmap.index(Axial(1, 1) + vector) for vector in Axial(0, 0)._adjacent_vectors]
+        assert list(neighbors[6 * center : 6 * center + 6]) == expected
+        corner = hexmap.index(Axial(0, 0))
+        expected = [hexmap.index(Axial(1, 0)), hexmap.index(Axial(0, 1)), -1, -1, -1, -1]
+        assert list(neighbors[6 * corner : 6 * corner + 6]) == expected
+        assert hexmap.neighbors() is neighbors
+
+    def test_repr(self):
+        hexmap = HexMap(Axial(0, 0), 2, 3)
+        assert repr(hexmap) == "HexMap(Axial(0, 0), 2, 3)"
+
+    def test_mapping(self):
+        hexmap = HexMap(Axial(0, 0), 1, 2)
+        hexmap[Axial(0, 1)] = 5
+        assert dict(hexmap) == {Axial(0, 0): 0, Axial(0, 1): 5}
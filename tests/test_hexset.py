@@ -0,0 +1,158 @@
+import pytest
+
+from hexpex.hex import Axial, Cube
+from hexpex.hexset import HexSet, _pack, _unpack
+
+
+class TestPacking:
+    @pytest.mark.parametrize(
+        ("q", "r"),
+        [
+            (0, 0),
+            (1, -1),
+            (-5, 3),
+            (2**40, -(2**31)),
+            (-(2**40), 2**31 - 1),
+        ],
+    )
+    def test_pack_unpack(self, q, r):
+        assert _unpack(_pack(q, r)) == (q, r)
+
+    def test_pack_is_linear(self):
+        expected = _pack(-1, 3)
+        assert _pack(2, -1) + _pack(-3, 4) == expected
+
+
+class TestHexSet:
+    def test_kind_inferred(self):
+        hexset = HexSet([Cube(0, 0, 0)])
+        expected = Cube
+        assert hexset.kind is expected
+
+    def test_kind_default(self):
+        hexset = HexSet()
+        expected = Axial
+        assert hexset.kind is expected
+
+    def test_kind_raises(self):
+        with pytest.raises(TypeError, match="hex set of kind 'Axial' can not hold 'Cube'"):
+            _ = HexSet([Axial(0, 0), Cube(0, 0, 0)])
+
+    def test_contains(self):
+        hexset = HexSet([Axial(0, 0), Axial(1, -1)])
+        assert Axial(1, -1) in hexset
+        assert Axial(1, 0) not in hexset
+        assert Cube(1, -1, 0) not in hexset
+
+    def test_iter(self):
+        hexes = {Cube(0, 0, 0), Cube(1, -1, 0), Cube(-2, 1, 1)}
+        hexset = HexSet(hexes)
+        assert set(hexset) == hexes
+        assert len(hexset) == len(hexes)
+
+    def test_repr(self):
+        assert repr(HexSet([Axial(1, 0)])) == "HexSet({Axial(1, 0)})"
+        assert repr(HexSet(kind=Cube)) == "HexSet(kind=Cube)"
+
+    def test_add_discard(self):
+        hexset = HexSet(kind=Axial)
+        hexset.add(Axial(1, 0))
+        hexset.add(Axial(1, 0))
+        hexset.discard(Axial(2, 0))
+        hexset.discard(Cube(1, 0, -1))
+        assert hexset == {Axial(1, 0)}
+        hexset.discard(Axial(1, 0))
+        assert len(hexset) == 0
+
+    def test_clear_copy(self):
+        hexset = HexSet([Axial(0, 0)])
+        copied = hexset.copy()
+        hexset.clear()
+        assert len(hexset) == 0
+        assert copied == {Axial(0, 0)}
+
+
+class TestHexSetAlgebra:
+    @pytest.fixture
+    def first(self):
+        return HexSet([Axial(0, 0), Axial(1, 0), Axial(2, 0)])
+
+    @pytest.fixture
+    def second(self):
+        return HexSet([Axial(1, 0), Axial(2, 0), Axial(3, 0)])
+
+    def test_union(self, first, second):
+        result = first | second
+        assert isinstance(result, HexSet)
+        assert result == {Axial(0, 0), Axial(1, 0), Axial(2, 0), Axial(3, 0)}
+
+    def test_intersection(self, first, second):
+        result = first & second
+        assert isinstance(result, HexSet)
+        assert result == {Axial(1, 0), Axial(2, 0)}
+
+    def test_difference(self, first, second):
+        result = first - second
+        assert isinstance(result, HexSet)
+        assert result == {Axial(0, 0)}
+
+    def test_symmetric_difference(self, first, second):
+        result = first ^ second
+        assert isinstance(result, HexSet)
+        assert result == {Axial(0, 0), Axial(3, 0)}
+
+    def test_inplace(self, first, second):
+        result = first.copy()
+        result |= second
+        assert result == first | second
+        result = first.copy()
+        result &= second
+        assert result == first & second
+        result = first.copy()
+        result -= second
+        assert result == first - second
+        result = first.copy()
+        result ^= second
+        assert result == first ^ second
+
+    def test_inplace_with_set(self, first):
+        other = {Axial(0, 0), Axial(5, 0)}
+        result = first.copy()
+        result |= other
+        assert result == set(first) | other
+        result = first.copy()
+        result &= other
+        assert result == set(first) & other
+        result = first.copy()
+        result -= other
+        assert result == set(first) - other
+        result = first.copy()
+        result ^= other
+        assert result == set(first) ^ other
+
+    def test_with_set(self, first):
+        other = {Axial(0, 0), Axial(5, 0)}
+        assert first | other == set(first) | other
+        assert first & other == set(first) & other
+        assert first - other == set(first) - other
+        assert first ^ other == set(first) ^ other
+
+    def test_comparison(self, first, second):
+        subset = HexSet([Axial(1, 0)])
+        assert subset <= first
+        assert first >= subset
+        assert not first <= second
+        assert subset <= set(first)
+        assert first >= {Axial(1, 0)}
+        assert first != second
+
+    def test_isdisjoint(self, first, second):
+        other = HexSet([Axial(9, 9)])
+        assert first.isdisjoint(other)
+        assert not first.isdisjoint(second)
+        assert first.isdisjoint([Axial(9, 9)])
+
+    def test_different_kinds(self, first):
+        cubes = HexSet([Cube(0, 0, 0)])
+        assert len(first & cubes) == 0
+        assert first != cubes
@@ -0,0 +1,87 @@
+import random
+
+import pytest
+
+from hexpex import hierarchy
+from hexpex.hex import Axial, Cube
+from hexpex.hexmap import HexMap
+from hexpex.hierarchy import Pyramid
+
+
+class TestHierarchy:
+    @pytest.mark.parametrize("radius", [1, 2, 3])
+    def test_parent_holds_hex(self, radius):
+        for hex in Axial(0, 0).range(12):
+            assert hex in hierarchy.children(hierarchy.parent(hex, radius), radius)
+
+    def test_children_tile(self):
+        parents = {hierarchy.parent(hex) for hex in Axial(0, 0).range(10)}
+        covered = [child for parent in parents for child in hierarchy.children(parent)]
+        assert len(covered) == len(set(covered))
+
+    def test_adjacent_parents(self):
+        radius = 2
+        origin = Cube(0, 0, 0)
+        for neighbor in origin.ring(1):
+            assert hierarchy.center(neighbor, radius).distance(hierarchy.center(origin, radius)) == 2 * radius + 1
+
+    def test_levels(self):
+        hex = Axial(17, -40)
+        assert hierarchy.parent(hex, levels=2) == hierarchy.parent(hierarchy.parent(hex))
+        assert hierarchy.parent(hex, levels=0) == hex
+        top = hierarchy.parent(hex, radius=2, levels=3)
+        assert hierarchy.center(top, radius=2, levels=3).distance(hex) <= 2 + 2 * 5 + 2 * 25
+
+    def test_kind(self):
+        assert isinstance(hierarchy.parent(Cube(3, -1, -2)), Cube)
+        assert hierarchy.children(Cube(0, 0, 0)).kind is Cube
+
+    @pytest.mark.parametrize(
+        ("radius", "levels", "match"),
+        [(0, 1, "argument 'radius' must be at least 1, not 0"), (1, -1, "argument 'levels' must not be negative")],
+    )
+    def test_raises(self, radius, levels, match):
+        with pytest.raises(ValueError, match=match):
+            hierarchy.parent(Axial(0, 0), radius, levels)
+
+
+def brute_force(hexmap, radius, level, aggregate):
+    groups = {}
+    for hex, value in hexmap.items():
+        groups.setdefault(hierarchy.parent(hex, radius, level), []).append(value)
+    functions = {"sum": sum, "min": min, "max": max, "mean": lambda values: sum(values) / len(values)}
+    return {parent: functions[aggregate](values) for parent, values in groups.items()}
+
+
+class TestPyramid:
+    @pytest.fixture
+    def hexmap(self):
+        rng = random.Random(3)
+        hexmap = HexMap(Axial(-5, -4), 14, 11, typecode="q")
+        for index in range(len(hexmap.data)):
+            hexmap.data[index] = rng.randrange(100)
+        return hexmap
+
+    @pytest.mark.parametrize("aggregate", ["sum", "min", "max", "mean"])
+    def test_matches_brute_force(self, hexmap, aggregate):
+        pyramid = Pyramid(hexmap, radius=1, levels=2, aggregate=aggregate)
+        rng = random.Random(5)
+        hexes = list(hexmap)
+        for _ in range(20):
+            pyramid[rng.choice(hexes)] = rng.randrange(100)
+        for level in (1, 2):
+            expected = brute_force(hexmap, 1, level, aggregate)
+            assert {parent: pyramid.value(parent, level) for parent in expected} == pytest.approx(expected)
+
+    def test_level_zero(self, hexmap):
+        pyramid = Pyramid(hexmap)
+        assert pyramid.value(Axial(0, 0), 0) == hexmap[Axial(0, 0)]
+
+    def test_value_raises(self, hexmap):
+        pyramid = Pyramid(hexmap)
+        with pytest.raises(KeyError):
+            pyramid.value(Axial(100, 100), 1)
+
+    def test_aggregate_raises(self, hexmap):
+        with pytest.raises(ValueError, match="argument 'aggregate' must be one of sum, min, max, mean, not 'median'"):
+            Pyramid(hexmap, aggregate="median")
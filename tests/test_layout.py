@@ -0,0 +1,51 @@
+from math import isclose, sqrt
+
+import pytest
+
+from hexpex.hex import Axial, Cube
+from hexpex.layout import Layout, Orientation
+
+
+def assert_points_close(points, expected):
+    assert len(points) == len(expected)
+    for (x1, y1), (x2, y2) in zip(points, expected):
+        assert isclose(x1, x2, abs_tol=1e-9)
+        assert isclose(y1, y2, abs_tol=1e-9)
+
+
+class TestLayout:
+    @pytest.mark.parametrize(
+        ("orientation", "hex", "expected"),
+        [
+            (Orientation.POINTY, Axial(1, 0), (sqrt(3), 0.0)),
+            (Orientation.POINTY, Axial(0, 1), (sqrt(3) / 2, 1.5)),
+            (Orientation.FLAT, Cube(1, 0, -1), (1.5, sqrt(3) / 2)),
+            (Orientation.FLAT, Cube(0, 1, -1), (0.0, sqrt(3))),
+        ],
+    )
+    def test_to_pixel(self, orientation, hex, expected):
+        layout = Layout(orientation)
+        assert_points_close([layout.to_pixel(hex)], [expected])
+
+    def test_to_pixel_size_origin(self):
+        layout = Layout(Orientation.FLAT, size=(2.0, 3.0), origin=(10.0, 20.0))
+        expected = (13.0, 20.0 + 3 * sqrt(3) / 2)
+        assert_points_close([layout.to_pixel(Axial(1, 0))], [expected])
+
+    def test_pointy_corners(self):
+        layout = Layout(Orientation.POINTY, size=2)
+        corners = layout.corners(Axial(0, 0))
+        expected = [(sqrt(3), 1.0), (0.0, 2.0), (-sqrt(3), 1.0), (-sqrt(3), -1.0), (0.0, -2.0), (sqrt(3), -1.0)]
+        assert_points_close(corners, expected)
+
+    def test_flat_corners(self):
+        layout = Layout(Orientation.FLAT)
+        corners = layout.corners(Axial(0, 0))
+        half = sqrt(3) / 2
+        expected = [(0.5, half), (-0.5, half), (-1.0, 0.0), (-0.5, -half), (0.5, -half), (1.0, 0.0)]
+        assert_points_close(corners, expected)
+
+    def test_repr(self):
+        layout = Layout(Orientation.FLAT)
+        expected = "Layout(Orientation.FLAT, (1.0, 1.0), (0.0, 0.0))"
+        assert repr(layout) == expected
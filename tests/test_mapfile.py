@@ -0,0 +1,136 @@
+import pytest
+
+from hexpex import mapfile
+from hexpex.hex import Axial, Cube
+from hexpex.hexmap import HexMap
+
+
+@pytest.fixture
+def hexmap():
+    hexmap = HexMap(Axial(-2, 3), 4, 3, typecode="d")
+    for index in range(len(hexmap.data)):
+        hexmap.data[index] = index / 2
+    return hexmap
+
+
+@pytest.fixture
+def byteswapped(tmp_path):
+    hexmap = HexMap(Axial(0, 0), 2, 1, typecode="i")
+    hexmap.data[:] = type(hexmap.data)("i", [1, 256])
+    path = tmp_path / "world.hexmap"
+    mapfile.save(hexmap, path)
+    raw = bytearray(path.read_bytes())
+    raw[14:15] = b">" if raw[14:15] == b"<" else b"<"
+    raw[64:] = bytes(reversed(raw[64:68])) + bytes(reversed(raw[68:72]))
+    path.write_bytes(bytes(raw))
+    return path
+
+
+class TestMapFile:
+    def test_roundtrip(self, hexmap, tmp_path):
+        path = tmp_path / "world.hexmap"
+        mapfile.save(hexmap, path)
+        loaded = mapfile.load(path)
+        assert isinstance(loaded.data, memoryview)
+        assert loaded.corner == hexmap.corner
+        assert (loaded.width, loaded.height, loaded.typecode) == (4, 3, "d")
+        assert dict(loaded) == dict(hexmap)
+
+    def test_header_size(self, hexmap, tmp_path):
+        path = tmp_path / "world.hexmap"
+        mapfile.save(hexmap, path)
+        assert path.stat().st_size == 64 + len(hexmap) * 8
+
+    def test_cube(self, tmp_path):
+        hexmap = HexMap(Cube(1, -1, 0), 2, 2, typecode="i", fill=7)
+        path = tmp_path / "world.hexmap"
+        mapfile.save(hexmap, path)
+        loaded = mapfile.load(path)
+        assert loaded.kind is Cube
+        assert loaded[Cube(2, 0, -2)] == 7
+
+    def test_read_only(self, hexmap, tmp_path):
+        path = tmp_path / "world.hexmap"
+        mapfile.save(hexmap, path)
+        loaded = mapfile.load(path)
+        with pytest.raises(TypeError):
+            loaded[Axial(-2, 3)] = 1.0
+
+    def test_write(self, hexmap, tmp_path):
+        path = tmp_path / "world.hexmap"
+        mapfile.save(hexmap, path)
+        with mapfile.load(path, mode="r+") as loaded:
+            loaded[Axial(-1, 4)] = 42.0
+            loaded.flush()
+            with mapfile.load(path) as reloaded:
+                assert reloaded[Axial(-1, 4)] == 42.0
+
+    def test_close(self, hexmap, tmp_path):
+        path = tmp_path / "world.hexmap"
+        mapfile.save(hexmap, path)
+        with mapfile.load(path) as loaded:
+            assert isinstance(loaded, mapfile.MappedHexMap)
+        assert loaded._buffer.closed
+        with pytest.raises(ValueError):
+            loaded[Axial(-2, 3)]
+        loaded.close()
+
+    def test_copy_on_write(self, hexmap, tmp_path):
+        path = tmp_path / "world.hexmap"
+        mapfile.save(hexmap, path)
+        loaded = mapfile.load(path, mode="c")
+        loaded[Axial(-1, 4)] = 42.0
+        assert mapfile.load(path)[Axial(-1, 4)] == hexmap[Axial(-1, 4)]
+
+    @pytest.mark.parametrize("mode", ["r", "c"])
+    def test_byteswapped(self, byteswapped, mode):
+        with mapfile.load(byteswapped, mode) as loaded:
+            assert list(loaded.data) == [1, 256]
+            loaded.flush()
+
+    def test_byteswapped_raises_write(self, byteswapped):
+        with pytest.raises(ValueError, match="can not be opened with mode 'r\\+'"):
+            mapfile.load(byteswapped, mode="r+")
+
+    def test_save_raises_without_typecode(self, tmp_path):
+        hexmap = HexMap(Axial(0, 0), 1, 1)
+        with pytest.raises(ValueError, match="map must have a typecode to be saved"):
+            mapfile.save(hexmap, tmp_path / "world.hexmap")
+
+    def test_load_raises_mode(self, tmp_path):
+        with pytest.raises(ValueError, match="argument 'mode' must be one of"):
+            mapfile.load(tmp_path / "world.hexmap", mode="w")
+
+    @pytest.mark.parametrize(
+        ("change", "match"),
+        [
+            (lambda raw: raw[:32], "file is too small to be a map file"),
+            (lambda raw: b"NOTAMAP!" + raw[8:], "file is not a map file"),
+            (lambda raw: raw[:8] + b"\x02\x00" + raw[10:], "map file version 2 is not supported"),
+            (lambda raw: raw[:10] + b"X" + raw[11:], "map file coordinate system b'X' is not supported"),
+            (lambda raw: raw[:12] + b"\x03\x00" + raw[14:], "have a size of 3"),
+            (lambda raw: raw[:-8], "map file is truncated"),
+        ],
+    )
+    def test_load_raises_invalid(self, hexmap, tmp_path, change, match):
+        path = tmp_path / "world.hexmap"
+        mapfile.save(hexmap, path)
+        path.write_bytes(change(path.read_bytes()))
+        with pytest.raises(ValueError, match=match):
+            mapfile.load(path)
+
+    def test_load_invalid_closes_buffer(self, hexmap, tmp_path, monkeypatch):
+        buffers = []
+
+        class Recorded(mapfile.mmap.mmap):
+            def __init__(self, *args, **kwargs):
+                buffers.append(self)
+
+        monkeypatch.setattr(mapfile.mmap, "mmap", Recorded)
+        path = tmp_path / "world.hexmap"
+        mapfile.save(hexmap, path)
+        path.write_bytes(path.read_bytes()[:-8])
+        with pytest.raises(ValueError, match="map file is truncated"):
+            mapfile.load(path)
+        assert len(buffers) == 1
+        assert buffers[0].closed
@@ -0,0 +1,70 @@
+import random
+
+import pytest
+
+from hexpex import morphology
+from hexpex.hex import Axial, Cube
+from hexpex.hexmap import HexMap
+from hexpex.hexset import HexSet
+
+
+@pytest.fixture
+def region():
+    rng = random.Random(19)
+    return HexSet(hex for hex in Axial(0, 0).range(8) if rng.random() < 0.7)
+
+
+def minkowski(region, element):
+    return {Axial(hex.q + vector.q, hex.r + vector.r) for hex in region for vector in element}
+
+
+def eroded(region, element):
+    candidates = minkowski(region, [Axial(-vector.q, -vector.r) for vector in element])
+    return {hex for hex in candidates if all(Axial(hex.q + v.q, hex.r + v.r) in region for v in element)}
+
+
+class TestMorphology:
+    @pytest.mark.parametrize("radius", [0, 1, 2, 4])
+    def test_dilate_radius(self, region, radius):
+        assert morphology.dilate(region, radius) == minkowski(region, Axial(0, 0).range(radius))
+
+    @pytest.mark.parametrize("radius", [0, 1, 2, 4])
+    def test_erode_radius(self, region, radius):
+        assert morphology.erode(region, radius) == eroded(region, Axial(0, 0).range(radius))
+
+    def test_element(self, region):
+        element = [Axial(0, 0), Axial(2, -1), Axial(0, 3)]
+        assert morphology.dilate(region, element) == minkowski(region, element)
+        assert morphology.erode(region, element) == eroded(region, element)
+
+    def test_opening_closing(self, region):
+        element = Axial(0, 0).range(1)
+        assert morphology.opening(region, 1) == minkowski(eroded(region, element), element)
+        assert morphology.closing(region, 1) == eroded(minkowski(region, element), element)
+        assert morphology.opening(region, element) == morphology.opening(region, 1)
+        assert morphology.closing(region, element) == morphology.closing(region, 1)
+
+    def test_erode_line(self):
+        line = [Axial(q, 0) for q in range(10)]
+        assert morphology.erode(line) == set()
+        assert morphology.opening(line) == set()
+
+    def test_map(self):
+        mask = HexMap(Cube(0, 0, 0), 5, 5, fill=1)
+        mask[Cube(2, 2, -4)] = 0
+        closed = morphology.closing(mask)
+        assert isinstance(closed, HexSet) and closed.kind is Cube
+        assert Cube(2, 2, -4) in closed
+        assert morphology.erode(mask, 2) == set()
+
+    def test_kind(self):
+        assert morphology.dilate([Cube(0, 0, 0)]).kind is Cube
+        assert morphology.dilate([]) == set()
+
+    @pytest.mark.parametrize(
+        ("structure", "match"),
+        [(-1, "argument 'structure' must not be negative, not -1"), ([], "argument 'structure' must not be empty")],
+    )
+    def test_raises(self, region, structure, match):
+        with pytest.raises(ValueError, match=match):
+            morphology.dilate(region, structure)
@@ -0,0 +1,78 @@
+from hexpex.hex import Axial, Cube
+from hexpex.hexmap import HexMap
+from hexpex.hexset import HexSet
+from hexpex.layout import Layout, Orientation
+from hexpex.outline import outline, outlines
+
+
+def rounded(points):
+    return {(round(x, 6), round(y, 6)) for x, y in points}
+
+
+class TestOutline:
+    def test_single_hex(self):
+        layout = Layout(Orientation.POINTY)
+        boundaries = outline([Axial(0, 0)], layout)
+        assert len(boundaries) == 1
+        assert not boundaries[0].hole
+        assert rounded(boundaries[0].points) == rounded(layout.corners(Axial(0, 0)))
+
+    def test_empty(self):
+        layout = Layout(Orientation.POINTY)
+        assert outline([], layout) == []
+
+    def test_range(self):
+        layout = Layout(Orientation.FLAT)
+        boundaries = outline(Cube(0, 0, 0).range(2, packed=True), layout)
+        # Six corner hexes with three outer edges each and six side hexes with two outer edges each.
+        expected_points = 6 * 3 + 6 * 2
+        assert len(boundaries) == 1
+        assert len(boundaries[0].points) == expected_points
+
+    def test_hole(self):
+        layout = Layout(Orientation.POINTY)
+        boundaries = outline(Axial(0, 0).ring(1), layout)
+        outer = [boundary for boundary in boundaries if not boundary.hole]
+        holes = [boundary for boundary in boundaries if boundary.hole]
+        assert len(outer) == 1
+        assert len(holes) == 1
+        assert rounded(holes[0].points) == rounded(layout.corners(Axial(0, 0)))
+
+    def test_disjoint_regions(self):
+        layout = Layout(Orientation.POINTY)
+        boundaries = outline(HexSet([Axial(0, 0), Axial(5, 0)]), layout)
+        assert len(boundaries) == 2
+        assert not any(boundary.hole for boundary in boundaries)
+
+    def test_hexmap_mask(self):
+        layout = Layout(Orientation.POINTY)
+        mask = HexMap(Axial(0, 0), 3, 3, typecode="b")
+        mask[Axial(1, 1)] = 1
+        (boundary,) = outline(mask, layout)
+        assert rounded(boundary.points) == rounded(layout.corners(Axial(1, 1)))
+
+    def test_clockwise_outer(self):
+        layout = Layout(Orientation.POINTY)
+        (boundary,) = outline([Axial(0, 0), Axial(1, 0)], layout)
+        points = boundary.points
+        area = sum(x1 * y2 - x2 * y1 for (x1, y1), (x2, y2) in zip(points, points[1:] + points[:1]))
+        # With the y-axis pointing down a positive signed area is clockwise on screen.
+        assert area > 0
+
+
+class TestOutlines:
+    def test_labels(self):
+        layout = Layout(Orientation.POINTY)
+        labels = {hex: "outer" for hex in Axial(0, 0).ring(1)}
+        labels[Axial(0, 0)] = "inner"
+        boundaries = outlines(labels, layout)
+        assert sorted((len(b.points), b.hole) for b in boundaries["outer"]) == [(6, True), (18, False)]
+        assert [(len(b.points), b.hole) for b in boundaries["inner"]] == [(6, False)]
+
+    def test_matches_outline(self):
+        layout = Layout(Orientation.FLAT)
+        region = Axial(0, 0).range(2)
+        labels = dict.fromkeys(region, 1)
+        (batched,) = outlines(labels, layout)[1]
+        (single,) = outline(region, layout)
+        assert rounded(batched.points) == rounded(single.points)
@@ -0,0 +1,200 @@
+import math
+import random
+
+import pytest
+
+from hexpex.edge import EdgeMap, HexEdge
+from hexpex.hex import Axial, Cube
+from hexpex.hexmap import HexMap
+from hexpex.path import PathCache, find_path, find_paths
+
+
+def dijkstra(cost, start):
+    distances = {start: 0}
+    queue = [start]
+    while queue:
+        queue.sort(key=distances.get, reverse=True)
+        hex = queue.pop()
+        for neighbor in hex.ring(1):
+            if neighbor in cost:
+                total = distances[hex] + cost[neighbor]
+                if total < distances.get(neighbor, math.inf):
+                    distances[neighbor] = total
+                    queue.append(neighbor)
+    return distances
+
+
+def path_cost(cost, path):
+    return sum(cost[hex] for hex in path[1:])
+
+
+@pytest.fixture
+def cost():
+    rng = random.Random(13)
+    cost = HexMap(Axial(0, 0), 12, 10, typecode="d")
+    for index in range(len(cost.data)):
+        cost.data[index] = math.inf if rng.random() < 0.2 else rng.randrange(1, 6)
+    cost[Axial(0, 0)] = cost[Axial(11, 9)] = 1
+    return cost
+
+
+class TestFindPath:
+    def test_cheapest(self, cost):
+        start = Axial(0, 0)
+        distances = dijkstra(cost, start)
+        for goal in list(cost)[::7]:
+            path = find_path(start, goal, cost)
+            if distances.get(goal, math.inf) == math.inf:
+                assert path is None
+                continue
+            assert path[0] == start and path[-1] == goal
+            assert all(a.distance(b) == 1 for a, b in zip(path, path[1:]))
+            assert path_cost(cost, path) == distances[goal]
+
+    @pytest.mark.parametrize("min_cost", [0, 1])
+    def test_min_cost(self, cost, min_cost):
+        start = Axial(0, 0)
+        distances = dijkstra(cost, start)
+        for goal in list(cost)[::7]:
+            path = find_path(start, goal, cost, min_cost=min_cost)
+            if distances.get(goal, math.inf) == math.inf:
+                assert path is None
+            else:
+                assert path_cost(cost, path) == distances[goal]
+
+    def test_same_hex(self, cost):
+        assert find_path(Axial(3, 3), Axial(3, 3), cost) == [Axial(3, 3)]
+
+    def test_walled(self):
+        cost = HexMap(Cube(0, 0, 0), 3, 3, fill=1)
+        for r in range(3):
+            cost[Cube(1, r, -1 - r)] = math.inf
+        assert find_path(Cube(0, 0, 0), Cube(2, 0, -2), cost) is None
+
+    def test_walls(self):
+        cost = HexMap(Axial(0, 0), 3, 3, fill=1)
+        walls = EdgeMap(Axial(0, 0), 3, 3, typecode="b")
+        assert find_path(Axial(0, 0), Axial(1, 0), cost, walls) == [Axial(0, 0), Axial(1, 0)]
+        walls[HexEdge(Axial(0, 0), 0)] = 1
+        assert find_path(Axial(0, 0), Axial(1, 0), cost, walls) == [Axial(0, 0), Axial(0, 1), Axial(1, 0)]
+        walls[HexEdge(Axial(0, 1), 4)] = 1
+        assert find_path(Axial(0, 0), Axial(1, 0), cost, walls) is None
+        assert find_path(Axial(1, 0), Axial(0, 0), cost, walls) is None
+
+    def test_raises(self, cost):
+        with pytest.raises(KeyError):
+            find_path(Axial(0, 0), Axial(20, 0), cost)
+        with pytest.raises(ValueError, match="argument 'walls' must cover the same hex positions as the cost map"):
+            find_path(Axial(0, 0), Axial(1, 0), cost, EdgeMap(Axial(0, 0), 2, 2))
+
+
+class TestFindPaths:
+    def test_cheapest(self, cost):
+        goal = Axial(0, 0)
+        starts = list(cost)
+        paths = find_paths(starts, goal, cost)
+        assert list(paths) == starts
+        for start, path in paths.items():
+            expected = find_path(start, goal, cost)
+            if expected is None:
+                assert path is None
+                continue
+            assert path[0] == start and path[-1] == goal
+            assert path_cost(cost, path) == path_cost(cost, expected)
+
+    def test_cheaper_after_queued(self):
+        # Axial(1, 1) is queued through the expensive Axial(1, 0) before the cheaper Axial(0, 1) is expanded.
+        cost = HexMap(Axial(0, 0), 3, 2, fill=1)
+        cost[Axial(1, 0)] = 10
+        cost[Axial(1, 1)] = 20
+        paths = find_paths([Axial(2, 1)], Axial(0, 0), cost)
+        assert paths == {Axial(2, 1): [Axial(2, 1), Axial(2, 0), Axial(1, 0), Axial(0, 0)]}
+
+    def test_walls(self):
+        cost = HexMap(Axial(0, 0), 3, 3, fill=1)
+        walls = EdgeMap(Axial(0, 0), 3, 3, fill=0)
+        for edge in (HexEdge(Axial(0, 0), 0), HexEdge(Axial(0, 0), 1)):
+            walls[edge] = 1
+        paths = find_paths([Axial(0, 0), Axial(2, 0)], Axial(1, 0), cost, walls)
+        assert paths == {Axial(0, 0): None, Axial(2, 0): [Axial(2, 0), Axial(1, 0)]}
+
+    def test_goal_in_starts(self, cost):
+        assert find_paths([Axial(0, 0)], Axial(0, 0), cost) == {Axial(0, 0): [Axial(0, 0)]}
+
+    def test_raises(self, cost):
+        with pytest.raises(KeyError):
+            find_paths([Axial(20, 0)], Axial(0, 0), cost)
+
+
+class TestPathCache:
+    def test_hits(self, cost):
+        cache = PathCache({"foot": cost})
+        first = cache.find(Axial(0, 0), Axial(11, 9), "foot")
+        assert cache.find(Axial(0, 0), Axial(11, 9), "foot") == first == find_path(Axial(0, 0), Axial(11, 9), cost)
+        assert (cache.hits, cache.misses, cache.hit_rate) == (1, 1, 0.5)
+
+    def test_hit_rate_empty(self, cost):
+        assert PathCache({"foot": cost}).hit_rate == 0.0
+
+    def test_profiles(self, cost):
+        flat = HexMap(Axial(0, 0), 12, 10, fill=1)
+        cache = PathCache({"foot": cost, "flying": flat})
+        assert len(cache.find(Axial(0, 0), Axial(11, 9), "flying")) == 21
+        assert cache.find(Axial(0, 0), Axial(11, 9), "foot") == find_path(Axial(0, 0), Axial(11, 9), cost)
+        assert len(cache) == 2
+
+    def test_eviction(self, cost):
+        cache = PathCache({"foot": cost}, maxsize=2)
+        cache.find(Axial(0, 0), Axial(11, 9), "foot")
+        cache.find(Axial(0, 0), Axial(1, 0), "foot")
+        cache.find(Axial(0, 0), Axial(11, 9), "foot")
+        cache.find(Axial(0, 0), Axial(0, 1), "foot")
+        assert len(cache) == 2
+        cache.find(Axial(0, 0), Axial(11, 9), "foot")
+        assert cache.hits == 2
+
+    def test_targeted_invalidation(self):
+        cost = HexMap(Axial(0, 0), 10, 10, fill=1)
+        cache = PathCache({"foot": cost})
+        near = cache.find(Axial(0, 0), Axial(3, 0), "foot")
+        cache.find(Axial(0, 9), Axial(3, 9), "foot")
+        assert cache.set_cost(near[2], 10, "foot") == 1
+        assert len(cache) == 1
+        assert path_cost(cost, cache.find(Axial(0, 0), Axial(3, 0), "foot")) == 4
+
+    def test_neighbor_invalidation(self):
+        cost = HexMap(Axial(0, 0), 10, 10, fill=5)
+        cache = PathCache({"foot": cost})
+        cache.find(Axial(0, 1), Axial(3, 1), "foot")
+        assert cache.set_cost(Axial(1, 0), 1, "foot") == 1
+        assert cache.set_cost(Axial(8, 8), 1, "foot") == 0
+
+    def test_failures_invalidated(self):
+        cost = HexMap(Axial(0, 0), 3, 3, fill=1)
+        for r in range(3):
+            cost[Axial(1, r)] = math.inf
+        cache = PathCache({"foot": cost})
+        assert cache.find(Axial(0, 0), Axial(2, 0), "foot") is None
+        assert cache.find(Axial(0, 0), Axial(2, 0), "foot") is None
+        cache.set_cost(Axial(1, 2), 1, "foot")
+        assert cache.find(Axial(0, 0), Axial(2, 0), "foot") is not None
+        assert cache.misses == 2
+
+    def test_cheaper_estimate(self):
+        cost = HexMap(Axial(0, 0), 6, 1, fill=4)
+        cache = PathCache({"foot": cost})
+        cache.find(Axial(0, 0), Axial(5, 0), "foot")
+        for q in range(6):
+            cost[Axial(q, 0)] = 1
+        cache.invalidate(Axial(3, 0), "foot")
+        assert path_cost(cost, cache.find(Axial(0, 0), Axial(5, 0), "foot")) == 5
+
+    def test_clear(self, cost):
+        cache = PathCache({"foot": cost})
+        cache.find(Axial(0, 0), Axial(11, 9), "foot")
+        cache.clear()
+        assert (len(cache), cache.hits, cache.misses) == (0, 0, 0)
+
+    def test_raises(self, cost):
+        with pytest.raises(ValueError, match="argument 'maxsize' must be at least 1, not 0"):
+            PathCache({"foot": cost}, maxsize=0)
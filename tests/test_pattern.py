@@ -0,0 +1,75 @@
+import pytest
+
+from hexpex.hex import Axial, Cube
+from hexpex.hexmap import HexMap
+from hexpex.hexset import HexSet
+from hexpex.pattern import Pattern
+
+
+def brute_force(pattern, region):
+    origin = Axial(0, 0)
+    reflected = {Axial(hex.q, -hex.q - hex.r) for hex in pattern}
+    shapes = [origin.rotate(shape, angle) for shape in (pattern, reflected) for angle in range(0, 360, 60)]
+    found = set()
+    for shape in shapes:
+        first = next(iter(shape))
+        for anchor in region:
+            placed = frozenset(anchor - first + hex for hex in shape)
+            if placed <= region:
+                found.add(placed)
+    return found
+
+
+class TestPattern:
+    @pytest.mark.parametrize(
+        ("hexes", "expected"),
+        [
+            ([Axial(0, 0)], 1),
+            ([Axial(0, 0), Axial(1, 0)], 3),
+            ([Axial(0, 0), Axial(1, 0), Axial(2, 0)], 3),
+            (Axial(0, 0).range(1), 1),
+            ([Axial(0, 0), Axial(1, 0), Axial(2, -1)], 6),
+            ([Axial(0, 0), Axial(1, 0), Axial(2, 0), Axial(2, -1)], 12),
+        ],
+    )
+    def test_orientations(self, hexes, expected):
+        assert len(Pattern(hexes).orientations) == expected
+
+    def test_no_reflection(self):
+        hexes = [Axial(0, 0), Axial(1, 0), Axial(2, 0), Axial(2, -1)]
+        assert len(Pattern(hexes, reflect=False).orientations) == 6
+
+    def test_empty_raises(self):
+        with pytest.raises(ValueError, match="argument 'hexes' must not be empty"):
+            _ = Pattern([])
+
+    def test_len_repr(self):
+        pattern = Pattern([Axial(0, 0), Axial(1, 0)])
+        assert len(pattern) == 2
+        assert repr(pattern) == "Pattern(2 hexes, 3 orientations)"
+
+    def test_find_matches_brute_force(self):
+        shape = {Axial(0, 0), Axial(1, 0), Axial(2, 0), Axial(2, -1)}
+        region = Axial(0, 0).range(3) - {Axial(0, 0), Axial(2, -2)}
+        matches = Pattern(shape).find(region)
+        found = {frozenset(match.hexes) for match in matches}
+        assert len(found) == len(matches)
+        assert found == brute_force(shape, region)
+
+    def test_find_kinds(self):
+        pattern = Pattern(Cube(0, 0, 0).range(1))
+        region = Cube(0, 0, 0).range(2, packed=True)
+        matches = pattern.find(region)
+        assert len(matches) == 7
+        assert all(match.hexes.kind is Cube for match in matches)
+
+    def test_find_hexmap(self):
+        region = HexMap(Axial(0, 0), 3, 1, typecode="b", fill=1)
+        matches = Pattern([Axial(0, 0), Axial(1, 0)]).find(region)
+        found = {frozenset(match.hexes) for match in matches}
+        assert found == {frozenset({Axial(0, 0), Axial(1, 0)}), frozenset({Axial(1, 0), Axial(2, 0)})}
+        assert all(isinstance(match.hexes, HexSet) for match in matches)
+
+    def test_find_none(self):
+        matches = Pattern(Axial(0, 0).range(1)).find(Axial(0, 0).ring(1))
+        assert matches == []
@@ -0,0 +1,144 @@
+import random
+
+import pytest
+
+from hexpex.hex import Axial, Cube
+from hexpex.persistent import PersistentHexMap, TransientHexMap, _Node
+
+
+@pytest.fixture
+def hexes():
+    return list(Axial(0, 0).range(12))
+
+
+class TestPersistentHexMap:
+    def test_init(self):
+        hexmap = PersistentHexMap({Axial(0, 0): "a", Axial(1, -1): "b"})
+        assert dict(hexmap) == {Axial(0, 0): "a", Axial(1, -1): "b"}
+        assert PersistentHexMap([(Cube(0, 0, 0), 1)]).kind is Cube
+        assert PersistentHexMap().kind is Axial
+        assert len(PersistentHexMap(kind=Cube)) == 0
+
+    def test_matches_dict(self, hexes):
+        rng = random.Random(29)
+        hexmap = PersistentHexMap()
+        expected = {}
+        for _ in range(3000):
+            hex = rng.choice(hexes)
+            if hex in expected and rng.random() < 0.4:
+                hexmap = hexmap.delete(hex)
+                del expected[hex]
+            else:
+                value = rng.randrange(10)
+                hexmap = hexmap.set(hex, value)
+                expected[hex] = value
+            assert len(hexmap) == len(expected)
+        assert dict(hexmap) == expected
+        assert hexmap == expected
+
+    def test_versions(self, hexes):
+        versions = [PersistentHexMap()]
+        for index, hex in enumerate(hexes):
+            versions.append(versions[-1].set(hex, index))
+        for size, version in enumerate(versions):
+            assert dict(version) == {hex: index for index, hex in enumerate(hexes[:size])}
+
+    def test_sharing(self, hexes):
+        hexmap = PersistentHexMap((hex, 0) for hex in hexes)
+        changed = hexmap.set(hexes[0], 1)
+        shared = [entry for entry in changed._root.entries if any(entry is other for other in hexmap._root.entries)]
+        assert len(shared) == len(hexmap._root.entries) - 1
+        assert hexmap[hexes[0]] == 0 and changed[hexes[0]] == 1
+
+    def test_set_same_value(self):
+        value = object()
+        hexmap = PersistentHexMap({Axial(0, 0): value})
+        assert hexmap.set(Axial(0, 0), value) is hexmap
+
+    def test_shallow(self):
+        def depth(node):
+            return 1 + max((depth(entry) for entry in node.entries if isinstance(entry, _Node)), default=0)
+
+        # The packed keys of a dense block share most of their bits, which the hash spreads over the trie.
+        hexmap = PersistentHexMap((Axial(q, r), 0) for q in range(100) for r in range(100))
+        assert depth(hexmap._root) <= 6
+
+    def test_collisions(self):
+        # Keys are hashed from their lowest 64 bits, which are equal for these hex positions. The hash of
+        # 'Axial(1024, 0)' has its lowest ten bits in common with theirs.
+        colliding = [Axial(0, 0), Axial(1 << 32, 0), Axial(2 << 32, 0)]
+        hexmap = PersistentHexMap()
+        for index, hex in enumerate(colliding):
+            hexmap = hexmap.set(hex, index)
+        hexmap = hexmap.set(Axial(1 << 32, 0), 10).set(Axial(1024, 0), 11)
+        assert dict(hexmap) == {Axial(0, 0): 0, Axial(1 << 32, 0): 10, Axial(2 << 32, 0): 2, Axial(1024, 0): 11}
+        assert Axial(3 << 32, 0) not in hexmap
+        for hex in (Axial(1 << 32, 0), Axial(0, 0), Axial(1024, 0)):
+            hexmap = hexmap.delete(hex)
+        assert dict(hexmap) == {Axial(2 << 32, 0): 2}
+        with pytest.raises(KeyError):
+            hexmap.delete(Axial(0, 0))
+
+    def test_delete_all(self, hexes):
+        hexmap = PersistentHexMap((hex, 0) for hex in hexes)
+        for hex in hexes:
+            hexmap = hexmap.delete(hex)
+        assert len(hexmap) == 0 and list(hexmap) == []
+        assert hexmap.set(Axial(0, 0), 1)[Axial(0, 0)] == 1
+
+    def test_contains(self):
+        hexmap = PersistentHexMap({Axial(0, 0): None})
+        assert Axial(0, 0) in hexmap
+        assert hexmap[Axial(0, 0)] is None
+        assert Axial(0, 1) not in hexmap
+        assert Cube(0, 0, 0) not in hexmap
+        with pytest.raises(KeyError):
+            _ = hexmap[Cube(0, 0, 0)]
+
+    def test_repr(self):
+        assert repr(PersistentHexMap({Axial(0, 0): 1})) == "PersistentHexMap({Axial(0, 0): 1})"
+
+    def test_raises(self):
+        with pytest.raises(TypeError, match="map of kind 'Axial' can not hold 'Cube'"):
+            PersistentHexMap({Axial(0, 0): 1}).set(Cube(0, 0, 0), 1)
+        with pytest.raises(KeyError):
+            PersistentHexMap().delete(Axial(0, 0))
+
+
+class TestTransientHexMap:
+    def test_batch(self, hexes):
+        hexmap = PersistentHexMap({hexes[0]: "old"})
+        transient = hexmap.transient()
+        assert isinstance(transient, TransientHexMap)
+        for hex in hexes:
+            transient[hex] = "new"
+        del transient[hexes[1]]
+        result = transient.persistent()
+        assert dict(hexmap) == {hexes[0]: "old"}
+        assert len(result) == len(hexes) - 1 and result[hexes[0]] == "new"
+        assert hexes[1] not in result
+
+    def test_in_place(self, hexes):
+        transient = PersistentHexMap().transient()
+        transient[hexes[0]] = 0
+        root = transient._root
+        for hex in hexes[1:]:
+            transient[hex] = 0
+        assert transient._root is root
+
+    def test_after_persistent(self, hexes):
+        transient = PersistentHexMap((hex, 0) for hex in hexes).transient()
+        transient[hexes[0]] = 1
+        first = transient.persistent()
+        transient[hexes[0]] = 2
+        del transient[hexes[1]]
+        assert first[hexes[0]] == 1 and hexes[1] in first
+        assert transient.persistent()[hexes[0]] == 2
+
+    def test_delete_all(self, hexes):
+        transient = PersistentHexMap((hex, 0) for hex in hexes).transient()
+        for hex in hexes:
+            del transient[hex]
+        assert len(transient) == 0
+        with pytest.raises(KeyError):
+            del transient[hexes[0]]
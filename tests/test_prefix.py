@@ -0,0 +1,77 @@
+import random
+
+import pytest
+
+from hexpex.hex import Axial, Cube
+from hexpex.hexmap import HexMap
+from hexpex.prefix import FenwickSum, PrefixSum
+
+
+@pytest.fixture
+def hexmap():
+    rng = random.Random(7)
+    hexmap = HexMap(Axial(-3, 2), 9, 6, typecode="q")
+    for index in range(len(hexmap.data)):
+        hexmap.data[index] = rng.randrange(-50, 50)
+    return hexmap
+
+
+def range_sum(hexmap, center, distance):
+    return sum(hexmap[hex] for hex in center.range(distance) if hex in hexmap)
+
+
+def parallelogram_sum(hexmap, corner, width, height):
+    hexes = (Axial(corner.q + q, corner.r + r) for q in range(width) for r in range(height))
+    return sum(hexmap[hex] for hex in hexes if hex in hexmap)
+
+
+@pytest.mark.parametrize("kind", [PrefixSum, FenwickSum])
+class TestSums:
+    def test_range_sum(self, hexmap, kind):
+        sums = kind(hexmap)
+        for center in Axial(1, 5).range(8):
+            for distance in range(6):
+                assert sums.range_sum(center, distance) == range_sum(hexmap, center, distance)
+
+    def test_range_sum_covers_map(self, hexmap, kind):
+        assert kind(hexmap).range_sum(Axial(1, 5), 20) == sum(hexmap.data)
+
+    def test_range_sum_negative(self, hexmap, kind):
+        assert kind(hexmap).range_sum(Axial(1, 5), -1) == 0
+
+    def test_parallelogram_sum(self, hexmap, kind):
+        sums = kind(hexmap)
+        for corner in Axial(1, 5).range(6):
+            for width, height in [(1, 1), (3, 2), (4, 7), (12, 12), (0, 3)]:
+                assert sums.parallelogram_sum(corner, width, height) == parallelogram_sum(hexmap, corner, width, height)
+
+    def test_cube(self, kind):
+        hexmap = HexMap(Cube(0, 0, 0), 4, 4, fill=1.5)
+        assert kind(hexmap).range_sum(Cube(1, 1, -2), 1) == 10.5
+
+
+class TestPrefixSum:
+    def test_snapshot(self, hexmap):
+        sums = PrefixSum(hexmap)
+        total = sums.range_sum(Axial(0, 0), 30)
+        hexmap[Axial(0, 3)] += 100
+        assert sums.range_sum(Axial(0, 0), 30) == total
+
+
+class TestFenwickSum:
+    def test_updates(self, hexmap):
+        sums = FenwickSum(hexmap)
+        rng = random.Random(11)
+        hexes = list(hexmap)
+        for _ in range(30):
+            hex = rng.choice(hexes)
+            if rng.random() < 0.5:
+                sums[hex] = rng.randrange(-50, 50)
+            else:
+                sums.add(hex, rng.randrange(-5, 5))
+            center, distance = rng.choice(hexes), rng.randrange(5)
+            assert sums.range_sum(center, distance) == range_sum(hexmap, center, distance)
+
+    def test_add_raises(self, hexmap):
+        with pytest.raises(KeyError):
+            FenwickSum(hexmap).add(Axial(100, 100), 1)
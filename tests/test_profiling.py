@@ -0,0 +1,136 @@
+import threading
+
+import pytest
+
+from hexpex import profiling
+from hexpex.hex import Axial, Cube
+from hexpex.hex import CubeFlatAdjacentDirection as CubeAdjacentDirection
+from hexpex.hex import _Hex
+from hexpex.hexset import HexSet
+
+
+class TestProfile:
+    def test_counts_calls(self):
+        with profiling.profile() as profile:
+            center = Axial(0, 0)
+            center.ring(1)
+            center.ring(2)
+            center.distance(Axial(1, 0))
+        assert profile.stats["Axial.ring"].calls == 2
+        assert profile.stats["Axial.distance"].calls == 1
+        assert "Axial.range" not in profile.stats
+
+    def test_counts_instances(self):
+        with profiling.profile() as profile:
+            Axial(0, 0).ring(1)
+            Cube(0, 0, 0).to_axial()
+        expected_axial = 1 + 6 + 1
+        expected_cube = 1
+        assert profile.instances["Axial"] == expected_axial
+        assert profile.instances["Cube"] == expected_cube
+
+    def test_counts_instances_in_threads(self):
+        def create():
+            for q in range(2000):
+                Axial(q, 0)
+
+        with profiling.profile() as profile:
+            threads = [threading.Thread(target=create) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert profile.instances["Axial"] == 4 * 2000
+
+    def test_self_time(self):
+        with profiling.profile() as profile:
+            HexSet([Cube(0, 0, 0)]).add(Cube(0, 0, 0).adjacent(CubeAdjacentDirection.SE))
+        stats = profile.stats["Cube.adjacent"]
+        assert stats.total_ns >= stats.self_ns >= 0
+        assert profile.stats["HexSet.add"].calls == 1
+
+    def test_nested_stacks(self):
+        with profiling.profile() as profile:
+            list(Cube(0, 0, 0).spiral(1, CubeAdjacentDirection.SE))
+            Cube(0, 0, 0).to_axial()
+        assert ("Cube.spiral", "Cube.adjacent") in profile.stacks
+        assert ("Cube.to_axial",) in profile.stacks
+        spiral = profile.stats["Cube.spiral"]
+        assert spiral.total_ns - spiral.self_ns >= profile.stacks[("Cube.spiral", "Cube.adjacent")]
+
+    def test_generator(self):
+        with profiling.profile() as profile:
+            spiral = list(Cube(0, 0, 0).spiral(1, CubeAdjacentDirection.SE))
+        assert len(spiral) == 7
+        assert profile.stats["Cube.spiral"].calls == 1
+
+    def test_generator_outlives_profile(self):
+        with profiling.profile():
+            spiral = Cube(0, 0, 0).spiral(1, CubeAdjacentDirection.SE)
+            first = next(spiral)
+        rest = list(spiral)
+        assert [first, *rest] == list(Cube(0, 0, 0).spiral(1, CubeAdjacentDirection.SE))
+
+    def test_method_outlives_profile(self):
+        with profiling.profile():
+            distance = Axial(0, 0).distance
+        assert distance(Axial(2, 0)) == 2
+
+    def test_threads_have_own_stacks(self):
+        def hexes():
+            # The thread runs while 'Axial.rotate' is on the call stack of the main thread.
+            thread = threading.Thread(target=Axial(0, 0).ring, args=(1,))
+            thread.start()
+            thread.join()
+            yield Axial(1, 0)
+
+        with profiling.profile() as profile:
+            Axial(0, 0).rotate(hexes(), 60)
+        assert ("Axial.ring",) in profile.stacks
+        assert ("Axial.rotate", "Axial.ring") not in profile.stacks
+        rotate = profile.stats["Axial.rotate"]
+        assert rotate.self_ns == rotate.total_ns
+
+    def test_exception_is_recorded(self):
+        with profiling.profile() as profile:
+            with pytest.raises(ValueError):
+                Axial(0, 0).rotate([Axial(1, 0)], 30)
+        assert profile.stats["Axial.rotate"].calls == 1
+
+    def test_summary(self):
+        with profiling.profile() as profile:
+            Axial(0, 0).range(1)
+        summary = profile.summary()
+        assert summary.splitlines()[0].split() == ["method", "calls", "total", "ms", "self", "ms"]
+        assert "Axial.range" in summary
+        assert "Axial instances" in summary
+
+    def test_folded(self):
+        with profiling.profile() as profile:
+            Axial(0, 0).range(1)
+        stack, elapsed = profile.folded().split(" ")
+        assert stack == "Axial.range"
+        assert int(elapsed) >= 0
+
+    def test_restores_methods(self):
+        ring = _Hex.ring
+        init = Axial.__init__
+        with profiling.profile():
+            assert _Hex.ring is not ring
+        assert _Hex.ring is ring
+        assert Axial.__init__ is init
+
+    def test_enable_twice_raises(self):
+        profiling.enable()
+        try:
+            with pytest.raises(RuntimeError, match="instrumentation is already enabled"):
+                profiling.enable()
+        finally:
+            profiling.disable()
+
+    def test_disable_without_enable(self):
+        assert profiling.disable() is None
+
+    def test_stats_repr(self):
+        stats = profiling.CallStats()
+        assert repr(stats) == "CallStats(calls=0, total_ns=0, self_ns=0)"
@@ -0,0 +1,99 @@
+import asyncio
+import math
+import random
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+import pytest
+
+from hexpex.hex import Axial
+from hexpex.hexmap import HexMap
+from hexpex.path import find_path
+from hexpex.service import PathService
+
+
+@pytest.fixture
+def cost():
+    rng = random.Random(17)
+    cost = HexMap(Axial(0, 0), 10, 10, typecode="d")
+    for index in range(len(cost.data)):
+        cost.data[index] = math.inf if rng.random() < 0.15 else rng.randrange(1, 4)
+    return cost
+
+
+def path_cost(cost, path):
+    return sum(cost[hex] for hex in path[1:])
+
+
+class BrokenExecutor(Executor):
+    def submit(self, fn, /, *args, **kwargs):
+        raise RuntimeError("broken")
+
+
+class TestPathService:
+    def test_matches_find_path(self, cost):
+        for hex in Axial(8, 1).ring(1):
+            cost[hex] = math.inf
+        service = PathService(cost)
+        starts = [*list(cost)[::9], Axial(8, 1)]
+        goal = Axial(5, 5)
+
+        async def main():
+            return await asyncio.gather(*(service.find(start, goal) for start in starts))
+
+        for start, path in zip(starts, asyncio.run(main())):
+            expected = find_path(start, goal, cost)
+            if expected is None:
+                assert path is None
+            else:
+                assert path[0] == start and path[-1] == goal
+                assert path_cost(cost, path) == path_cost(cost, expected)
+
+    def test_coalesces_goals(self, cost):
+        goals = [Axial(5, 5), Axial(0, 9)]
+
+        async def main():
+            requests = [service.find(Axial(q, 0), goals[q % 2]) for q in range(10)]
+            await asyncio.gather(*requests)
+            await service.find(Axial(9, 9), goals[0])
+
+        with ThreadPoolExecutor(2) as executor:
+            service = PathService(cost, executor=executor)
+            asyncio.run(main())
+        assert (service.stats.requests, service.stats.searches) == (11, 3)
+        assert 0 < service.stats.mean_ns <= service.stats.max_ns
+
+    def test_delay(self, cost):
+        service = PathService(cost, delay=0.01)
+
+        async def main():
+            first = asyncio.ensure_future(service.find(Axial(0, 0), Axial(5, 5)))
+            await asyncio.sleep(0)
+            second = await service.find(Axial(1, 0), Axial(5, 5))
+            return await first, second
+
+        asyncio.run(main())
+        assert service.stats.searches == 1
+
+    def test_same_start_and_goal(self, cost):
+        service = PathService(cost)
+        assert asyncio.run(service.find(Axial(5, 5), Axial(5, 5))) == [Axial(5, 5)]
+
+    def test_unreachable(self):
+        cost = HexMap(Axial(0, 0), 3, 1, fill=1)
+        cost[Axial(1, 0)] = math.inf
+        service = PathService(cost)
+        assert asyncio.run(service.find(Axial(0, 0), Axial(2, 0))) is None
+
+    def test_stats_empty(self, cost):
+        stats = PathService(cost).stats
+        assert stats.mean_ns == 0.0
+        assert repr(stats) == "ServiceStats(requests=0, searches=0, total_ns=0, max_ns=0)"
+
+    def test_raises(self, cost):
+        with pytest.raises(KeyError):
+            asyncio.run(PathService(cost).find(Axial(0, 0), Axial(20, 20)))
+
+    def test_executor_error(self, cost):
+        service = PathService(cost, executor=BrokenExecutor())
+        with pytest.raises(RuntimeError, match="broken"):
+            asyncio.run(service.find(Axial(0, 0), Axial(5, 5)))
@@ -0,0 +1,151 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from hexpex import hierarchy
+from hexpex import shard as sharding
+from hexpex.automaton import Automaton, life_rule
+from hexpex.hex import Axial, Cube
+from hexpex.hexmap import HexMap
+from hexpex.hexset import HexSet
+from hexpex.shard import ShardedAutomaton, halo, partition
+
+
+def fire(value, neighbors):
+    # Fuel '0' catches fire next to a burning cell '1', which burns out to '2'.
+    if value == 1:
+        return 2
+    if value == 0 and 1 in neighbors:
+        return 1
+    return value
+
+
+@pytest.fixture
+def state():
+    rng = random.Random(23)
+    state = HexMap(Axial(-4, 2), 16, 13, typecode="b")
+    for index in range(len(state.data)):
+        state.data[index] = rng.random() < 0.4
+    return state
+
+
+class TestPartition:
+    @pytest.mark.parametrize("tiling", ["stripes", "superhexes"])
+    def test_covers_map(self, state, tiling):
+        shards = partition(state, 4, tiling, radius=2)
+        assert 1 < len(shards) <= 4
+        assert sum(len(shard) for shard in shards) == len(state)
+        assert set().union(*shards) == set(state)
+
+    def test_stripes(self, state):
+        shards = partition(state, 3)
+        assert [len(shard) for shard in shards] == [16 * 4, 16 * 4, 16 * 5]
+        assert {hex.r for hex in shards[0]} == {2, 3, 4, 5}
+
+    def test_superhexes(self, state):
+        for shard in partition(state, 3, "superhexes", radius=2):
+            parents = {hierarchy.parent(hex, 2) for hex in shard}
+            for other in partition(state, 3, "superhexes", radius=2):
+                if other != shard:
+                    assert not parents & {hierarchy.parent(hex, 2) for hex in other}
+
+    def test_more_shards_than_rows(self):
+        assert len(partition(HexMap(Axial(0, 0), 3, 2), 5)) == 2
+
+    def test_raises(self, state):
+        with pytest.raises(ValueError, match="argument 'shards' must be at least 1, not 0"):
+            partition(state, 0)
+        with pytest.raises(ValueError, match="argument 'tiling' must be one of stripes, superhexes, not 'squares'"):
+            partition(state, 2, "squares")
+
+
+class TestHalo:
+    def test_halo(self):
+        hexmap = HexMap(Cube(0, 0, 0), 4, 4)
+        region = HexSet([Cube(0, 0, 0)])
+        assert halo(region, hexmap) == {Cube(1, 0, -1), Cube(0, 1, -1)}
+
+
+class TestShardedAutomaton:
+    @pytest.mark.parametrize("tiling", ["stripes", "superhexes"])
+    def test_matches_automaton(self, state, tiling):
+        rule = life_rule(birth={2}, survive={3, 4})
+        serial = Automaton(state, rule)
+        with ThreadPoolExecutor(3) as executor:
+            with ShardedAutomaton(state, rule, shards=3, tiling=tiling, radius=2, executor=executor) as sharded:
+                for _ in range(6):
+                    assert sharded.step() == serial.step()
+                    assert dict(sharded.state) == dict(serial.state)
+                assert sharded.generation == 6
+
+    def test_processes(self, state):
+        rule = life_rule(birth={2}, survive={3, 4})
+        serial = Automaton(state, rule)
+        serial.step(4)
+        with ShardedAutomaton(state, rule, shards=2) as sharded:
+            sharded.step(4)
+            assert dict(sharded.state) == dict(serial.state)
+
+    def test_set_cell_on_border(self):
+        state = HexMap(Axial(0, 0), 6, 6, typecode="b")
+        serial = Automaton(state, fire)
+        with ThreadPoolExecutor(2) as executor, ShardedAutomaton(state, fire, shards=2, executor=executor) as sharded:
+            # Row 2 is the last row of the first shard and in the halo of the second.
+            for automaton in (serial, sharded):
+                automaton[Axial(3, 2)] = 1
+                automaton.step(3)
+            assert dict(sharded.state) == dict(serial.state)
+            assert sharded[Axial(3, 3)] == 2
+
+    def test_state_not_changed(self, state):
+        data = bytes(state.data)
+        with ThreadPoolExecutor(2) as executor, ShardedAutomaton(state, fire, shards=2, executor=executor) as sharded:
+            sharded.step()
+        assert bytes(state.data) == data
+
+    def test_empty_map(self):
+        with ShardedAutomaton(HexMap(Axial(0, 0), 0, 0, typecode="b"), fire) as sharded:
+            assert sharded.step() == 0
+            assert len(sharded.state) == 0
+
+    def test_failing_rule(self, state):
+        def failing(value, neighbors):
+            raise RuntimeError("failing")
+
+        with ThreadPoolExecutor(2) as executor:
+            sharded = ShardedAutomaton(state, failing, shards=2, executor=executor)
+            with pytest.raises(RuntimeError, match="failing"):
+                sharded.step()
+            sharded.close()
+
+    def test_closed(self, state):
+        with ThreadPoolExecutor(2) as executor, ShardedAutomaton(state, fire, shards=2, executor=executor) as sharded:
+            pass
+        for access in (lambda: sharded.state, lambda: sharded[Axial(0, 5)], sharded.step):
+            with pytest.raises(ValueError, match="automaton is closed"):
+                access()
+        with pytest.raises(ValueError, match="automaton is closed"):
+            sharded[Axial(0, 5)] = 1
+
+    def test_gatherers_cached(self, state):
+        with ThreadPoolExecutor(2) as executor, ShardedAutomaton(state, fire, shards=2, executor=executor) as sharded:
+            sharded.step()
+            names = [block.name for block in sharded._blocks]
+            gatherers = [sharding._gatherers[name] for name in names]
+            sharded.step()
+            assert [sharding._gatherers[name] for name in names] == gatherers
+        assert not set(names) & set(sharding._gatherers)
+
+    def test_gatherers_evicted(self, state, monkeypatch):
+        monkeypatch.setattr(sharding, "_GATHERERS_SIZE", 1)
+        serial = Automaton(state, fire)
+        with ThreadPoolExecutor(1) as executor, ShardedAutomaton(state, fire, shards=2, executor=executor) as sharded:
+            for _ in range(3):
+                assert sharded.step() == serial.step()
+                assert len(sharding._gatherers) == 1
+            assert dict(sharded.state) == dict(serial.state)
+
+    def test_raises(self):
+        with pytest.raises(ValueError, match="map must have a typecode to be sharded"):
+            ShardedAutomaton(HexMap(Axial(0, 0), 2, 2), fire)
@@ -0,0 +1,79 @@
+import random
+from array import array
+
+import pytest
+
+from hexpex import spiral
+from hexpex.hex import Axial
+from hexpex.hex import AxialFlatAdjacentDirection as AxialAdjacentDirection
+from hexpex.hex import Cube
+from hexpex.hex import CubeFlatAdjacentDirection as CubeAdjacentDirection
+from hexpex.hex import Move
+
+DIRECTIONS = list(AxialAdjacentDirection)
+MOVES = list(Move)
+
+
+class TestSpiralIndex:
+    @pytest.mark.parametrize("direction", DIRECTIONS)
+    @pytest.mark.parametrize("move", MOVES)
+    def test_matches_spiral(self, direction, move):
+        center = Axial(2, -1)
+        for index, hex in enumerate(center.spiral(4, direction, move)):
+            assert spiral.spiral_index(center, hex, direction, move) == index
+            assert spiral.spiral_at(center, index, direction, move) == hex
+
+    def test_cube(self):
+        center = Cube(0, 0, 0)
+        direction = CubeAdjacentDirection.SE
+        expected = list(center.spiral(2, direction))
+        assert [spiral.spiral_at(center, index, direction) for index in range(len(expected))] == expected
+
+    def test_large_index(self):
+        center = Axial(0, 0)
+        direction = AxialAdjacentDirection.N
+        index = 10**15 + 12345
+        hex = spiral.spiral_at(center, index, direction)
+        assert spiral.spiral_index(center, hex, direction) == index
+
+    def test_negative_index_raises(self):
+        with pytest.raises(ValueError, match="argument 'index' must not be negative, not -1"):
+            spiral.spiral_at(Axial(0, 0), -1, AxialAdjacentDirection.N)
+
+    def test_size(self):
+        assert [spiral.size(distance) for distance in range(4)] == [1, 7, 19, 37]
+
+
+class TestSpiralColumns:
+    def test_spiral_indices(self):
+        center = Axial(1, 1)
+        direction = AxialAdjacentDirection.SW
+        hexes = list(center.spiral(3, direction))
+        q = array("q", [hex.q for hex in hexes])
+        r = array("q", [hex.r for hex in hexes])
+        assert list(spiral.spiral_indices(center, q, r, direction)) == list(range(len(hexes)))
+
+    def test_spiral_positions(self):
+        center = Axial(1, 1)
+        direction = AxialAdjacentDirection.SW
+        hexes = list(center.spiral(3, direction, Move.COUNTERCLOCKWISE))
+        indices = array("q", range(len(hexes)))
+        q, r = spiral.spiral_positions(center, indices, direction, Move.COUNTERCLOCKWISE)
+        assert [Axial(*coordinates) for coordinates in zip(q, r)] == hexes
+
+
+class TestSample:
+    def test_in_range(self):
+        center = Cube(3, -1, -2)
+        hexes = spiral.sample(center, 5, k=50, rng=random.Random(1))
+        assert len(set(hexes)) == 50
+        assert all(center.distance(hex) <= 5 for hex in hexes)
+
+    def test_whole_range(self):
+        center = Axial(0, 0)
+        hexes = spiral.sample(center, 2, k=19)
+        assert set(hexes) == center.range(2)
+
+    def test_huge_range(self):
+        (hex,) = spiral.sample(Axial(0, 0), 10**9)
+        assert Axial(0, 0).distance(hex) <= 10**9
@@ -0,0 +1,78 @@
+import pytest
+
+from hexpex.hex import Axial, Cube
+from hexpex.hexmap import HexMap
+from hexpex.voronoi import UNASSIGNED, voronoi
+
+
+def brute_force(seeds, region):
+    labels = {}
+    for hex in region:
+        distances = [hex.distance(seed) for seed in seeds]
+        labels[hex] = distances.index(min(distances))
+    return labels
+
+
+class TestVoronoi:
+    def test_matches_nearest_seed(self):
+        region = Axial(0, 0).range(6)
+        seeds = [Axial(-3, 0), Axial(3, -1), Axial(0, 3), Axial(1, -4)]
+        labels, counts = voronoi(seeds, region)
+        expected = brute_force(seeds, region)
+        assert {hex: labels[hex] for hex in region} == expected
+        assert counts == [list(expected.values()).count(label) for label in range(len(seeds))]
+
+    def test_outside_region_unassigned(self):
+        region = Cube(0, 0, 0).range(2)
+        labels, counts = voronoi([Cube(0, 0, 0)], region)
+        assert sum(counts) == len(region)
+        assert all(labels[hex] == UNASSIGNED for hex in labels if hex not in region)
+
+    def test_tie_breaking(self):
+        region = [Axial(0, 0), Axial(1, 0), Axial(2, 0)]
+        labels, counts = voronoi([Axial(2, 0), Axial(0, 0)], region)
+        assert labels[Axial(1, 0)] == 0
+        labels, counts = voronoi([Axial(0, 0), Axial(2, 0)], region)
+        assert labels[Axial(1, 0)] == 0
+        assert counts == [2, 1]
+
+    def test_walls(self):
+        region = HexMap(Axial(0, 0), 5, 1, typecode="b", fill=1)
+        region[Axial(2, 0)] = 0
+        labels, counts = voronoi([Axial(0, 0)], region)
+        assert counts == [2]
+        assert labels[Axial(4, 0)] == UNASSIGNED
+
+    def test_seed_outside_region(self):
+        region = HexMap(Axial(0, 0), 3, 1, typecode="b", fill=1)
+        region[Axial(2, 0)] = 0
+        labels, counts = voronoi([Axial(5, 5), Axial(2, 0), Axial(0, 0)], region)
+        assert counts == [0, 0, 2]
+
+    def test_duplicate_seeds(self):
+        region = Axial(0, 0).range(1)
+        labels, counts = voronoi([Axial(0, 0), Axial(0, 0)], region, weights=[1, 0])
+        assert counts == [0, 7]
+
+    @pytest.mark.parametrize(("seeds", "kind"), [([Cube(0, 0, 0)], Cube), ([], Axial)])
+    def test_empty_region(self, seeds, kind):
+        labels, counts = voronoi(seeds, [])
+        assert len(labels) == 0
+        assert labels.kind is kind
+        assert counts == [0] * len(seeds)
+
+    def test_weights(self):
+        region = [Axial(q, 0) for q in range(7)]
+        labels, counts = voronoi([Axial(0, 0), Axial(6, 0)], region, weights=[0, 2])
+        assert counts == [5, 2]
+
+    @pytest.mark.parametrize(
+        ("weights", "match"),
+        [
+            ([0], "argument 'weights' must have 2 values, not 1"),
+            ([0, -1], "argument 'weights' must not have negative values"),
+        ],
+    )
+    def test_weights_raises(self, weights, match):
+        with pytest.raises(ValueError, match=match):
+            voronoi([Axial(0, 0), Axial(1, 0)], [Axial(0, 0)], weights=weights)